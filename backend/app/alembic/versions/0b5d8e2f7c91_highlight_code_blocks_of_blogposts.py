@@ -0,0 +1,50 @@
+"""Highlight the code blocks of the rendered BlogPost content
+
+Revision ID: 0b5d8e2f7c91
+Revises: f19b7c3e4a58
+Create Date: 2026-10-17 16:48:03.115920
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from app.core.markdown import get_rendered_content
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0b5d8e2f7c91'
+down_revision: Union[str, None] = 'f19b7c3e4a58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Render the content of the existing blog posts again, now with highlighted code blocks.
+    # Like the backfill of f19b7c3e4a58, this uses the current renderer of the application
+    # on purpose, the rendered columns are only a cache of `content` and safe to re-render.
+    blogpost = sa.table(
+        'blogpost',
+        sa.column('id', sa.Integer()),
+        sa.column('content', sa.String()),
+        sa.column('content_html', sa.String()),
+        sa.column('toc', postgresql.JSONB()),
+        sa.column('content_hash', sa.String()),
+    )
+    connection = op.get_bind()
+    for blog_post_id, content in connection.execute(sa.select(blogpost.c.id, blogpost.c.content)).all():
+        connection.execute(
+            blogpost.update().where(blogpost.c.id == blog_post_id).values(**get_rendered_content(content))
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # The schema is unchanged, and the rendered columns are a cache of `content` that the
+    # previous revision reads as it is: the highlighted HTML is still valid, only with extra
+    # <span> elements for the highlighting. Rendering it without highlighting would need the
+    # renderer of the previous revision, which is not kept, so the content is left as it is.
+    pass
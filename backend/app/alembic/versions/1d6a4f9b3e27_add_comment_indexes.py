@@ -0,0 +1,32 @@
+"""Add Comment indexes
+
+Revision ID: 1d6a4f9b3e27
+Revises: 0b5d8e2f7c91
+Create Date: 2026-10-17 18:57:26.402817
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1d6a4f9b3e27'
+down_revision: Union[str, None] = '0b5d8e2f7c91'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_comment_blog_post_id_reply_to_comment_date', 'comment', ['blog_post_id', 'reply_to', sa.text('comment_date DESC')], unique=False)
+    op.create_index('ix_comment_reply_to_comment_date', 'comment', ['reply_to', 'comment_date'], unique=False)
+    op.create_index('ix_comment_user_id', 'comment', ['user_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_comment_user_id', table_name='comment')
+    op.drop_index('ix_comment_reply_to_comment_date', table_name='comment')
+    op.drop_index('ix_comment_blog_post_id_reply_to_comment_date', table_name='comment')
@@ -0,0 +1,46 @@
+"""Add comment counters to BlogPost
+
+Revision ID: 2e8c5b7a4d13
+Revises: 1d6a4f9b3e27
+Create Date: 2026-10-17 19:42:08.513906
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2e8c5b7a4d13'
+down_revision: Union[str, None] = '1d6a4f9b3e27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('blogpost', sa.Column('comment_count', sa.Integer(), nullable=False, server_default='0'))
+    op.add_column('blogpost', sa.Column('last_comment_at', sa.DateTime(), nullable=True))
+
+    # Backfill the counters of the existing blog posts
+    op.execute(
+        """
+        UPDATE blogpost
+        SET comment_count = counters.comment_count, last_comment_at = counters.last_comment_at
+        FROM (
+            SELECT blog_post_id, count(*) AS comment_count, max(comment_date) AS last_comment_at
+            FROM comment
+            GROUP BY blog_post_id
+        ) AS counters
+        WHERE blogpost.id = counters.blog_post_id
+        """
+    )
+
+    op.alter_column('blogpost', 'comment_count', server_default=None)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('blogpost', 'last_comment_at')
+    op.drop_column('blogpost', 'comment_count')
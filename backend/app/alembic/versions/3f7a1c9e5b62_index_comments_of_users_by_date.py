@@ -0,0 +1,30 @@
+"""Index the comments of users by date
+
+Revision ID: 3f7a1c9e5b62
+Revises: 2e8c5b7a4d13
+Create Date: 2026-10-17 20:26:51.038472
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f7a1c9e5b62'
+down_revision: Union[str, None] = '2e8c5b7a4d13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_comment_user_id_comment_date', 'comment', ['user_id', sa.text('comment_date DESC')], unique=False)
+    op.drop_index('ix_comment_user_id', table_name='comment')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index('ix_comment_user_id', 'comment', ['user_id'], unique=False)
+    op.drop_index('ix_comment_user_id_comment_date', table_name='comment')
@@ -0,0 +1,30 @@
+"""Add tag lookup indexes
+
+Revision ID: 4a9d2e6f8b10
+Revises: 3f7a1c9e5b62
+Create Date: 2026-10-17 21:42:13.518204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4a9d2e6f8b10'
+down_revision: Union[str, None] = '3f7a1c9e5b62'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_tag_lower_name', 'tag', [sa.text('lower(name)')], unique=False)
+    op.create_index('ix_blogposttaglink_tag_id_blog_post_id', 'blogposttaglink', ['tag_id', 'blog_post_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_blogposttaglink_tag_id_blog_post_id', table_name='blogposttaglink')
+    op.drop_index('ix_tag_lower_name', table_name='tag')
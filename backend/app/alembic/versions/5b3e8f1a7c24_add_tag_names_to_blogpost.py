@@ -0,0 +1,48 @@
+"""Add tag names to blogpost
+
+Revision ID: 5b3e8f1a7c24
+Revises: 4a9d2e6f8b10
+Create Date: 2026-10-17 22:18:36.904127
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b3e8f1a7c24'
+down_revision: Union[str, None] = '4a9d2e6f8b10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('blogpost', sa.Column('tag_names', postgresql.ARRAY(sa.Text()), nullable=False, server_default='{}'))
+
+    # Backfill the tag names of the existing blog posts
+    op.execute(
+        """
+        UPDATE blogpost
+        SET tag_names = tags.tag_names
+        FROM (
+            SELECT blogposttaglink.blog_post_id, array_agg(tag.name ORDER BY tag.name) AS tag_names
+            FROM blogposttaglink
+            JOIN tag ON tag.id = blogposttaglink.tag_id
+            GROUP BY blogposttaglink.blog_post_id
+        ) AS tags
+        WHERE blogpost.id = tags.blog_post_id
+        """
+    )
+
+    op.alter_column('blogpost', 'tag_names', server_default=None)
+    op.create_index('ix_blogpost_tag_names', 'blogpost', ['tag_names'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_blogpost_tag_names', table_name='blogpost', postgresql_using='gin')
+    op.drop_column('blogpost', 'tag_names')
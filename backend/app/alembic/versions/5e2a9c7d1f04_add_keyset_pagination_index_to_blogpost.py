@@ -0,0 +1,28 @@
+"""Add keyset pagination index to BlogPost
+
+Revision ID: 5e2a9c7d1f04
+Revises: 0696179258eb
+Create Date: 2026-10-17 09:12:41.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e2a9c7d1f04'
+down_revision: Union[str, None] = '0696179258eb'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_blogpost_publication_date_id', 'blogpost', ['publication_date', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_blogpost_publication_date_id', table_name='blogpost')
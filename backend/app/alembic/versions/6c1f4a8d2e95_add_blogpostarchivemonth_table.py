@@ -0,0 +1,43 @@
+"""Add blogpostarchivemonth table
+
+Revision ID: 6c1f4a8d2e95
+Revises: 5b3e8f1a7c24
+Create Date: 2026-10-17 23:05:47.219836
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6c1f4a8d2e95'
+down_revision: Union[str, None] = '5b3e8f1a7c24'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('blogpostarchivemonth',
+    sa.Column('year', sa.Integer(), nullable=False),
+    sa.Column('month', sa.Integer(), nullable=False),
+    sa.Column('blog_post_count', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('year', 'month')
+    )
+
+    # Backfill the monthly rollups of the existing blog posts
+    op.execute(
+        """
+        INSERT INTO blogpostarchivemonth (year, month, blog_post_count)
+        SELECT extract(year FROM publication_date)::integer, extract(month FROM publication_date)::integer, count(*)
+        FROM blogpost
+        GROUP BY 1, 2
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('blogpostarchivemonth')
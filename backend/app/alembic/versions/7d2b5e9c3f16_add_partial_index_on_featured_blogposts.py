@@ -0,0 +1,28 @@
+"""Add partial index on featured blogposts
+
+Revision ID: 7d2b5e9c3f16
+Revises: 6c1f4a8d2e95
+Create Date: 2026-10-17 23:41:09.562318
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7d2b5e9c3f16'
+down_revision: Union[str, None] = '6c1f4a8d2e95'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_blogpost_featured_publication_date_id', 'blogpost', ['publication_date', 'id'], unique=False, postgresql_where=sa.text('featured IS true'))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_blogpost_featured_publication_date_id', table_name='blogpost', postgresql_where=sa.text('featured IS true'))
@@ -0,0 +1,45 @@
+"""Add reply count to Comment
+
+Revision ID: 8e4a1f6c2b37
+Revises: 7d2b5e9c3f16
+Create Date: 2026-10-18 09:12:44.201736
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8e4a1f6c2b37'
+down_revision: Union[str, None] = '7d2b5e9c3f16'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('comment', sa.Column('reply_count', sa.Integer(), nullable=False, server_default='0'))
+
+    # Backfill the counters of the existing comments
+    op.execute(
+        """
+        UPDATE comment
+        SET reply_count = counters.reply_count
+        FROM (
+            SELECT reply_to, count(*) AS reply_count
+            FROM comment
+            WHERE reply_to IS NOT NULL
+            GROUP BY reply_to
+        ) AS counters
+        WHERE comment.id = counters.reply_to
+        """
+    )
+
+    op.alter_column('comment', 'reply_count', server_default=None)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('comment', 'reply_count')
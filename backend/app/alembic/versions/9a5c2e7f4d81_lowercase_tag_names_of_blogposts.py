@@ -0,0 +1,49 @@
+"""Lowercase tag names of blogposts
+
+Revision ID: 9a5c2e7f4d81
+Revises: 8e4a1f6c2b37
+Create Date: 2026-10-18 10:05:37.918254
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a5c2e7f4d81'
+down_revision: Union[str, None] = '8e4a1f6c2b37'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The tag names are matched case-insensitively, so they are kept lowercased
+    op.execute(
+        """
+        UPDATE blogpost
+        SET tag_names = ARRAY(
+            SELECT DISTINCT lower(name) FROM unnest(blogpost.tag_names) AS name ORDER BY 1
+        )
+        WHERE tag_names <> '{}'
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Restore the names of the tags as they are
+    op.execute(
+        """
+        UPDATE blogpost
+        SET tag_names = ARRAY(
+            SELECT tag.name
+            FROM blogposttaglink
+            JOIN tag ON tag.id = blogposttaglink.tag_id
+            WHERE blogposttaglink.blog_post_id = blogpost.id
+            ORDER BY tag.name
+        )
+        """
+    )
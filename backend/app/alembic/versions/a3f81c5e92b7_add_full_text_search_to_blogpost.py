@@ -0,0 +1,44 @@
+"""Add full-text search to BlogPost
+
+Revision ID: a3f81c5e92b7
+Revises: 5e2a9c7d1f04
+Create Date: 2026-10-17 10:03:18.540912
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3f81c5e92b7'
+down_revision: Union[str, None] = '5e2a9c7d1f04'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The generated column is computed for the existing blog posts when it is added
+    op.add_column(
+        'blogpost',
+        sa.Column(
+            'search_vector',
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+                "setweight(to_tsvector('english', coalesce(content, '')), 'B')",
+                persisted=True,
+            ),
+            nullable=True,
+        ),
+    )
+    op.create_index('ix_blogpost_search_vector', 'blogpost', ['search_vector'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_blogpost_search_vector', table_name='blogpost', postgresql_using='gin')
+    op.drop_column('blogpost', 'search_vector')
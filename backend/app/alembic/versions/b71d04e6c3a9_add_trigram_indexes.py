@@ -0,0 +1,34 @@
+"""Add trigram indexes
+
+Revision ID: b71d04e6c3a9
+Revises: a3f81c5e92b7
+Create Date: 2026-10-17 11:26:52.107733
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b71d04e6c3a9'
+down_revision: Union[str, None] = 'a3f81c5e92b7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.create_index('ix_blogpost_title_trgm', 'blogpost', ['title'], unique=False, postgresql_using='gin', postgresql_ops={'title': 'gin_trgm_ops'})
+    op.create_index('ix_user_name_trgm', 'user', ['name'], unique=False, postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'})
+    op.create_index('ix_user_email_trgm', 'user', ['email'], unique=False, postgresql_using='gin', postgresql_ops={'email': 'gin_trgm_ops'})
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_user_email_trgm', table_name='user', postgresql_using='gin', postgresql_ops={'email': 'gin_trgm_ops'})
+    op.drop_index('ix_user_name_trgm', table_name='user', postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'})
+    op.drop_index('ix_blogpost_title_trgm', table_name='blogpost', postgresql_using='gin', postgresql_ops={'title': 'gin_trgm_ops'})
+    op.execute('DROP EXTENSION IF EXISTS pg_trgm')
@@ -0,0 +1,75 @@
+"""Add content summary columns to BlogPost
+
+Revision ID: c4e9a2b8d615
+Revises: b71d04e6c3a9
+Create Date: 2026-10-17 12:41:09.226583
+
+"""
+from math import ceil
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e9a2b8d615'
+down_revision: Union[str, None] = 'b71d04e6c3a9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# A frozen copy of the summary logic of app.core.content at the time of this revision,
+# so that the backfill does not change when the application code does
+EXCERPT_MAX_LENGTH = 500
+WORDS_PER_MINUTE = 200
+
+
+def get_content_summary(content: str) -> dict:
+    """Get the summary columns of a blog post from its markdown content."""
+    paragraphs = [
+        paragraph.strip()
+        for paragraph in content.split('\n\n')
+        if paragraph.strip() and not paragraph.startswith('#')
+    ]
+    excerpt = paragraphs[0] if paragraphs else ''
+    if len(excerpt) > EXCERPT_MAX_LENGTH:
+        excerpt = excerpt[:EXCERPT_MAX_LENGTH].rsplit(maxsplit=1)[0] + '…'
+    word_count = len(content.split())
+    return {
+        'excerpt': excerpt,
+        'word_count': word_count,
+        'reading_time': max(1, ceil(word_count / WORDS_PER_MINUTE)),
+    }
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('blogpost', sa.Column('excerpt', sa.String(), nullable=False, server_default=''))
+    op.add_column('blogpost', sa.Column('word_count', sa.Integer(), nullable=False, server_default='0'))
+    op.add_column('blogpost', sa.Column('reading_time', sa.Integer(), nullable=False, server_default='0'))
+
+    # Backfill the summary of the existing blog posts
+    blogpost = sa.table(
+        'blogpost',
+        sa.column('id', sa.Integer()),
+        sa.column('content', sa.String()),
+        sa.column('excerpt', sa.String()),
+        sa.column('word_count', sa.Integer()),
+        sa.column('reading_time', sa.Integer()),
+    )
+    connection = op.get_bind()
+    for blog_post_id, content in connection.execute(sa.select(blogpost.c.id, blogpost.c.content)).all():
+        connection.execute(
+            blogpost.update().where(blogpost.c.id == blog_post_id).values(**get_content_summary(content))
+        )
+
+    op.alter_column('blogpost', 'excerpt', server_default=None)
+    op.alter_column('blogpost', 'word_count', server_default=None)
+    op.alter_column('blogpost', 'reading_time', server_default=None)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('blogpost', 'reading_time')
+    op.drop_column('blogpost', 'word_count')
+    op.drop_column('blogpost', 'excerpt')
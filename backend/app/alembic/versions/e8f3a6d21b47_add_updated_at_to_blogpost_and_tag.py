@@ -0,0 +1,32 @@
+"""Add updated_at to BlogPost and Tag
+
+Revision ID: e8f3a6d21b47
+Revises: c4e9a2b8d615
+Create Date: 2026-10-17 14:05:52.871305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8f3a6d21b47'
+down_revision: Union[str, None] = 'c4e9a2b8d615'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('blogpost', sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.func.now()))
+    op.add_column('tag', sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.func.now()))
+    op.alter_column('blogpost', 'updated_at', server_default=None)
+    op.alter_column('tag', 'updated_at', server_default=None)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('tag', 'updated_at')
+    op.drop_column('blogpost', 'updated_at')
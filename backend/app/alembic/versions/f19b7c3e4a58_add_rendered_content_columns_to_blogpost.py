@@ -0,0 +1,58 @@
+"""Add rendered content columns to BlogPost
+
+Revision ID: f19b7c3e4a58
+Revises: e8f3a6d21b47
+Create Date: 2026-10-17 15:22:37.604118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from app.core.markdown import get_rendered_content
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f19b7c3e4a58'
+down_revision: Union[str, None] = 'e8f3a6d21b47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('blogpost', sa.Column('content_html', sa.String(), nullable=False, server_default=''))
+    op.add_column('blogpost', sa.Column('toc', postgresql.JSONB(astext_type=sa.Text()), nullable=False, server_default='[]'))
+    op.add_column('blogpost', sa.Column('content_hash', sa.String(length=64), nullable=False, server_default=''))
+
+    # Render the content of the existing blog posts.
+    # This deliberately uses the current renderer of the application instead of a frozen copy:
+    # the rendered columns are only a cache of `content`, which the application renders again
+    # whenever the content changes, so the newest renderer's output is always the right backfill.
+    # Rendering is deterministic, therefore the backfill is safe to re-run.
+    blogpost = sa.table(
+        'blogpost',
+        sa.column('id', sa.Integer()),
+        sa.column('content', sa.String()),
+        sa.column('content_html', sa.String()),
+        sa.column('toc', postgresql.JSONB()),
+        sa.column('content_hash', sa.String()),
+    )
+    connection = op.get_bind()
+    for blog_post_id, content in connection.execute(sa.select(blogpost.c.id, blogpost.c.content)).all():
+        connection.execute(
+            blogpost.update().where(blogpost.c.id == blog_post_id).values(**get_rendered_content(content))
+        )
+
+    op.alter_column('blogpost', 'content_html', server_default=None)
+    op.alter_column('blogpost', 'toc', server_default=None)
+    op.alter_column('blogpost', 'content_hash', server_default=None)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('blogpost', 'content_hash')
+    op.drop_column('blogpost', 'toc')
+    op.drop_column('blogpost', 'content_html')
@@ -1,13 +1,27 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from typing import Literal
 
 from app.api.deps import SessionDep, get_current_active_superuser
+from app.core.conditional import check_not_modified, get_etag
 from app.db.crud import BlogPostCRUD
+from app.db.pagination import CountMode, get_next_cursor
 from app.models.models import BlogPost
 from app.schemas.blog_post import (
+    ArchiveMonth,
+    ArchiveYear,
+    BlogPostArchive,
+    BlogPostFacets,
     BlogPostPublic,
+    BlogPostPublicHtml,
+    BlogPostSummary,
+    BlogPostSummaryWithHeadline,
     BlogPostCreate,
     BlogPostUpdate,
     BlogPostsPublic,
+    TagFacet,
+    TagMatch,
+    YearFacet,
 )
 from app.schemas.message import Message
 from app.schemas.tag import TagPublic
@@ -19,41 +33,152 @@ router = APIRouter(prefix="/blogposts", tags=["blogposts"])
 @router.get("/", response_model=BlogPostsPublic)
 def read_blog_posts(
     session: SessionDep,
+    request: Request,
+    response: Response,
     skip: int = 0,
     limit: int = 100,
     search_by: str | None = None,
     search_value: str | None = None,
     featured_only: bool = False,
-) -> BlogPostsPublic:
+    tags: str | None = None,
+    tag_match: TagMatch = "all",
+    published_from: datetime | None = None,
+    published_to: datetime | None = None,
+    with_facets: bool = False,
+    cursor: str | None = None,
+    include_count: CountMode = "exact",
+) -> BlogPostsPublic | Response:
     """
     Retrieve blog posts with optional filtering.
+    Supports conditional requests with the ETag, the version of the blog posts is checked before reading them.
+    No Last-Modified is sent, the time of the latest change does not advance when blog posts are deleted.
+    The blog posts are returned without their content, with an excerpt instead.
+    Pass the returned `next_cursor` as `cursor` to read the next page; `skip` is ignored in that case.
+    With `search_by=fulltext` the results are ordered by relevance and include highlighted snippets.
+    With `search_by=fuzzy` the titles are matched by trigram similarity, tolerating typos.
+    With `tags` as comma-separated tag names, only the blog posts with all of these tags are returned, or with any of them if `tag_match=any`.
+    With `published_from` and `published_to` only the blog posts published from (inclusive) or until (exclusive) then are returned.
+    All the filters are combined. With `with_facets=true` the response also counts the matching blog posts per tag and per year.
+    With `include_count=estimated` the count is a cheap estimate, with `include_count=none` it is not computed at all.
     """
-    count, blog_posts = BlogPostCRUD(session).read_blog_posts(
+    blog_post_crud = BlogPostCRUD(session)
+    total_count, updated_at = blog_post_crud.read_blog_posts_version()
+    etag = get_etag("blog_posts", total_count, updated_at, request.url.query)
+    if not_modified := check_not_modified(request, response, etag):
+        return not_modified
+
+    tag_names = [name.strip() for name in (tags or "").split(",") if name.strip()]
+    count, blog_posts = blog_post_crud.read_blog_posts(
         skip=skip,
         limit=limit,
         search_by=search_by,
         search_value=search_value,
         featured_only=featured_only,
+        tags=tag_names,
+        tag_match=tag_match,
+        published_from=published_from,
+        published_to=published_to,
+        cursor=cursor,
+        include_count=include_count,
     )
-    # Convert BlogPost models to BlogPostPublic models
-    blog_posts = [
-        BlogPostPublic.model_validate(blog_post, from_attributes=True)
-        for blog_post in blog_posts
-    ]
-    return BlogPostsPublic(data=blog_posts, count=count)
+    if search_by in ("fulltext", "fuzzy") and search_value:
+        # Relevance ordering cannot be continued with a cursor
+        next_cursor = None
+    else:
+        next_cursor = get_next_cursor(blog_posts, limit, "publication_date", "id")
+
+    if search_by == "fulltext" and search_value:
+        headlines = blog_post_crud.read_blog_post_headlines(
+            blog_post_ids=[blog_post.id for blog_post in blog_posts],
+            search_value=search_value,
+        )
+        blog_posts_with_headline = []
+        for blog_post in blog_posts:
+            blog_post_summary = BlogPostSummaryWithHeadline.model_validate(
+                blog_post, from_attributes=True
+            )
+            blog_post_summary.headline = headlines.get(blog_post.id)
+            blog_posts_with_headline.append(blog_post_summary)
+        blog_posts = blog_posts_with_headline
+    else:
+        # Convert BlogPost models to BlogPostSummary models
+        blog_posts = [
+            BlogPostSummary.model_validate(blog_post, from_attributes=True)
+            for blog_post in blog_posts
+        ]
+
+    facets = None
+    if with_facets:
+        facet_counts = blog_post_crud.read_blog_post_facets(
+            search_by=search_by,
+            search_value=search_value,
+            featured_only=featured_only,
+            tags=tag_names,
+            tag_match=tag_match,
+            published_from=published_from,
+            published_to=published_to,
+        )
+        facets = BlogPostFacets(
+            tags=[
+                TagFacet(name=name, count=count) for name, count in facet_counts["tags"]
+            ],
+            years=[
+                YearFacet(year=year, count=count)
+                for year, count in facet_counts["years"]
+            ],
+        )
+    return BlogPostsPublic(
+        data=blog_posts, count=count, next_cursor=next_cursor, facets=facets
+    )
+
+
+@router.get("/archive", response_model=BlogPostArchive)
+def read_blog_post_archive(session: SessionDep) -> BlogPostArchive:
+    """
+    Get the number of blog posts published per year and month, latest first.
+    Filter the blog posts of a month with `published_from` and `published_to`.
+    """
+    years = []
+    for year, month, count in BlogPostCRUD(session).read_archive():
+        if not years or years[-1].year != year:
+            years.append(ArchiveYear(year=year, count=0, months=[]))
+        years[-1].count += count
+        years[-1].months.append(ArchiveMonth(month=month, count=count))
+    return BlogPostArchive(data=years)
 
 
-@router.get("/{url}", response_model=BlogPostPublic)
-def read_blog_post(session: SessionDep, url: str) -> BlogPostPublic:
+@router.get("/{url}", response_model=BlogPostPublic | BlogPostPublicHtml)
+def read_blog_post(
+    session: SessionDep,
+    request: Request,
+    response: Response,
+    url: str,
+    format: Literal["markdown", "html"] = "markdown",
+) -> BlogPostPublic | BlogPostPublicHtml | Response:
     """
     Get blog post by ID with its tags and comments.
+    With `format=html` the content is returned pre-rendered to HTML along with its table of contents, instead of markdown.
+    Supports conditional requests, the version of the blog post is checked before reading it.
     """
-    blog_post = BlogPostCRUD(session).read_blog_post_with_tags(blog_post_url=url)
+    blog_post_crud = BlogPostCRUD(session)
+    updated_at = blog_post_crud.read_blog_post_version(blog_post_url=url)
+    if not updated_at:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Blog post not found"
+        )
+    etag = get_etag("blog_post", url, updated_at, format)
+    if not_modified := check_not_modified(request, response, etag, updated_at):
+        return not_modified
+
+    blog_post = blog_post_crud.read_blog_post_with_tags(blog_post_url=url)
     if not blog_post:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Blog post not found"
         )
 
+    if format == "html":
+        return BlogPostPublicHtml.model_validate(blog_post, from_attributes=True)
+
     tags = [
         TagPublic.model_validate(tag, from_attributes=True) for tag in blog_post.tags
     ]
@@ -66,6 +191,8 @@ def read_blog_post(session: SessionDep, url: str) -> BlogPostPublic:
         image_path=blog_post.image_path,
         publication_date=blog_post.publication_date,
         featured=blog_post.featured,
+        comment_count=blog_post.comment_count,
+        last_comment_at=blog_post.last_comment_at,
         tags=tags,
     )
 
@@ -1,17 +1,22 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 import uuid
 
 from app.api.deps import SessionDep, CurrentUser, get_current_active_superuser
+from app.db.comment_events import stream_comment_events
 from app.db.crud import CommentCRUD, BlogPostCRUD
+from app.db.pagination import CountMode, encode_cursor, get_next_cursor
 from app.models.models import Comment, User
 from app.schemas.comment import (
     CommentCreate,
     CommentUpdate,
-    CommentPublic,
+    CommentPublicWithBlogPost,
     CommentsPublic,
     CommentPublicWithUsername,
     CommentPublicWithReplies,
     CommentPrivate,
+    CommentPrivateWithBlogPost,
     CommentsPrivate,
 )
 from app.schemas.message import Message
@@ -26,12 +31,17 @@ router = APIRouter(tags=["comments"])
     response_model=CommentsPrivate,
 )
 def read_comments(
-    session: SessionDep, skip: int = 0, limit: int = 100
+    session: SessionDep,
+    skip: int = 0,
+    limit: int = 100,
+    include_count: CountMode = "exact",
 ) -> CommentsPrivate:
     """
     Retrieve comments.
     """
-    count, comments = CommentCRUD(session).read_comments(skip=skip, limit=limit)
+    count, comments = CommentCRUD(session).read_comments(
+        skip=skip, limit=limit, include_count=include_count
+    )
     # Convert Comment models to CommentPrivate models
     comments = [
         CommentPrivate.model_validate(comment, from_attributes=True)
@@ -42,10 +52,19 @@ def read_comments(
 
 @router.get("/blogposts/{blog_post_url}/comments", response_model=CommentsPublic)
 def read_comments_for_blog_post(
-    session: SessionDep, blog_post_url: str, skip: int = 0, limit: int = 100
+    session: SessionDep,
+    blog_post_url: str,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: str | None = None,
+    replies_limit: int = Query(default=3, ge=0),
+    include_count: CountMode = "exact",
 ) -> CommentsPublic:
     """
-    Retrieve comments for a specific blog post.
+    Retrieve comments for a specific blog post with their first replies.
+    Pass the returned `next_cursor` as `cursor` to read the next page; `skip` is ignored in that case.
+    Each comment has its number of replies and the cursor to read the rest of them, if there are more.
+    The whole page is read in a constant number of queries.
     """
     blog_post = BlogPostCRUD(session).get_blog_post_by_url(blog_post_url)
     if not blog_post:
@@ -53,13 +72,29 @@ def read_comments_for_blog_post(
             status_code=status.HTTP_404_NOT_FOUND, detail="Blog post not found"
         )
 
-    count, comments = CommentCRUD(session).read_comments_for_blog_post(
-        blog_post_id=blog_post.id, skip=skip, limit=limit
+    comment_crud = CommentCRUD(session)
+    count, comments = comment_crud.read_comments_for_blog_post(
+        blog_post_id=blog_post.id,
+        skip=skip,
+        limit=limit,
+        cursor=cursor,
+        include_count="none" if include_count == "exact" else include_count,
+    )
+    if include_count == "exact":
+        # The comment counter of the blog post is exact, the comments are not counted again
+        count = blog_post.comment_count
+    replies_by_comment = comment_crud.read_replies_for_comments(
+        comment_ids=[comment.id for comment in comments], limit=replies_limit
     )
     comments_with_replies = []
 
     for comment in comments:
-        _, replies = CommentCRUD(session).read_comment_replies(comment_id=comment.id)
+        reply_count, replies = replies_by_comment[comment.id]
+        next_replies_cursor = None
+        if replies and reply_count > len(replies):
+            next_replies_cursor = encode_cursor(
+                replies[-1].comment_date, replies[-1].id
+            )
         comment_replies = [
             CommentPublicWithUsername(
                 id=reply.id,
@@ -83,10 +118,104 @@ def read_comments_for_blog_post(
                 blog_post_id=comment.blog_post_id,
                 username=comment.user.name if comment.user else None,
                 replies=comment_replies,
+                reply_count=reply_count,
+                next_replies_cursor=next_replies_cursor,
             )
         )
 
-    return CommentsPublic(data=comments_with_replies, count=count)
+    return CommentsPublic(
+        data=comments_with_replies,
+        count=count,
+        next_cursor=get_next_cursor(comments, limit, "comment_date", "id"),
+    )
+
+
+@router.get(
+    "/blogposts/{blog_post_url}/comments/stream",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"text/event-stream": {}}}},
+)
+async def stream_comments_for_blog_post(
+    session: SessionDep, blog_post_url: str
+) -> StreamingResponse:
+    """
+    Stream the new, updated and deleted comments of a blog post as Server-Sent Events.
+    The events are `created` and `updated` with the comment, and `deleted` with the ID of the comment.
+    A comment too long to be sent along comes with its ID only, and has to be read with `GET /comments/{id}`.
+    """
+    blog_post = await run_in_threadpool(
+        BlogPostCRUD(session).get_blog_post_by_url, blog_post_url
+    )
+    if not blog_post:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Blog post not found"
+        )
+
+    return StreamingResponse(
+        stream_comment_events(blog_post.id),
+        media_type="text/event-stream",
+        # Proxies must pass the events through as they come
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get(
+    "/blogposts/{blog_post_url}/comments/{id}/replies", response_model=CommentsPublic
+)
+def read_comment_replies(
+    session: SessionDep,
+    blog_post_url: str,
+    id: int,
+    limit: int = 100,
+    cursor: str | None = None,
+    include_count: CountMode = "exact",
+) -> CommentsPublic:
+    """
+    Retrieve the replies of a comment in chronological order.
+    Pass the `next_replies_cursor` of the comment, then the returned `next_cursor`, as `cursor` to read the next page.
+    """
+    blog_post = BlogPostCRUD(session).get_blog_post_by_url(blog_post_url)
+    if not blog_post:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Blog post not found"
+        )
+    comment = session.get(Comment, id)
+    if not comment:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Comment not found"
+        )
+    if comment.blog_post_id != blog_post.id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Comment does not belong to this blog post",
+        )
+
+    count, replies = CommentCRUD(session).read_comment_replies(
+        comment_id=comment.id,
+        limit=limit,
+        cursor=cursor,
+        include_count="none" if include_count == "exact" else include_count,
+    )
+    if include_count == "exact":
+        # The reply counter of the comment is exact, the replies are not counted again
+        count = comment.reply_count
+    comment_replies = [
+        CommentPublicWithUsername(
+            id=reply.id,
+            content=reply.content,
+            comment_date=reply.comment_date,
+            reply_to=reply.reply_to,
+            user_id=reply.user_id,
+            blog_post_id=reply.blog_post_id,
+            username=reply.user.name if reply.user else None,
+        )
+        for reply in replies
+    ]
+    return CommentsPublic(
+        data=comment_replies,
+        count=count,
+        next_cursor=get_next_cursor(replies, limit, "comment_date", "id"),
+    )
 
 
 @router.get("/user/{user_id}/comments", response_model=CommentsPublic)
@@ -96,9 +225,12 @@ def read_comments_for_user(
     current_user: CurrentUser,
     skip: int = 0,
     limit: int = 100,
+    cursor: str | None = None,
+    include_count: CountMode = "exact",
 ) -> CommentsPublic:
     """
-    Retrieve comments made by a specific user.
+    Retrieve comments made by a specific user, newest first, with the title and URL of their blog posts.
+    Pass the returned `next_cursor` as `cursor` to read the next page; `skip` is ignored in that case.
     """
     user = session.get(User, user_id)
     if not user:
@@ -112,30 +244,69 @@ def read_comments_for_user(
         )
 
     count, comments = CommentCRUD(session).read_comments_for_user(
-        user_id=user_id, skip=skip, limit=limit
+        user_id=user_id,
+        skip=skip,
+        limit=limit,
+        cursor=cursor,
+        include_count=include_count,
     )
-    comments = [
-        CommentPublic.model_validate(comment, from_attributes=True)
+    comments_with_blog_post = [
+        CommentPublicWithBlogPost(
+            id=comment.id,
+            content=comment.content,
+            comment_date=comment.comment_date,
+            reply_to=comment.reply_to,
+            blog_post_id=comment.blog_post_id,
+            blog_post_title=comment.blog_post.title,
+            blog_post_url=comment.blog_post.url,
+        )
         for comment in comments
     ]
-    return CommentsPublic(data=comments, count=count)
+    return CommentsPublic(
+        data=comments_with_blog_post,
+        count=count,
+        next_cursor=get_next_cursor(comments, limit, "comment_date", "id"),
+    )
 
 
 @router.get("/me/comments", response_model=CommentsPrivate)
 def read_my_comments(
-    session: SessionDep, current_user: CurrentUser, skip: int = 0, limit: int = 100
+    session: SessionDep,
+    current_user: CurrentUser,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: str | None = None,
+    include_count: CountMode = "exact",
 ) -> CommentsPrivate:
     """
-    Retrieve own comments.
+    Retrieve own comments, newest first, with the title and URL of their blog posts.
+    Pass the returned `next_cursor` as `cursor` to read the next page; `skip` is ignored in that case.
     """
     count, comments = CommentCRUD(session).read_comments_for_user(
-        user_id=current_user.id, skip=skip, limit=limit
+        user_id=current_user.id,
+        skip=skip,
+        limit=limit,
+        cursor=cursor,
+        include_count=include_count,
     )
-    comments = [
-        CommentPrivate.model_validate(comment, from_attributes=True)
+    comments_with_blog_post = [
+        CommentPrivateWithBlogPost(
+            id=comment.id,
+            content=comment.content,
+            comment_date=comment.comment_date,
+            reply_to=comment.reply_to,
+            user_id=comment.user_id,
+            blog_post_id=comment.blog_post_id,
+            blog_post_title=comment.blog_post.title,
+            blog_post_url=comment.blog_post.url,
+        )
         for comment in comments
     ]
-    return CommentsPrivate(data=comments, count=count)
+    return CommentsPrivate(
+        data=comments_with_blog_post,
+        count=count,
+        next_cursor=get_next_cursor(comments, limit, "comment_date", "id"),
+    )
 
 
 @router.get("/comments/{id}", response_model=CommentPublicWithUsername)
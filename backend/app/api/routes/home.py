@@ -0,0 +1,46 @@
+from fastapi import APIRouter
+
+from app.api.deps import SessionDep
+from app.db.crud import BlogPostCRUD
+from app.schemas.blog_post import BlogPostSummary
+from app.schemas.home import HomePublic
+from app.schemas.tag import TagPublicWithCount
+
+
+router = APIRouter(prefix="/home", tags=["home"])
+
+
+@router.get("/", response_model=HomePublic)
+def read_home(
+    session: SessionDep,
+    featured_limit: int = 3,
+    recent_limit: int = 3,
+    tags_limit: int = 100,
+) -> HomePublic:
+    """
+    Get everything the home page shows in one response: the latest featured blog posts, the latest blog posts
+    with their total count and the most used tags with their blog post counts.
+    The response is cached as a whole, so repeated requests do not query the database.
+    """
+    home = BlogPostCRUD(session).read_home(
+        featured_limit=featured_limit,
+        recent_limit=recent_limit,
+        tags_limit=tags_limit,
+    )
+    return HomePublic(
+        featured=[
+            BlogPostSummary.model_validate(blog_post, from_attributes=True)
+            for blog_post in home["featured"]
+        ],
+        recent=[
+            BlogPostSummary.model_validate(blog_post, from_attributes=True)
+            for blog_post in home["recent"]
+        ],
+        recent_count=home["recent_count"],
+        tags=[
+            TagPublicWithCount(
+                id=tag.id, name=tag.name, blog_post_count=blog_post_count
+            )
+            for tag, blog_post_count in home["tags"]
+        ],
+    )
@@ -1,6 +1,7 @@
-from fastapi import APIRouter, Response
+from fastapi import APIRouter, Request, Response
 
 from app.api.deps import SessionDep
+from app.core.conditional import check_not_modified, get_etag
 from app.core.config import settings
 from app.db.crud import BlogPostCRUD
 
@@ -9,12 +10,22 @@ router = APIRouter(tags=["sitemap"])
 
 
 @router.get("/sitemap.xml", response_class=Response)
-def get_sitemap(session: SessionDep) -> Response:
+def get_sitemap(session: SessionDep, request: Request, response: Response) -> Response:
     """
     Generate dynamic sitemap.xml with all published blog posts.
+    Supports conditional requests with the ETag, the version of the blog posts is checked before reading them.
+    No Last-Modified is sent, the time of the latest change does not advance when blog posts are deleted.
     """
+    blog_post_crud = BlogPostCRUD(session)
+    count, updated_at = blog_post_crud.read_blog_posts_version()
+    etag = get_etag("sitemap", count, updated_at)
+    if not_modified := check_not_modified(request, response, etag):
+        return not_modified
+
     # Get all blog posts
-    _, blog_posts = BlogPostCRUD(session).read_blog_posts(skip=0, limit=10000)
+    _, blog_posts = blog_post_crud.read_blog_posts(
+        skip=0, limit=10000, include_count="none"
+    )
 
     # Build sitemap XML
     xml_content = '<?xml version="1.0" encoding="UTF-8"?>\n'
@@ -68,4 +79,6 @@ def get_sitemap(session: SessionDep) -> Response:
 
     xml_content += "</urlset>"
 
-    return Response(content=xml_content, media_type="application/xml")
+    return Response(
+        content=xml_content, media_type="application/xml", headers=response.headers
+    )
@@ -0,0 +1,25 @@
+from fastapi import APIRouter, Request, Response
+import pygments
+
+from app.core.conditional import check_not_modified, get_etag
+from app.core.config import settings
+from app.core.markdown import get_highlight_css
+
+
+router = APIRouter(prefix="/styles", tags=["styles"])
+
+
+@router.get("/highlight.css", response_class=Response)
+def get_highlight_stylesheet(request: Request, response: Response) -> Response:
+    """
+    Get the stylesheet of the code blocks highlighted in the pre-rendered blog posts.
+    """
+    etag = get_etag("highlight", settings.HIGHLIGHT_STYLE, pygments.__version__)
+    if not_modified := check_not_modified(request, response, etag):
+        return not_modified
+
+    return Response(
+        content=get_highlight_css(settings.HIGHLIGHT_STYLE),
+        media_type="text/css",
+        headers=response.headers,
+    )
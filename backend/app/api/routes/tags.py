@@ -1,24 +1,78 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 
 from app.api.deps import SessionDep, get_current_active_superuser
-from app.db.crud import TagCRUD
+from app.core.conditional import check_not_modified, get_etag
+from app.db.crud import BlogPostCRUD, TagCRUD
+from app.db.pagination import CountMode, get_next_cursor
 from app.models.models import Tag
-from app.schemas.blog_post import BlogPostPublic, BlogPostsByTag
+from app.schemas.blog_post import BlogPostSummary, BlogPostsByTag
 from app.schemas.message import Message
-from app.schemas.tag import TagPublic, TagCreate, TagUpdate, TagsPublic
+from app.schemas.tag import (
+    TagCreate,
+    TagOrder,
+    TagPublic,
+    TagPublicWithCount,
+    TagUpdate,
+    TagsPublic,
+)
 
 
 router = APIRouter(prefix="/tags", tags=["tags"])
 
 
 @router.get("/", response_model=TagsPublic)
-def read_tags(session: SessionDep, skip: int = 0, limit: int = 100) -> TagsPublic:
+def read_tags(
+    session: SessionDep,
+    request: Request,
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    with_counts: bool = False,
+    order: TagOrder = "id",
+    include_count: CountMode = "exact",
+) -> TagsPublic | Response:
     """
     Retrieve tags.
+    With `with_counts=true` each tag includes the number of its blog posts, with `order=popular` the tags with the most blog posts come first.
+    Supports conditional requests with the ETag, the version of the tags is checked before reading them.
+    No Last-Modified is sent, the time of the latest change does not advance when tags are deleted.
     """
-    count, tags = TagCRUD(session).read_tags(skip=skip, limit=limit)
-    # Convert Tag models to TagPublic models
-    tags = [TagPublic.model_validate(tag, from_attributes=True) for tag in tags]
+    tag_crud = TagCRUD(session)
+    total_count, updated_at = tag_crud.read_tags_version()
+    version = [total_count, updated_at]
+    if with_counts or order == "popular":
+        # The blog post counts change with the blog posts, not with the tags
+        blog_posts_count, blog_posts_updated_at = BlogPostCRUD(
+            session
+        ).read_blog_posts_version()
+        version += [blog_posts_count, blog_posts_updated_at]
+    etag = get_etag("tags", *version, request.url.query)
+    if not_modified := check_not_modified(request, response, etag):
+        return not_modified
+
+    if not with_counts and order == "id":
+        count, tags = tag_crud.read_tags(
+            skip=skip, limit=limit, include_count=include_count
+        )
+        # Convert Tag models to TagPublic models
+        tags = [TagPublic.model_validate(tag, from_attributes=True) for tag in tags]
+        return TagsPublic(data=tags, count=count)
+
+    count, tags_with_counts = tag_crud.read_tags_with_counts(
+        skip=skip, limit=limit, order=order, include_count=include_count
+    )
+    if with_counts:
+        tags = [
+            TagPublicWithCount(
+                id=tag.id, name=tag.name, blog_post_count=blog_post_count
+            )
+            for tag, blog_post_count in tags_with_counts
+        ]
+    else:
+        tags = [
+            TagPublic.model_validate(tag, from_attributes=True)
+            for tag, _ in tags_with_counts
+        ]
     return TagsPublic(data=tags, count=count)
 
 
@@ -36,22 +90,46 @@ def read_tag(session: SessionDep, id: int) -> TagPublic:
 
 
 @router.get("/{id}/blogposts", response_model=BlogPostsByTag)
-def read_tag_with_blog_posts(session: SessionDep, id: int) -> BlogPostsByTag:
+def read_tag_with_blog_posts(
+    session: SessionDep,
+    id: int,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: str | None = None,
+    include_count: CountMode = "exact",
+) -> BlogPostsByTag:
     """
-    Get tag by ID with its blog posts.
+    Get tag by ID with its blog posts, newest first.
+    The blog posts are returned without their content, with an excerpt instead.
+    Pass the returned `next_cursor` as `cursor` to read the next page; `skip` is ignored in that case.
     """
-    tag = TagCRUD(session).read_tag_with_blog_posts(tag_id=id)
+    tag = session.get(Tag, id)
     if not tag:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Tag not found"
         )
 
+    count, blog_posts = BlogPostCRUD(session).read_blog_posts(
+        skip=skip,
+        limit=limit,
+        tag_id=tag.id,
+        cursor=cursor,
+        include_count=include_count,
+    )
+    next_cursor = get_next_cursor(blog_posts, limit, "publication_date", "id")
+    # Convert BlogPost models to BlogPostSummary models
     blog_posts = [
-        BlogPostPublic.model_validate(blog_post, from_attributes=True)
-        for blog_post in tag.blog_posts
+        BlogPostSummary.model_validate(blog_post, from_attributes=True)
+        for blog_post in blog_posts
     ]
 
-    return BlogPostsByTag(id=tag.id, name=tag.name, blog_posts=blog_posts)
+    return BlogPostsByTag(
+        id=tag.id,
+        name=tag.name,
+        blog_posts=blog_posts,
+        count=count,
+        next_cursor=next_cursor,
+    )
 
 
 @router.post(
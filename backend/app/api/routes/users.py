@@ -6,6 +6,7 @@ from app.core.config import settings
 from app.core.limiter import limiter
 from app.core.security import get_password_hash, verify_password, generate_token
 from app.db.crud import UserCRUD
+from app.db.pagination import CountMode
 from app.logger import logger
 from app.models.models import User
 from app.rolkotech_email.EmailGenerator import EMAIL_GENERATOR
@@ -37,9 +38,12 @@ def read_users(
     search_by_email: str | None = None,
     search_by_active: bool | None = None,
     search_by_superuser: bool | None = None,
+    fuzzy: bool = False,
+    include_count: CountMode = "exact",
 ) -> UsersPublic:
     """
     Retrieve users.
+    With `fuzzy=true` the name and email searches tolerate typos and return the most similar users first.
     """
     count, users = UserCRUD(session).read_users(
         skip=skip,
@@ -48,6 +52,8 @@ def read_users(
         search_by_email=search_by_email,
         search_by_active=search_by_active,
         search_by_superuser=search_by_superuser,
+        fuzzy=fuzzy,
+        include_count=include_count,
     )
     # Convert User models to UserPublic models
     users = [UserPublic.model_validate(user, from_attributes=True) for user in users]
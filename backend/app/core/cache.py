@@ -0,0 +1,120 @@
+from collections import OrderedDict, defaultdict
+from collections.abc import Hashable
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+import threading
+import time
+from typing import Any
+
+from app.core.config import settings
+
+
+class Cache:
+    """
+    Thread-safe in-process LRU cache whose entries expire after a TTL.
+    Keys are tuples whose first item is a namespace, so related entries can be invalidated together.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple[Hashable, ...], tuple[float, Any]] = (
+            OrderedDict()
+        )
+        # Bumped on every invalidation, so values read before it are not cached after it
+        self._generations: defaultdict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple[Hashable, ...], default: Any = None) -> Any:
+        """
+        Get the value cached under `key`, or `default` if it is not cached or has expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(
+        self, key: tuple[Hashable, ...], value: Any, generation: int | None = None
+    ) -> None:
+        """
+        Cache `value` under `key`, evicting the least recently used entry if the cache is full.
+        If `generation` is provided, the value is only cached if its namespace has not been invalidated since.
+        """
+        with self._lock:
+            if generation is not None and generation != self._generations[key[0]]:
+                return
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def generation(self, namespace: str) -> int:
+        """
+        Get the current generation of a namespace, to be passed to `set` after reading the value to cache.
+        """
+        with self._lock:
+            return self._generations[namespace]
+
+    def invalidate(self, *namespaces: str) -> None:
+        """
+        Remove all the entries of the given namespaces.
+        """
+        with self._lock:
+            for namespace in namespaces:
+                self._generations[namespace] += 1
+            for key in [key for key in self._entries if key[0] in namespaces]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """
+        Remove all the entries and reset the counters.
+        """
+        with self._lock:
+            for namespace in self._generations:
+                self._generations[namespace] += 1
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        """
+        Get the hit and miss counters and the number of cached entries.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+            }
+
+
+cache = Cache(max_size=settings.CACHE_MAX_SIZE, ttl_seconds=settings.CACHE_TTL_SECONDS)
+
+
+def invalidate_on_commit(session: Session, *namespaces: str) -> None:
+    """
+    Invalidate the given namespaces once the current transaction of `session` is committed.
+    Invalidating only after the commit prevents concurrent reads from caching the old data again.
+    """
+    session.info.setdefault("cache_invalidations", set()).update(namespaces)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session: Session) -> None:
+    namespaces = session.info.pop("cache_invalidations", None)
+    if namespaces:
+        cache.invalidate(*namespaces)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_invalidations_after_rollback(session: Session) -> None:
+    session.info.pop("cache_invalidations", None)
@@ -0,0 +1,80 @@
+from datetime import datetime, timedelta, UTC
+from email.utils import format_datetime, parsedate_to_datetime
+from fastapi import Request, Response, status
+import hashlib
+from typing import Any
+
+
+def get_etag(*parts: Any) -> str:
+    """
+    Build a strong ETag from the values identifying the version of a response.
+    """
+    digest = hashlib.sha256("|".join(str(part) for part in parts).encode())
+    return f'"{digest.hexdigest()[:32]}"'
+
+
+def check_not_modified(
+    request: Request,
+    response: Response,
+    etag: str,
+    last_modified: datetime | None = None,
+) -> Response | None:
+    """
+    Set the validators of the response and evaluate the conditional headers of the request.
+    Returns a 304 response if the client's copy is still valid, so the body does not have to be built.
+    """
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if last_modified is not None:
+        last_modified = _round_up_to_seconds(_to_utc(last_modified))
+        # A later change within the same second would have the same Last-Modified, so it is only sent once that second is over
+        if last_modified > datetime.now(UTC):
+            last_modified = None
+        else:
+            headers["Last-Modified"] = format_datetime(last_modified, usegmt=True)
+    response.headers.update(headers)
+
+    if_none_match = request.headers.get("if-none-match")
+    if_modified_since = request.headers.get("if-modified-since")
+    # If-Modified-Since is ignored when If-None-Match is present
+    if if_none_match is not None:
+        not_modified = _etag_matches(if_none_match, etag)
+    elif if_modified_since is not None and last_modified is not None:
+        not_modified = _not_modified_since(if_modified_since, last_modified)
+    else:
+        not_modified = False
+
+    if not_modified:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return None
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    # If-None-Match uses the weak comparison
+    return any(
+        candidate.strip().removeprefix("W/") == etag
+        for candidate in if_none_match.split(",")
+    )
+
+
+def _not_modified_since(if_modified_since: str, last_modified: datetime) -> bool:
+    try:
+        modified_since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    return last_modified <= _to_utc(modified_since)
+
+
+def _round_up_to_seconds(value: datetime) -> datetime:
+    # Last-Modified has a resolution of seconds
+    if value.microsecond:
+        return value.replace(microsecond=0) + timedelta(seconds=1)
+    return value
+
+
+def _to_utc(value: datetime) -> datetime:
+    # Naive datetimes read from the database are in UTC
+    if value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value.astimezone(UTC)
@@ -105,5 +105,12 @@ class Settings(BaseSettings):
     ALLOWED_EXTENSIONS: set[str] = {".jpg", ".jpeg", ".png", ".gif", ".webp"}
     MAX_FILE_SIZE: int = 5 * 1024 * 1024  # 5MB
 
+    CACHE_MAX_SIZE: int = 1024
+    CACHE_TTL_SECONDS: int = 5 * 60  # 5 minutes
+
+    # Pygments style of the highlighted code blocks
+    HIGHLIGHT_STYLE: str = "github-dark"
+    HIGHLIGHT_CACHE_MAX_SIZE: int = 4096
+
 
 settings = Settings()
@@ -0,0 +1,49 @@
+from math import ceil
+
+
+EXCERPT_MAX_LENGTH = 500
+WORDS_PER_MINUTE = 200
+
+
+def get_excerpt(content: str) -> str:
+    """
+    Get the first paragraph of the markdown content that is not a title.
+    Long paragraphs are cut at a word boundary.
+    """
+    paragraphs = [
+        paragraph.strip()
+        for paragraph in content.split("\n\n")
+        if paragraph.strip() and not paragraph.startswith("#")
+    ]
+    if not paragraphs:
+        return ""
+    excerpt = paragraphs[0]
+    if len(excerpt) > EXCERPT_MAX_LENGTH:
+        excerpt = excerpt[:EXCERPT_MAX_LENGTH].rsplit(maxsplit=1)[0] + "…"
+    return excerpt
+
+
+def get_word_count(content: str) -> int:
+    """
+    Count the words of the markdown content.
+    """
+    return len(content.split())
+
+
+def get_reading_time(word_count: int) -> int:
+    """
+    Get the estimated reading time in minutes, at least one minute.
+    """
+    return max(1, ceil(word_count / WORDS_PER_MINUTE))
+
+
+def get_content_summary(content: str) -> dict[str, str | int]:
+    """
+    Get the precomputed summary columns of a blog post from its content.
+    """
+    word_count = get_word_count(content)
+    return {
+        "excerpt": get_excerpt(content),
+        "word_count": word_count,
+        "reading_time": get_reading_time(word_count),
+    }
@@ -0,0 +1,121 @@
+from functools import cache
+import hashlib
+import json
+from markdown_it import MarkdownIt
+from pygments import highlight
+from pygments.formatters import HtmlFormatter
+from pygments.lexers import get_lexer_by_name
+from pygments.util import ClassNotFound
+import re
+from typing import Any
+
+from app.core.cache import Cache
+from app.core.config import settings
+
+
+# CSS class of the highlighted code blocks, the stylesheet rules are scoped to it
+HIGHLIGHT_CSS_CLASS = "highlight"
+
+# Highlighted code blocks by the hash of their language, code and style
+highlight_cache = Cache(
+    max_size=settings.HIGHLIGHT_CACHE_MAX_SIZE, ttl_seconds=24 * 60 * 60
+)
+
+
+def highlight_code(code: str, language: str, attrs: str = "") -> str:
+    """
+    Highlight a fenced code block with Pygments, used as the `highlight` option of the markdown renderer.
+    Returns an empty string for blocks without a known language, so the renderer escapes them as they are.
+    """
+    if not language:
+        return ""
+    style = settings.HIGHLIGHT_STYLE
+    key = (
+        "highlight",
+        hashlib.sha256(json.dumps([language, code, style]).encode()).hexdigest(),
+    )
+    highlighted_code = highlight_cache.get(key)
+    if highlighted_code is None:
+        try:
+            lexer = get_lexer_by_name(language)
+        except ClassNotFound:
+            return ""
+        highlighted_code = highlight(code, lexer, HtmlFormatter(nowrap=True))
+        highlight_cache.set(key, highlighted_code)
+    language_class = re.sub(r"[^\w\-+#]", "", language)
+    return (
+        f'<pre class="{HIGHLIGHT_CSS_CLASS}"><code class="language-{language_class}">'
+        f"{highlighted_code}</code></pre>"
+    )
+
+
+@cache
+def get_highlight_css(style: str) -> str:
+    """
+    Get the stylesheet of the highlighted code blocks for a Pygments style.
+    """
+    return HtmlFormatter(style=style).get_style_defs(f".{HIGHLIGHT_CSS_CLASS}")
+
+
+# CommonMark with the GitHub extensions used in the blog posts, raw HTML is not rendered
+md = MarkdownIt("commonmark", {"html": False, "highlight": highlight_code}).enable(
+    ["table", "strikethrough"]
+)
+
+
+def get_content_hash(content: str) -> str:
+    """
+    Get the hash identifying the markdown content, to detect whether it has to be rendered again.
+    """
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+def get_heading_id(text: str, used_ids: set[str]) -> str:
+    """
+    Get a GitHub-style anchor ID for a heading, unique among `used_ids`.
+    """
+    heading_id = re.sub(r"[^\w\- ]", "", text.strip().lower()).replace(" ", "-")
+    heading_id = heading_id or "section"
+    unique_id = heading_id
+    suffix = 1
+    while unique_id in used_ids:
+        unique_id = f"{heading_id}-{suffix}"
+        suffix += 1
+    used_ids.add(unique_id)
+    return unique_id
+
+
+def render_markdown(content: str) -> tuple[str, list[dict[str, Any]]]:
+    """
+    Render the markdown content to HTML and extract its table of contents.
+    The headings get anchor IDs, which the entries of the table of contents refer to.
+    """
+    env = {}
+    tokens = md.parse(content, env)
+    toc = []
+    used_ids = set()
+    for index, token in enumerate(tokens):
+        if token.type != "heading_open":
+            continue
+        inline = tokens[index + 1]
+        text = "".join(
+            child.content
+            for child in inline.children or []
+            if child.type in ("text", "code_inline")
+        )
+        heading_id = get_heading_id(text, used_ids)
+        token.attrSet("id", heading_id)
+        toc.append({"level": int(token.tag[1]), "text": text, "id": heading_id})
+    return md.renderer.render(tokens, md.options, env), toc
+
+
+def get_rendered_content(content: str) -> dict[str, Any]:
+    """
+    Get the pre-rendered content columns of a blog post from its markdown content.
+    """
+    content_html, toc = render_markdown(content)
+    return {
+        "content_html": content_html,
+        "toc": toc,
+        "content_hash": get_content_hash(content),
+    }
@@ -0,0 +1,130 @@
+import asyncio
+from collections import defaultdict
+from collections.abc import AsyncIterator
+import json
+from sqlalchemy.orm import Session
+from typing import Any, Literal
+
+from app.db.notifications import (
+    MAX_PAYLOAD_BYTES,
+    encode_payload,
+    publish,
+    register_handler,
+)
+from app.logger import logger
+
+
+COMMENT_EVENTS_CHANNEL = "comment_events"
+# Interval of the keep-alive comments sent on idle streams, so proxies do not close them
+HEARTBEAT_SECONDS = 15
+# Delay after which the clients reconnect to a closed stream
+RECONNECT_DELAY_MILLISECONDS = 3000
+# Events buffered for a client that does not keep up, before its stream is closed
+SUBSCRIBER_QUEUE_SIZE = 100
+
+CommentEventType = Literal["created", "updated", "deleted"]
+
+
+class CommentEventBroker:
+    """
+    Fans out the comment events received by the notification listener of this process to the subscribed streams.
+    Each subscriber has its own queue, the events are only put on the queues of the blog post they belong to.
+    Only meant to be used from the event loop of the notification listener.
+    """
+
+    def __init__(self, queue_size: int):
+        self.queue_size = queue_size
+        self._subscribers: defaultdict[int, set[asyncio.Queue]] = defaultdict(set)
+
+    def subscribe(self, blog_post_id: int) -> asyncio.Queue:
+        """
+        Subscribe to the comment events of a blog post.
+        The returned queue receives the events, or None once the subscriber has fallen too far behind.
+        """
+        queue = asyncio.Queue(maxsize=self.queue_size + 1)
+        self._subscribers[blog_post_id].add(queue)
+        return queue
+
+    def unsubscribe(self, blog_post_id: int, queue: asyncio.Queue) -> None:
+        """
+        Stop putting the comment events of a blog post on `queue`.
+        """
+        subscribers = self._subscribers.get(blog_post_id)
+        if subscribers is None:
+            return
+        subscribers.discard(queue)
+        if not subscribers:
+            del self._subscribers[blog_post_id]
+
+    def subscriber_count(self, blog_post_id: int) -> int:
+        """
+        Get the number of subscribers to the comment events of a blog post.
+        """
+        return len(self._subscribers.get(blog_post_id, ()))
+
+    def broadcast(self, event: dict[str, Any]) -> None:
+        """
+        Put a comment event on the queues of the subscribers to its blog post.
+        """
+        for queue in list(self._subscribers.get(event.get("blog_post_id"), ())):
+            if queue.qsize() < self.queue_size:
+                queue.put_nowait(event)
+                continue
+            # The slot left in the queue tells the subscriber to close its stream, the client reconnects and reloads
+            logger.warning(
+                f"Comment event subscriber of blog post {event['blog_post_id']} fell behind"
+            )
+            self.unsubscribe(event["blog_post_id"], queue)
+            queue.put_nowait(None)
+
+
+comment_events = CommentEventBroker(queue_size=SUBSCRIBER_QUEUE_SIZE)
+
+
+def publish_comment_event(
+    session: Session,
+    event_type: CommentEventType,
+    blog_post_id: int,
+    comment: dict[str, Any],
+) -> None:
+    """
+    Publish a comment event to the streams of all the processes, once the current transaction of `session` is committed.
+    The comment is sent along, so the clients do not have to read it. If it does not fit into a notification,
+    only its ID is sent, and the clients read the comment by its ID.
+    """
+    event = {"type": event_type, "blog_post_id": blog_post_id, "comment": comment}
+    if len(encode_payload(event).encode()) >= MAX_PAYLOAD_BYTES:
+        event["comment"] = {"id": comment["id"], "reply_to": comment["reply_to"]}
+    publish(session, COMMENT_EVENTS_CHANNEL, event)
+
+
+def format_comment_event(event: dict[str, Any]) -> str:
+    """
+    Format a comment event as a Server-Sent Events message.
+    """
+    return f"event: {event['type']}\ndata: {json.dumps(event['comment'])}\n\n"
+
+
+async def stream_comment_events(blog_post_id: int) -> AsyncIterator[str]:
+    """
+    Stream the comment events of a blog post as Server-Sent Events messages, until the client disconnects.
+    The stream ends if the client falls too far behind, the client then reconnects and reloads the comments.
+    """
+    queue = comment_events.subscribe(blog_post_id)
+    try:
+        yield f"retry: {RECONNECT_DELAY_MILLISECONDS}\n\n"
+        while True:
+            try:
+                event = await asyncio.wait_for(queue.get(), HEARTBEAT_SECONDS)
+            except TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+            if event is None:
+                return
+            yield format_comment_event(event)
+    finally:
+        comment_events.unsubscribe(blog_post_id, queue)
+
+
+# The publishing process receives its own events as well, like the other processes
+register_handler(COMMENT_EVENTS_CHANNEL, comment_events.broadcast)
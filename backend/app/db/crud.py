@@ -1,15 +1,50 @@
+from collections.abc import Callable, Hashable
+from datetime import datetime, UTC
 from fastapi import HTTPException, status
-from sqlalchemy.orm import joinedload, selectinload
-from sqlalchemy import and_
+import html
+import pickle
+from sqlalchemy.orm import aliased, contains_eager, defer, joinedload, selectinload
+from sqlalchemy import (
+    DateTime,
+    Integer,
+    and_,
+    cast,
+    delete,
+    exists,
+    inspect,
+    literal,
+    true,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert
 from sqlmodel import Session, select, func
 from typing import Any
 import uuid
 
+from app.core.cache import cache, invalidate_on_commit
+from app.core.content import get_content_summary
+from app.core.markdown import get_content_hash, get_rendered_content
 from app.core.security import get_password_hash
-from app.models.models import User, Tag, BlogPost, Comment, BlogPostTagLink
-from app.schemas.blog_post import BlogPostCreate, BlogPostUpdate
-from app.schemas.comment import CommentCreate, CommentUpdate
-from app.schemas.tag import TagCreate, TagUpdate
+from app.db.comment_events import CommentEventType, publish_comment_event
+from app.db.notifications import CACHE_INVALIDATION_CHANNEL, publish
+from app.db.pagination import CountMode, decode_cursor, paginate
+from app.models.models import (
+    BLOG_POST_SEARCH_CONFIG,
+    User,
+    Tag,
+    BlogPost,
+    Comment,
+    BlogPostTagLink,
+    BlogPostArchiveMonth,
+)
+from app.schemas.blog_post import BlogPostCreate, BlogPostUpdate, TagMatch
+from app.schemas.comment import (
+    CommentCreate,
+    CommentPublicWithUsername,
+    CommentUpdate,
+)
+from app.schemas.tag import TagCreate, TagOrder, TagUpdate
 from app.schemas.user import UserCreate, UserUpdate, UserUpdateMe, UserRegister
 
 
@@ -20,31 +55,88 @@ class BaseCRUD:
     """
 
     MODEL_CLASS = None
+    # Cache namespaces whose reads are affected by the writes of the subclass
+    CACHE_NAMESPACES: tuple[str, ...] = ()
 
     def __init__(self, db: Session):
         self.session = db
 
-    def _create(self, object: Any) -> Any:
+    def _read_through_cache(
+        self, key: tuple[Hashable, ...], loader: Callable[[], Any]
+    ) -> Any:
+        """
+        Read a value from the cache, or load it with `loader` and cache it if it is not cached yet.
+        The first item of `key` is the cache namespace.
+        ORM objects are cached as detached snapshots and merged into the session on a hit without querying the database.
+        """
+        snapshot = cache.get(key)
+        if snapshot is not None:
+            return self._merge_cached(pickle.loads(snapshot))
+        generation = cache.generation(key[0])
+        value = loader()
+        cache.set(key, pickle.dumps(value), generation)
+        return value
+
+    def _merge_cached(self, value: Any) -> Any:
+        """
+        Merge the ORM objects of a cached value into the session.
+        """
+        if isinstance(value, list | tuple):
+            return type(value)(self._merge_cached(item) for item in value)
+        if isinstance(value, dict):
+            return {key: self._merge_cached(item) for key, item in value.items()}
+        if inspect(value, raiseerr=False) is not None:
+            return self.session.merge(value, load=False)
+        return value
+
+    def _invalidate_cache(self) -> None:
+        """
+        Invalidate the cached reads affected by the writes of this class, once the writes are committed.
+        The invalidation is published to the other processes too, see `app.db.notifications`.
+        """
+        if self.CACHE_NAMESPACES:
+            invalidate_on_commit(self.session, *self.CACHE_NAMESPACES)
+            # Let the other processes invalidate their own cache as well
+            publish(
+                self.session,
+                CACHE_INVALIDATION_CHANNEL,
+                {"namespaces": list(self.CACHE_NAMESPACES)},
+            )
+
+    def _create(self, object: Any, update: dict[str, Any] | None = None) -> Any:
         """
         Create a new object in the database.
+        If `update` is provided, its values are set on the new object on top of the ones in `object`.
         """
-        object = self.MODEL_CLASS.model_validate(object, from_attributes=True)
+        object = self.MODEL_CLASS.model_validate(
+            object, from_attributes=True, update=update
+        )
         self.session.add(object)
+        self._invalidate_cache()
         self.session.commit()
         self.session.refresh(object)
         return object
 
-    def _read(self, skip: int, limit: int) -> tuple[int, list[Any]]:
+    def _read(
+        self, skip: int, limit: int, include_count: CountMode = "exact"
+    ) -> tuple[int | None, list[Any]]:
         """
         Read objects from the database with pagination.
+        The total count is computed according to `include_count`, see `paginate`.
         """
-        count_statement = select(func.count()).select_from(self.MODEL_CLASS)
-        count = self.session.exec(count_statement).one()
-
-        statement = select(self.MODEL_CLASS).offset(skip).limit(limit)
-        objects = self.session.exec(statement).all()
+        statement = select(self.MODEL_CLASS)
+        return paginate(self.session, statement, skip, limit, include_count)
 
-        return count, objects
+    def _read_version(self) -> tuple[int, datetime | None]:
+        """
+        Read the number of objects and the time of the latest change, which together identify the version of the table.
+        Only for models with an `updated_at` column. Cached along with the reads of the table, and invalidated with them.
+        """
+        statement = select(func.count(), func.max(self.MODEL_CLASS.updated_at))
+        return self._read_through_cache(
+            (self.CACHE_NAMESPACES[0], "read_version"),
+            lambda: tuple(self.session.exec(statement).one()),
+        )
 
     def _update(
         self, object_db: Any, object_in: Any, force_update_of_cols: list[str] = ()
@@ -59,6 +151,7 @@ class BaseCRUD:
         for col in force_update_of_cols:
             setattr(object_db, col, getattr(object_in, col, None))
         self.session.add(object_db)
+        self._invalidate_cache()
         self.session.commit()
         self.session.refresh(object_db)
         return object_db
@@ -68,6 +161,7 @@ class BaseCRUD:
         Delete an object from the database.
         """
         self.session.delete(object_db)
+        self._invalidate_cache()
         self.session.commit()
 
 
@@ -95,21 +189,41 @@ class UserCRUD(BaseCRUD):
         search_by_email: str | None = None,
         search_by_active: bool | None = None,
         search_by_superuser: bool | None = None,
-    ) -> tuple[int, list[User]]:
+        fuzzy: bool = False,
+        include_count: CountMode = "exact",
+    ) -> tuple[int | None, list[User]]:
         """
         Read users from the database with pagination and optional filtering.
+        If `fuzzy` is True, names and emails are matched by trigram similarity and the most similar users come first.
         """
         base_query = select(self.MODEL_CLASS)
+        similarities = []
 
         # Apply the search filters if specified
         if search_by_name:
-            base_query = base_query.where(
-                self.MODEL_CLASS.name.ilike(f"%{search_by_name}%")
-            )
+            if fuzzy:
+                base_query = base_query.where(
+                    literal(search_by_name).op("<%")(self.MODEL_CLASS.name)
+                )
+                similarities.append(
+                    func.word_similarity(search_by_name, self.MODEL_CLASS.name)
+                )
+            else:
+                base_query = base_query.where(
+                    self.MODEL_CLASS.name.ilike(f"%{search_by_name}%")
+                )
         if search_by_email:
-            base_query = base_query.where(
-                self.MODEL_CLASS.email.ilike(f"%{search_by_email}%")
-            )
+            if fuzzy:
+                base_query = base_query.where(
+                    literal(search_by_email).op("<%")(self.MODEL_CLASS.email)
+                )
+                similarities.append(
+                    func.word_similarity(search_by_email, self.MODEL_CLASS.email)
+                )
+            else:
+                base_query = base_query.where(
+                    self.MODEL_CLASS.email.ilike(f"%{search_by_email}%")
+                )
         if search_by_active is not None:
             base_query = base_query.where(
                 self.MODEL_CLASS.is_active == search_by_active
@@ -119,17 +233,13 @@ class UserCRUD(BaseCRUD):
                 self.MODEL_CLASS.is_superuser == search_by_superuser
             )
 
-        # Count
-        count_statement = select(func.count()).select_from(base_query.subquery())
-        count = self.session.exec(count_statement).one()
-
         # Apply pagination
-        statement = (
-            base_query.order_by(self.MODEL_CLASS.name.asc()).offset(skip).limit(limit)
-        )
-        users = self.session.exec(statement).all()
+        order_by = [self.MODEL_CLASS.name.asc()]
+        if similarities:
+            order_by.insert(0, sum(similarities).desc())
+        statement = base_query.order_by(*order_by)
 
-        return count, users
+        return paginate(self.session, statement, skip, limit, include_count)
 
     def get_user_by_email(self, email: str) -> User | None:
         """
@@ -173,6 +283,7 @@ class UserCRUD(BaseCRUD):
 
 class TagCRUD(BaseCRUD):
     MODEL_CLASS = Tag
+    CACHE_NAMESPACES = ("tags", "blog_posts")
 
     def create_tag(self, tag: TagCreate) -> Tag:
         """
@@ -180,23 +291,135 @@ class TagCRUD(BaseCRUD):
         """
         return self._create(tag)
 
-    def read_tags(self, skip: int, limit: int) -> tuple[int, list[Tag]]:
+    def read_tags(
+        self, skip: int, limit: int, include_count: CountMode = "exact"
+    ) -> tuple[int | None, list[Tag]]:
         """
         Read tags from the database with pagination.
         """
-        return self._read(skip, limit)
+        return self._read_through_cache(
+            ("tags", "read_tags", skip, limit, include_count),
+            lambda: self._read(skip, limit, include_count),
+        )
+
+    def read_tags_with_counts(
+        self,
+        skip: int,
+        limit: int,
+        order: TagOrder = "id",
+        include_count: CountMode = "exact",
+    ) -> tuple[int | None, list[tuple[Tag, int]]]:
+        """
+        Read tags from the database with pagination, along with the number of blog posts of each tag.
+        The blog posts are counted with a single aggregate over the link table, not per tag.
+        With `order=popular` the tags with the most blog posts come first.
+        """
+        return self._read_through_cache(
+            ("tags", "read_tags_with_counts", skip, limit, order, include_count),
+            lambda: self._read_tags_with_counts(skip, limit, order, include_count),
+        )
 
-    def read_tag_with_blog_posts(self, tag_id: int) -> Tag:
+    def _read_tags_with_counts(
+        self, skip: int, limit: int, order: TagOrder, include_count: CountMode
+    ) -> tuple[int | None, list[tuple[Tag, int]]]:
         """
-        Read a tag by its ID and include its associated blog posts.
+        Query the tags read by `read_tags_with_counts`, bypassing the cache.
         """
-        statement = (
-            select(self.MODEL_CLASS)
-            .options(joinedload(self.MODEL_CLASS.blog_posts))
-            .where(self.MODEL_CLASS.id == tag_id)
+        blog_post_counts = (
+            select(
+                BlogPostTagLink.tag_id,
+                func.count().label("blog_post_count"),
+            )
+            .group_by(BlogPostTagLink.tag_id)
+            .subquery()
         )
-        tag = self.session.exec(statement).first()
-        return tag
+        blog_post_count = func.coalesce(blog_post_counts.c.blog_post_count, 0)
+        statement = select(self.MODEL_CLASS, blog_post_count).outerjoin(
+            blog_post_counts, blog_post_counts.c.tag_id == self.MODEL_CLASS.id
+        )
+        if order == "popular":
+            statement = statement.order_by(
+                blog_post_count.desc(), self.MODEL_CLASS.name, self.MODEL_CLASS.id
+            )
+        else:
+            statement = statement.order_by(self.MODEL_CLASS.id)
+        count, rows = paginate(
+            self.session,
+            statement,
+            skip,
+            limit,
+            include_count,
+            count_statement=select(self.MODEL_CLASS),
+        )
+        return count, [tuple(row) for row in rows]
+
+    def read_tags_version(self) -> tuple[int, datetime | None]:
+        """
+        Read the version of the tags, without reading the tags themselves.
+        """
+        return self._read_version()
+
+    def get_tags_by_ids(self, tag_ids: list[int]) -> list[Tag]:
+        """
+        Get the tags with the given IDs in a single query, in the order of `tag_ids`.
+        Raises a 404 error listing all the IDs that do not exist.
+        """
+        tag_ids = list(dict.fromkeys(tag_ids))
+        if not tag_ids:
+            return []
+        statement = select(self.MODEL_CLASS).where(self.MODEL_CLASS.id.in_(tag_ids))
+        tags_by_id = {tag.id: tag for tag in self.session.exec(statement).all()}
+        missing_ids = [tag_id for tag_id in tag_ids if tag_id not in tags_by_id]
+        if len(missing_ids) == 1:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Tag with ID {missing_ids[0]} not found",
+            )
+        if missing_ids:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Tags with IDs {', '.join(map(str, missing_ids))} not found",
+            )
+        return [tags_by_id[tag_id] for tag_id in tag_ids]
+
+    def upsert_tags_by_names(self, tag_names: list[str]) -> list[Tag]:
+        """
+        Get the tags with the given names, creating the ones that do not exist yet, in bulk.
+        Names are matched case-insensitively against the existing tags, new tags keep the given spelling.
+        The new tags are part of the current transaction, it is up to the caller to commit them.
+        """
+        names_by_key = {}
+        for tag_name in tag_names:
+            names_by_key.setdefault(tag_name.lower(), tag_name)
+        if not names_by_key:
+            return []
+        statement = select(self.MODEL_CLASS).where(
+            func.lower(self.MODEL_CLASS.name).in_(names_by_key)
+        )
+        tags_by_key = {
+            tag.name.lower(): tag for tag in self.session.exec(statement).all()
+        }
+        new_names = [
+            name for key, name in names_by_key.items() if key not in tags_by_key
+        ]
+        if new_names:
+            now = datetime.now(UTC)
+            statement = (
+                insert(self.MODEL_CLASS)
+                .values([{"name": name, "updated_at": now} for name in new_names])
+                .on_conflict_do_nothing(index_elements=["name"])
+                .returning(self.MODEL_CLASS)
+            )
+            created_tags = self.session.exec(statement).scalars().all()
+            if len(created_tags) < len(new_names):
+                # Created concurrently by another transaction in the meantime
+                statement = select(self.MODEL_CLASS).where(
+                    self.MODEL_CLASS.name.in_(new_names)
+                )
+                created_tags = self.session.exec(statement).all()
+            tags_by_key.update((tag.name.lower(), tag) for tag in created_tags)
+            self._invalidate_cache()
+        return [tags_by_key[key] for key in names_by_key if key in tags_by_key]
 
     def get_tag_by_name(self, tag_name: str) -> Tag | None:
         """
@@ -210,52 +433,109 @@ class TagCRUD(BaseCRUD):
         """
         Update an existing tag in the database.
         """
+        tag_db.updated_at = datetime.now(UTC)
+        self._touch_blog_posts(
+            tag_db.id,
+            tag_names=func.array_replace(
+                BlogPost.tag_names, tag_db.name.lower(), tag_in.name.lower()
+            ),
+        )
         return self._update(tag_db, tag_in)
 
     def delete_tag(self, tag_db: Tag) -> None:
         """
         Delete a tag from the database.
         """
+        self._touch_blog_posts(
+            tag_db.id,
+            tag_names=func.array_remove(BlogPost.tag_names, tag_db.name.lower()),
+        )
         self._delete(tag_db)
 
-    def delete_orphaned_tags(self) -> int:
+    def _touch_blog_posts(self, tag_id: int, tag_names: Any) -> None:
         """
-        Delete tags that have no associated blog posts.
+        Mark the blog posts of a tag as changed, as their representation includes the tag.
+        Their tag names are set to the `tag_names` expression in the same statement.
         """
-        # Tags with no blog posts
-        orphaned_tags_statement = (
-            select(self.MODEL_CLASS)
-            .outerjoin(BlogPostTagLink, self.MODEL_CLASS.id == BlogPostTagLink.tag_id)
-            .where(BlogPostTagLink.tag_id.is_(None))
+        statement = (
+            update(BlogPost)
+            .where(
+                BlogPost.id.in_(
+                    select(BlogPostTagLink.blog_post_id).where(
+                        BlogPostTagLink.tag_id == tag_id
+                    )
+                )
+            )
+            .values(updated_at=datetime.now(UTC), tag_names=tag_names)
         )
-        orphaned_tags = self.session.exec(orphaned_tags_statement).all()
+        self.session.exec(statement)
 
-        # Delete orphaned tags
-        for tag in orphaned_tags:
-            self._delete(tag)
+    def delete_orphaned_tags(self, tag_ids: list[int]) -> int:
+        """
+        Delete the tags among `tag_ids` that have no associated blog posts, in a single statement.
+        Other tags without blog posts, like the ones just created, are kept.
+        The deletion is part of the current transaction, it is up to the caller to commit it.
+        """
+        if not tag_ids:
+            return 0
+        statement = (
+            delete(self.MODEL_CLASS)
+            .where(
+                self.MODEL_CLASS.id.in_(tag_ids),
+                ~exists().where(BlogPostTagLink.tag_id == self.MODEL_CLASS.id),
+            )
+            .returning(self.MODEL_CLASS.id)
+        )
+        deleted_tag_ids = self.session.exec(statement).scalars().all()
+        if deleted_tag_ids:
+            self._invalidate_cache()
 
-        return len(orphaned_tags)
+        return len(deleted_tag_ids)
 
 
 class BlogPostCRUD(BaseCRUD):
     MODEL_CLASS = BlogPost
+    CACHE_NAMESPACES = ("blog_posts", "tags")
+    # Marks the search matches in the headlines until the content around them is escaped
+    HEADLINE_START_SEL = "\ue000"
+    HEADLINE_STOP_SEL = "\ue001"
 
     def create_blog_post(self, blog_post: BlogPostCreate) -> BlogPost:
         """
         Create a new blog post and save it to the database.
         """
-        tags = []
-        if blog_post.tags:
-            for tag_id in blog_post.tags:
-                tag = self.session.get(Tag, tag_id)
-                if not tag:
-                    raise HTTPException(
-                        status_code=status.HTTP_404_NOT_FOUND,
-                        detail=f"Tag with ID {tag_id} not found",
-                    )
-                tags.append(tag)
-        blog_post.tags = tags
-        return self._create(blog_post)
+        tags = self._resolve_tags(blog_post.tags, blog_post.tag_names)
+        self._update_archive(blog_post.publication_date, 1)
+        return self._create(
+            blog_post.model_copy(update={"tags": tags}),
+            update={
+                **get_content_summary(blog_post.content),
+                **get_rendered_content(blog_post.content),
+                "tag_names": self._get_tag_names(tags),
+            },
+        )
+
+    @staticmethod
+    def _get_tag_names(tags: list[Tag]) -> list[str]:
+        """
+        Get the tag names kept on a blog post, lowercased like the tag names it is filtered by.
+        """
+        return sorted({tag.name.lower() for tag in tags})
+
+    def _resolve_tags(self, tag_ids: list[int], tag_names: list[str]) -> list[Tag]:
+        """
+        Resolve the tags of a blog post from tag IDs and tag names in bulk.
+        Tags given by name are created if they do not exist yet, as part of the current transaction.
+        """
+        tag_crud = TagCRUD(self.session)
+        tags = tag_crud.get_tags_by_ids(tag_ids)
+        tag_ids = {tag.id for tag in tags}
+        tags.extend(
+            tag
+            for tag in tag_crud.upsert_tags_by_names(tag_names)
+            if tag.id not in tag_ids
+        )
+        return tags
 
     def read_blog_posts(
         self,
@@ -264,45 +544,348 @@ class BlogPostCRUD(BaseCRUD):
         search_by: str | None = None,
         search_value: str | None = None,
         featured_only: bool = False,
-    ) -> tuple[int, list[BlogPost]]:
-        """
-        Read blog posts from the database with pagination and optional filtering.
-        """
-        base_query = select(self.MODEL_CLASS)
+        tag_id: int | None = None,
+        tags: list[str] | None = None,
+        tag_match: TagMatch = "all",
+        published_from: datetime | None = None,
+        published_to: datetime | None = None,
+        cursor: str | None = None,
+        include_count: CountMode = "exact",
+    ) -> tuple[int | None, list[BlogPost]]:
+        """
+        Read blog posts from the database with pagination and optional filtering, all the given filters are combined.
+        If `tag_id` is provided, only the blog posts of that tag are read.
+        If `tags` is provided, only the blog posts having all of these tag names are read, or any of them with `tag_match=any`.
+        If `published_from` or `published_to` is provided, only the blog posts published from (inclusive) or until (exclusive) then are read.
+        The content of the blog posts and its rendering are not loaded, listings use the precomputed excerpt instead.
+        If `cursor` is provided, keyset pagination on (publication_date, id) is used and `skip` is ignored.
+        Full-text and fuzzy title search results are ordered by relevance, so they can only be paginated with `skip`.
+        """
+        return self._read_through_cache(
+            (
+                "blog_posts",
+                "read_blog_posts",
+                skip,
+                limit,
+                search_by,
+                search_value,
+                featured_only,
+                tag_id,
+                tuple(tags) if tags else None,
+                tag_match,
+                published_from,
+                published_to,
+                cursor,
+                include_count,
+            ),
+            lambda: self._read_blog_posts(
+                skip,
+                limit,
+                search_by,
+                search_value,
+                featured_only,
+                tag_id,
+                tags,
+                tag_match,
+                published_from,
+                published_to,
+                cursor,
+                include_count,
+            ),
+        )
 
-        # Apply the search filters if specified
+    def _read_blog_posts(
+        self,
+        skip: int,
+        limit: int,
+        search_by: str | None = None,
+        search_value: str | None = None,
+        featured_only: bool = False,
+        tag_id: int | None = None,
+        tags: list[str] | None = None,
+        tag_match: TagMatch = "all",
+        published_from: datetime | None = None,
+        published_to: datetime | None = None,
+        cursor: str | None = None,
+        include_count: CountMode = "exact",
+    ) -> tuple[int | None, list[BlogPost]]:
+        """
+        Query the blog posts read by `read_blog_posts`, bypassing the cache.
+        """
+        base_query = select(self.MODEL_CLASS).where(
+            *self._get_blog_post_filters(
+                search_by,
+                search_value,
+                featured_only,
+                tag_id,
+                tags,
+                tag_match,
+                published_from,
+                published_to,
+            )
+        )
+        order_by = [
+            self.MODEL_CLASS.publication_date.desc(),
+            self.MODEL_CLASS.id.desc(),
+        ]
+        # Full-text and fuzzy search results are ordered by relevance first
+        if search_by in ("fuzzy", "fulltext") and search_value:
+            if cursor:
+                search_name = "fuzzy" if search_by == "fuzzy" else "full-text"
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Cursor pagination is not supported for {search_name} search",
+                )
+            if search_by == "fuzzy":
+                relevance = func.word_similarity(search_value, self.MODEL_CLASS.title)
+            else:
+                relevance = func.ts_rank_cd(
+                    self.MODEL_CLASS.__table__.c.search_vector,
+                    self._get_search_query(search_value),
+                )
+            order_by.insert(0, relevance.desc())
+
+        # Apply pagination
+        statement = base_query.options(
+            defer(self.MODEL_CLASS.content),
+            defer(self.MODEL_CLASS.content_html),
+            defer(self.MODEL_CLASS.toc),
+            selectinload(self.MODEL_CLASS.tags),
+        ).order_by(*order_by)
+        if cursor:
+            # The count covers all the matching blog posts, not only the ones after the cursor
+            publication_date, blog_post_id = decode_cursor(cursor, (datetime, int))
+            statement = statement.where(
+                tuple_(self.MODEL_CLASS.publication_date, self.MODEL_CLASS.id)
+                < tuple_(publication_date, blog_post_id)
+            )
+            return paginate(
+                self.session,
+                statement,
+                0,
+                limit,
+                include_count,
+                count_statement=base_query,
+            )
+
+        return paginate(self.session, statement, skip, limit, include_count)
+
+    def read_blog_post_facets(
+        self,
+        search_by: str | None = None,
+        search_value: str | None = None,
+        featured_only: bool = False,
+        tags: list[str] | None = None,
+        tag_match: TagMatch = "all",
+        published_from: datetime | None = None,
+        published_to: datetime | None = None,
+    ) -> dict[str, list[tuple[Any, int]]]:
+        """
+        Count the blog posts matching the filters of `read_blog_posts` per tag name and per publication year.
+        Both facets are computed by a single statement with grouping sets over the matching blog posts.
+        Returns the (tag name, count) pairs under `tags`, most used first, and the (year, count) pairs under `years`, latest first.
+        """
+        return self._read_through_cache(
+            (
+                "blog_posts",
+                "read_blog_post_facets",
+                search_by,
+                search_value,
+                featured_only,
+                tuple(tags) if tags else None,
+                tag_match,
+                published_from,
+                published_to,
+            ),
+            lambda: self._read_blog_post_facets(
+                search_by,
+                search_value,
+                featured_only,
+                tags,
+                tag_match,
+                published_from,
+                published_to,
+            ),
+        )
+
+    def _read_blog_post_facets(
+        self,
+        search_by: str | None,
+        search_value: str | None,
+        featured_only: bool,
+        tags: list[str] | None,
+        tag_match: TagMatch,
+        published_from: datetime | None,
+        published_to: datetime | None,
+    ) -> dict[str, list[tuple[Any, int]]]:
+        """
+        Query the facets read by `read_blog_post_facets`, bypassing the cache.
+        """
+        filtered = (
+            select(
+                self.MODEL_CLASS.id,
+                self.MODEL_CLASS.tag_names,
+                cast(
+                    func.extract("year", self.MODEL_CLASS.publication_date), Integer
+                ).label("year"),
+            )
+            .where(
+                *self._get_blog_post_filters(
+                    search_by,
+                    search_value,
+                    featured_only,
+                    None,
+                    tags,
+                    tag_match,
+                    published_from,
+                    published_to,
+                )
+            )
+            .cte("filtered")
+        )
+        # Blog posts without tags are kept by the outer join, so they are counted in their year
+        tag_names = func.unnest(filtered.c.tag_names).table_valued("name").lateral()
+        statement = (
+            select(
+                func.grouping(tag_names.c.name).label("is_year"),
+                tag_names.c.name,
+                filtered.c.year,
+                func.count(filtered.c.id.distinct()).label("blog_post_count"),
+            )
+            .select_from(filtered.outerjoin(tag_names, true()))
+            .group_by(
+                func.grouping_sets(tuple_(tag_names.c.name), tuple_(filtered.c.year))
+            )
+        )
+        # The tag names are kept lowercased, the facets show the names of the tags
+        grouped = statement.subquery()
+        display_name = (
+            select(Tag.name)
+            .where(func.lower(Tag.name) == grouped.c.name)
+            .order_by(Tag.id)
+            .limit(1)
+            .scalar_subquery()
+        )
+        statement = select(
+            grouped.c.is_year,
+            func.coalesce(display_name, grouped.c.name),
+            grouped.c.year,
+            grouped.c.blog_post_count,
+        )
+        facets = {"tags": [], "years": []}
+        for is_year, tag_name, year, count in self.session.exec(statement).all():
+            if is_year:
+                facets["years"].append((year, count))
+            elif tag_name is not None:
+                facets["tags"].append((tag_name, count))
+        facets["tags"].sort(key=lambda facet: (-facet[1], facet[0]))
+        facets["years"].sort(reverse=True)
+        return facets
+
+    def _get_blog_post_filters(
+        self,
+        search_by: str | None,
+        search_value: str | None,
+        featured_only: bool,
+        tag_id: int | None,
+        tags: list[str] | None,
+        tag_match: TagMatch,
+        published_from: datetime | None,
+        published_to: datetime | None,
+    ) -> list[Any]:
+        """
+        Build the conditions selecting the blog posts that match all the given filters.
+        """
+        filters = []
         if featured_only:
-            base_query = base_query.where(self.MODEL_CLASS.featured.is_(True))
+            filters.append(self.MODEL_CLASS.featured.is_(True))
+        if tag_id is not None:
+            filters.append(
+                exists().where(
+                    BlogPostTagLink.blog_post_id == self.MODEL_CLASS.id,
+                    BlogPostTagLink.tag_id == tag_id,
+                )
+            )
+        if tags:
+            # Served by the GIN index on the tag names, without joining the tags
+            # Tag names are matched case-insensitively, like everywhere else
+            tags = [tag.lower() for tag in tags]
+            if tag_match == "any":
+                filters.append(self.MODEL_CLASS.tag_names.overlap(tags))
+            else:
+                filters.append(self.MODEL_CLASS.tag_names.contains(tags))
+        if published_from is not None:
+            filters.append(self.MODEL_CLASS.publication_date >= published_from)
+        if published_to is not None:
+            filters.append(self.MODEL_CLASS.publication_date < published_to)
         if search_by and search_value:
             if search_by == "tag":
-                base_query = (
-                    base_query.join(self.MODEL_CLASS.tags)
-                    .where(Tag.name.ilike(f"{search_value}"))
-                    .distinct()
+                # Names are matched ignoring case, exact matches use the index on lower(name)
+                if "%" in search_value:
+                    tag_filter = Tag.name.ilike(search_value)
+                else:
+                    tag_filter = func.lower(Tag.name) == search_value.lower()
+                filters.append(
+                    exists().where(
+                        BlogPostTagLink.blog_post_id == self.MODEL_CLASS.id,
+                        BlogPostTagLink.tag_id == Tag.id,
+                        tag_filter,
+                    )
                 )
             elif search_by == "title":
-                base_query = base_query.where(
-                    self.MODEL_CLASS.title.ilike(f"%{search_value}%")
-                )
+                filters.append(self.MODEL_CLASS.title.ilike(f"%{search_value}%"))
             elif search_by == "content":
-                base_query = base_query.where(
-                    self.MODEL_CLASS.content.ilike(f"%{search_value}%")
+                filters.append(self.MODEL_CLASS.content.ilike(f"%{search_value}%"))
+            elif search_by == "fuzzy":
+                filters.append(literal(search_value).op("<%")(self.MODEL_CLASS.title))
+            elif search_by == "fulltext":
+                search_vector = self.MODEL_CLASS.__table__.c.search_vector
+                filters.append(
+                    search_vector.bool_op("@@")(self._get_search_query(search_value))
                 )
-
-        # Count
-        count_statement = select(func.count()).select_from(base_query.subquery())
-        count = self.session.exec(count_statement).one()
-
-        # Apply pagination
-        statement = (
-            base_query.options(selectinload(self.MODEL_CLASS.tags))
-            .order_by(self.MODEL_CLASS.publication_date.desc())
-            .offset(skip)
-            .limit(limit)
+        return filters
+
+    def read_blog_post_headlines(
+        self, blog_post_ids: list[int], search_value: str
+    ) -> dict[int, str]:
+        """
+        Build the highlighted full-text search snippets of the given blog posts.
+        Only meant for the current page of results, as `ts_headline` has to process the whole content.
+        The snippets are HTML: the content is escaped, the matches are wrapped in `<mark>` tags.
+        """
+        if not blog_post_ids:
+            return {}
+        statement = select(
+            self.MODEL_CLASS.id,
+            func.ts_headline(
+                BLOG_POST_SEARCH_CONFIG,
+                self.MODEL_CLASS.content,
+                self._get_search_query(search_value),
+                f"StartSel={self.HEADLINE_START_SEL}, StopSel={self.HEADLINE_STOP_SEL}, "
+                "MaxFragments=2, MaxWords=30, MinWords=10",
+            ),
+        ).where(self.MODEL_CLASS.id.in_(blog_post_ids))
+        return self._read_through_cache(
+            (
+                "blog_posts",
+                "read_blog_post_headlines",
+                tuple(blog_post_ids),
+                search_value,
+            ),
+            lambda: {
+                blog_post_id: html.escape(headline)
+                .replace(self.HEADLINE_START_SEL, "<mark>")
+                .replace(self.HEADLINE_STOP_SEL, "</mark>")
+                for blog_post_id, headline in self.session.exec(statement).all()
+            },
         )
-        blog_posts = self.session.exec(statement).all()
 
-        return count, blog_posts
+    @staticmethod
+    def _get_search_query(search_value: str) -> Any:
+        """
+        Convert the user's search input into a full-text search query.
+        """
+        return func.websearch_to_tsquery(BLOG_POST_SEARCH_CONFIG, search_value)
 
     def read_blog_post_with_tags(self, blog_post_url: str) -> BlogPost:
         """
@@ -313,8 +896,28 @@ class BlogPostCRUD(BaseCRUD):
             .options(joinedload(self.MODEL_CLASS.tags))
             .where(self.MODEL_CLASS.url == blog_post_url)
         )
-        blog_post = self.session.exec(statement).first()
-        return blog_post
+        return self._read_through_cache(
+            ("blog_posts", "read_blog_post_with_tags", blog_post_url),
+            lambda: self.session.exec(statement).first(),
+        )
+
+    def read_blog_post_version(self, blog_post_url: str) -> datetime | None:
+        """
+        Read the time of the latest change of a blog post by its URL, without reading the blog post itself.
+        """
+        statement = select(self.MODEL_CLASS.updated_at).where(
+            self.MODEL_CLASS.url == blog_post_url
+        )
+        return self._read_through_cache(
+            ("blog_posts", "read_blog_post_version", blog_post_url),
+            lambda: self.session.exec(statement).first(),
+        )
+
+    def read_blog_posts_version(self) -> tuple[int, datetime | None]:
+        """
+        Read the version of the blog posts, without reading the blog posts themselves.
+        """
+        return self._read_version()
 
     def get_blog_post_by_title(self, blog_title: str) -> BlogPost | None:
         """
@@ -337,165 +940,517 @@ class BlogPostCRUD(BaseCRUD):
     ) -> BlogPost:
         """
         Update an existing blog post in the database.
+        Orphaned tags are cleaned up in the same transaction if the tags of the blog post have changed.
         """
-        if blog_post_in.tags is not None:
-            tags = []
-            if blog_post_in.tags:
-                for tag_id in blog_post_in.tags:
-                    tag = self.session.get(Tag, tag_id)
-                    if not tag:
-                        raise HTTPException(
-                            status_code=status.HTTP_404_NOT_FOUND,
-                            detail=f"Tag with ID {tag_id} not found",
-                        )
-                    tags.append(tag)
-            blog_post_in.tags = tags
-
-        blog_post_data = blog_post_in.model_dump(exclude_unset=True, exclude=["tags"])
+        tags_changed = False
+        if blog_post_in.tags is not None or blog_post_in.tag_names is not None:
+            tags = self._resolve_tags(
+                blog_post_in.tags or [], blog_post_in.tag_names or []
+            )
+            removed_tag_ids = {tag.id for tag in blog_post_db.tags} - {
+                tag.id for tag in tags
+            }
+            tags_changed = {tag.id for tag in tags} != {
+                tag.id for tag in blog_post_db.tags
+            }
+
+        blog_post_data = blog_post_in.model_dump(
+            exclude_unset=True, exclude=["tags", "tag_names"]
+        )
+        content = blog_post_data.get("content")
+        # The content is only rendered again if it has changed
+        if (
+            content is not None
+            and get_content_hash(content) != blog_post_db.content_hash
+        ):
+            blog_post_data.update(get_content_summary(content))
+            blog_post_data.update(get_rendered_content(content))
+        if tags_changed:
+            blog_post_data["tag_names"] = self._get_tag_names(tags)
+        publication_date = blog_post_data.get("publication_date")
+        if publication_date is not None:
+            # Moves the blog post to the month of its new publication date in the archive
+            self._update_archive(blog_post_db.publication_date, -1)
+            self._update_archive(publication_date, 1)
+        blog_post_data["updated_at"] = datetime.now(UTC)
         blog_post_db.sqlmodel_update(blog_post_data)
-        if blog_post_in.tags is not None:
-            blog_post_db.tags = blog_post_in.tags
+        if tags_changed:
+            blog_post_db.tags = tags
         self.session.add(blog_post_db)
+        if tags_changed:
+            self.session.flush()
+            # Clean up the tags removed from the blog post that no other blog post has
+            _ = TagCRUD(self.session).delete_orphaned_tags(list(removed_tag_ids))
+        self._invalidate_cache()
         self.session.commit()
         self.session.refresh(blog_post_db)
 
-        # Clean up orphaned tags after updating blog post tags
-        if blog_post_in.tags is not None:
-            _ = TagCRUD(self.session).delete_orphaned_tags()
-
         return blog_post_db
 
     def delete_blog_post(self, blog_post_db: BlogPost) -> None:
         """
-        Delete a blog post from the database and clean up orphaned tags if any.
+        Delete a blog post from the database and clean up orphaned tags if any, in the same transaction.
         """
-        self._delete(blog_post_db)
+        tag_ids = [tag.id for tag in blog_post_db.tags]
+        self._update_archive(blog_post_db.publication_date, -1)
+        self.session.delete(blog_post_db)
+        if tag_ids:
+            self.session.flush()
+            # Clean up the tags of the blog post that no other blog post has
+            _ = TagCRUD(self.session).delete_orphaned_tags(tag_ids)
+        self._invalidate_cache()
+        self.session.commit()
 
-        # Clean up orphaned tags after deleting the blog post
-        _ = TagCRUD(self.session).delete_orphaned_tags()
+    def read_home(
+        self, featured_limit: int, recent_limit: int, tags_limit: int
+    ) -> dict[str, Any]:
+        """
+        Read everything the home page shows, cached as a whole.
+        Returns the latest featured blog posts under `featured`, the latest blog posts under `recent` with their total count
+        under `recent_count`, and the most used tags with their blog post counts under `tags`.
+        """
+        return self._read_through_cache(
+            ("blog_posts", "read_home", featured_limit, recent_limit, tags_limit),
+            lambda: self._read_home(featured_limit, recent_limit, tags_limit),
+        )
+
+    def _read_home(
+        self, featured_limit: int, recent_limit: int, tags_limit: int
+    ) -> dict[str, Any]:
+        """
+        Query the home page read by `read_home`, bypassing the cache.
+        """
+        # Both pages are read like the first page of the blog post listing
+        _, featured = self._read_blog_posts(
+            0, featured_limit, featured_only=True, include_count="none"
+        )
+        recent_count, recent = self._read_blog_posts(0, recent_limit)
+        _, tags = TagCRUD(self.session)._read_tags_with_counts(
+            0, tags_limit, "popular", "none"
+        )
+        return {
+            "featured": featured,
+            "recent": recent,
+            "recent_count": recent_count,
+            "tags": tags,
+        }
+
+    def read_archive(self) -> list[tuple[int, int, int]]:
+        """
+        Read the number of blog posts published per month, as (year, month, count) tuples, latest first.
+        Read from the maintained monthly rollups instead of the blog posts, months without blog posts are left out.
+        """
+        statement = (
+            select(
+                BlogPostArchiveMonth.year,
+                BlogPostArchiveMonth.month,
+                BlogPostArchiveMonth.blog_post_count,
+            )
+            .where(BlogPostArchiveMonth.blog_post_count > 0)
+            .order_by(
+                BlogPostArchiveMonth.year.desc(), BlogPostArchiveMonth.month.desc()
+            )
+        )
+        return self._read_through_cache(
+            ("blog_posts", "read_archive"),
+            lambda: [tuple(row) for row in self.session.exec(statement).all()],
+        )
+
+    def _update_archive(self, publication_date: datetime, delta: int) -> None:
+        """
+        Add `delta` to the number of blog posts published in the month of `publication_date`, as part of the current transaction.
+        The month is computed by PostgreSQL, the same way as when the publication date is stored.
+        """
+        publication_date = cast(literal(publication_date), DateTime())
+        statement = insert(BlogPostArchiveMonth).from_select(
+            ["year", "month", "blog_post_count"],
+            select(
+                cast(func.extract("year", publication_date), Integer),
+                cast(func.extract("month", publication_date), Integer),
+                literal(delta),
+            ),
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=["year", "month"],
+            set_={
+                "blog_post_count": BlogPostArchiveMonth.blog_post_count
+                + statement.excluded.blog_post_count
+            },
+        )
+        self.session.exec(statement)
+
+    def reconcile_comment_counters(self) -> list[int]:
+        """
+        Recompute the comment counters of the blog posts from their comments, repairing any drift.
+        Returns the IDs of the blog posts whose counters were wrong.
+        """
+        counters = (
+            select(
+                self.MODEL_CLASS.id,
+                func.count(Comment.id).label("comment_count"),
+                func.max(Comment.comment_date).label("last_comment_at"),
+            )
+            .outerjoin(Comment, Comment.blog_post_id == self.MODEL_CLASS.id)
+            .group_by(self.MODEL_CLASS.id)
+            .subquery()
+        )
+        statement = (
+            update(self.MODEL_CLASS)
+            .where(
+                self.MODEL_CLASS.id == counters.c.id,
+                (self.MODEL_CLASS.comment_count != counters.c.comment_count)
+                | self.MODEL_CLASS.last_comment_at.is_distinct_from(
+                    counters.c.last_comment_at
+                ),
+            )
+            .values(
+                comment_count=counters.c.comment_count,
+                last_comment_at=counters.c.last_comment_at,
+                updated_at=datetime.now(UTC),
+            )
+            .returning(self.MODEL_CLASS.id)
+        )
+        blog_post_ids = list(self.session.exec(statement).scalars().all())
+        if blog_post_ids:
+            self._invalidate_cache()
+        self.session.commit()
+        return blog_post_ids
 
 
 class CommentCRUD(BaseCRUD):
     MODEL_CLASS = Comment
+    # The blog posts include their comment counters
+    CACHE_NAMESPACES = ("blog_posts",)
 
     def create_comment(
         self, comment: CommentCreate, user_id: uuid.UUID, blog_post_id: int
     ) -> Comment:
         """
         Create a new comment on a blog post and save it to the database.
+        The comment counters of the blog post are updated in the same transaction.
         """
         comment = Comment.model_validate(
             comment, update={"user_id": user_id, "blog_post_id": blog_post_id}
         )
         self.session.add(comment)
+        # Incremented in the database, so concurrent comments are all counted
+        statement = (
+            update(BlogPost)
+            .where(BlogPost.id == blog_post_id)
+            .values(
+                comment_count=BlogPost.comment_count + 1,
+                last_comment_at=func.greatest(
+                    BlogPost.last_comment_at, comment.comment_date
+                ),
+                updated_at=datetime.now(UTC),
+            )
+        )
+        self.session.exec(statement)
+        if comment.reply_to is not None:
+            self._update_reply_count(comment.reply_to, 1)
+        self._publish_comment_event("created", comment)
+        self._invalidate_cache()
         self.session.commit()
         self.session.refresh(comment)
         return comment
 
-    def read_comments(self, skip: int, limit: int) -> tuple[int, list[Comment]]:
+    def read_comments(
+        self, skip: int, limit: int, include_count: CountMode = "exact"
+    ) -> tuple[int | None, list[Comment]]:
         """
         Read comments from the database with pagination.
         """
-        return self._read(skip, limit)
+        return self._read(skip, limit, include_count)
 
     def read_comments_with_username(
-        self, skip: int, limit: int
-    ) -> tuple[int, list[Comment]]:
+        self, skip: int, limit: int, include_count: CountMode = "exact"
+    ) -> tuple[int | None, list[Comment]]:
         """
         Read comments from the database with pagination and include the username of the user who wrote the comment.
         """
-        count_statement = select(func.count()).select_from(self.MODEL_CLASS)
-        count = self.session.exec(count_statement).one()
-
-        statement = (
-            select(self.MODEL_CLASS)
-            .options(joinedload(self.MODEL_CLASS.user))
-            .offset(skip)
-            .limit(limit)
-        )
-        comments = self.session.exec(statement).all()
-
-        return count, comments
+        statement = select(self.MODEL_CLASS).options(joinedload(self.MODEL_CLASS.user))
+        return paginate(self.session, statement, skip, limit, include_count)
 
     def read_comments_for_blog_post(
-        self, blog_post_id: int, skip: int, limit: int
-    ) -> tuple[int, list[Comment]]:
+        self,
+        blog_post_id: int,
+        skip: int,
+        limit: int,
+        cursor: str | None = None,
+        include_count: CountMode = "exact",
+    ) -> tuple[int | None, list[Comment]]:
         """
-        Read comments for a specific blog post with pagination.
+        Read comments for a specific blog post with pagination, along with the users who wrote them.
+        The page contains the top-level comments, while the count includes the replies as well.
+        If `cursor` is provided, keyset pagination on (comment_date, id) is used and `skip` is ignored.
         """
-        count_statement = (
-            select(func.count())
-            .select_from(self.MODEL_CLASS)
-            .where(self.MODEL_CLASS.blog_post_id == blog_post_id)
+        count_statement = select(self.MODEL_CLASS).where(
+            self.MODEL_CLASS.blog_post_id == blog_post_id
         )
-        count = self.session.exec(count_statement).one()
-
         statement = (
             select(self.MODEL_CLASS)
+            .options(joinedload(self.MODEL_CLASS.user))
             .where(
                 and_(
                     self.MODEL_CLASS.blog_post_id == blog_post_id,
                     self.MODEL_CLASS.reply_to.is_(None),
                 )
             )
-            .order_by(self.MODEL_CLASS.comment_date.desc())
-            .offset(skip)
-            .limit(limit)
+            .order_by(self.MODEL_CLASS.comment_date.desc(), self.MODEL_CLASS.id.desc())
+        )
+        if cursor:
+            comment_date, comment_id = decode_cursor(cursor, (datetime, int))
+            statement = statement.where(
+                tuple_(self.MODEL_CLASS.comment_date, self.MODEL_CLASS.id)
+                < tuple_(comment_date, comment_id)
+            )
+            skip = 0
+
+        return paginate(
+            self.session,
+            statement,
+            skip,
+            limit,
+            include_count,
+            count_statement=count_statement,
         )
-        objects = self.session.exec(statement).all()
-
-        return count, objects
 
-    def read_comment_replies(self, comment_id: int) -> tuple[int, list[Comment]]:
+    def read_comment_replies(
+        self,
+        comment_id: int,
+        limit: int = 100,
+        cursor: str | None = None,
+        include_count: CountMode = "exact",
+    ) -> tuple[int | None, list[Comment]]:
         """
-        Read replies for a specific comment.
+        Read replies for a specific comment in chronological order, along with the users who wrote them.
+        If `cursor` is provided, the replies after it are read, the count covers all the replies though.
         """
-        count_statement = (
-            select(func.count())
-            .select_from(self.MODEL_CLASS)
-            .where(self.MODEL_CLASS.reply_to == comment_id)
+        count_statement = select(self.MODEL_CLASS).where(
+            self.MODEL_CLASS.reply_to == comment_id
         )
-        count = self.session.exec(count_statement).one()
-
         statement = (
             select(self.MODEL_CLASS)
+            .options(joinedload(self.MODEL_CLASS.user))
             .where(self.MODEL_CLASS.reply_to == comment_id)
-            .order_by(self.MODEL_CLASS.comment_date.asc())
+            .order_by(self.MODEL_CLASS.comment_date.asc(), self.MODEL_CLASS.id.asc())
         )
-        objects = self.session.exec(statement).all()
+        if cursor:
+            comment_date, reply_id = decode_cursor(cursor, (datetime, int))
+            statement = statement.where(
+                tuple_(self.MODEL_CLASS.comment_date, self.MODEL_CLASS.id)
+                > tuple_(comment_date, reply_id)
+            )
 
-        return count, objects
+        return paginate(
+            self.session,
+            statement,
+            0,
+            limit,
+            include_count,
+            count_statement=count_statement,
+        )
+
+    def read_replies_for_comments(
+        self, comment_ids: list[int], limit: int | None = None
+    ) -> dict[int, tuple[int, list[Comment]]]:
+        """
+        Read the replies of several comments at once, along with the users who wrote them.
+        Returns the number of replies and the first `limit` replies in chronological order
+        by the ID of the comment they reply to. The number of replies is read from the counter of the comments.
+        """
+        if not comment_ids:
+            return {}
+
+        # The first replies of each comment are read from the reply index, however long its thread is
+        parent = aliased(self.MODEL_CLASS, name="parent")
+        reply = aliased(self.MODEL_CLASS, name="reply")
+        first_replies = (
+            select(reply.id)
+            .where(reply.reply_to == parent.id)
+            .order_by(reply.comment_date, reply.id)
+            .correlate(parent)
+        )
+        if limit is not None:
+            first_replies = first_replies.limit(limit)
+        first_replies = first_replies.lateral("first_replies")
+        statement = (
+            select(parent.id, parent.reply_count, self.MODEL_CLASS)
+            .select_from(parent)
+            .outerjoin(first_replies, true())
+            .outerjoin(self.MODEL_CLASS, self.MODEL_CLASS.id == first_replies.c.id)
+            .options(joinedload(self.MODEL_CLASS.user))
+            .where(parent.id.in_(comment_ids))
+            .order_by(self.MODEL_CLASS.comment_date, self.MODEL_CLASS.id)
+        )
+        reply_counts = dict.fromkeys(comment_ids, 0)
+        replies = {comment_id: [] for comment_id in comment_ids}
+        for comment_id, reply_count, reply in self.session.execute(statement).all():
+            reply_counts[comment_id] = reply_count
+            if reply is not None:
+                replies[comment_id].append(reply)
+
+        return {
+            comment_id: (reply_counts[comment_id], replies[comment_id])
+            for comment_id in comment_ids
+        }
 
     def read_comments_for_user(
-        self, user_id: uuid.UUID, skip: int, limit: int
-    ) -> tuple[int, list[Comment]]:
+        self,
+        user_id: uuid.UUID,
+        skip: int,
+        limit: int,
+        cursor: str | None = None,
+        include_count: CountMode = "exact",
+    ) -> tuple[int | None, list[Comment]]:
         """
-        Read comments made by a specific user with pagination.
+        Read comments made by a specific user with pagination, newest first, along with the title and URL of their blog posts.
+        Comments without a blog post are left out, the blog post is joined with an inner join.
+        If `cursor` is provided, keyset pagination on (comment_date, id) is used and `skip` is ignored.
         """
-        count_statement = select(func.count()).select_from(self.MODEL_CLASS)
-        count = self.session.exec(count_statement).one()
-
-        statement = (
+        base_query = (
             select(self.MODEL_CLASS)
+            .join(self.MODEL_CLASS.blog_post)
             .where(self.MODEL_CLASS.user_id == user_id)
-            .offset(skip)
-            .limit(limit)
         )
-        objects = self.session.exec(statement).all()
+        statement = base_query.options(
+            contains_eager(self.MODEL_CLASS.blog_post).load_only(
+                BlogPost.title, BlogPost.url
+            )
+        ).order_by(self.MODEL_CLASS.comment_date.desc(), self.MODEL_CLASS.id.desc())
+        if cursor:
+            comment_date, comment_id = decode_cursor(cursor, (datetime, int))
+            statement = statement.where(
+                tuple_(self.MODEL_CLASS.comment_date, self.MODEL_CLASS.id)
+                < tuple_(comment_date, comment_id)
+            )
+            return paginate(
+                self.session,
+                statement,
+                0,
+                limit,
+                include_count,
+                count_statement=base_query,
+            )
 
-        return count, objects
+        return paginate(self.session, statement, skip, limit, include_count)
 
     def update_comment(self, comment_db: Comment, comment_in: CommentUpdate) -> Comment:
         """
         Update an existing comment in the database.
         """
-        return self._update(
-            comment_db,
-            comment_in,  # force_update_of_cols=["comment_date"]
-        )
+        comment_db.sqlmodel_update(comment_in.model_dump(exclude_unset=True))
+        self.session.add(comment_db)
+        self.session.flush()
+        # A new date may change the time of the last comment of the blog post
+        if "comment_date" in comment_in.model_fields_set:
+            self._update_comment_counters(comment_db.blog_post_id)
+        self._publish_comment_event("updated", comment_db)
+        self._invalidate_cache()
+        self.session.commit()
+        self.session.refresh(comment_db)
+        return comment_db
 
     def delete_comment(self, comment: Comment) -> None:
         """
-        Delete a comment from the database.
+        Delete a comment from the database, along with its replies.
+        The comment counters of the blog post are updated in the same transaction.
         """
-        self._delete(comment)
+        # The replies are deleted by the database, so they are counted beforehand
+        thread = (
+            select(self.MODEL_CLASS.id)
+            .where(self.MODEL_CLASS.id == comment.id)
+            .cte("thread", recursive=True)
+        )
+        thread = thread.union_all(
+            select(self.MODEL_CLASS.id).where(self.MODEL_CLASS.reply_to == thread.c.id)
+        )
+        deleted_count = self.session.exec(
+            select(func.count()).select_from(thread)
+        ).one()
+
+        self._publish_comment_event("deleted", comment)
+        self.session.delete(comment)
+        self.session.flush()
+        self._update_comment_counters(comment.blog_post_id, -deleted_count)
+        if comment.reply_to is not None:
+            self._update_reply_count(comment.reply_to, -1)
+        self._invalidate_cache()
+        self.session.commit()
+
+    def _publish_comment_event(
+        self, event_type: CommentEventType, comment: Comment
+    ) -> None:
+        """
+        Publish a change of a comment to the comment streams of its blog post, once the change is committed.
+        Deleted comments are only identified, their replies are deleted along with them.
+        """
+        if event_type == "deleted":
+            data = {"id": comment.id, "reply_to": comment.reply_to}
+        else:
+            data = CommentPublicWithUsername(
+                id=comment.id,
+                content=comment.content,
+                comment_date=comment.comment_date,
+                reply_to=comment.reply_to,
+                blog_post_id=comment.blog_post_id,
+                username=comment.user.name if comment.user else None,
+            ).model_dump(mode="json")
+        publish_comment_event(self.session, event_type, comment.blog_post_id, data)
+
+    def reconcile_reply_counts(self) -> list[int]:
+        """
+        Recompute the reply counters of the comments from their replies, repairing any drift.
+        Returns the IDs of the comments whose counters were wrong.
+        """
+        reply = aliased(self.MODEL_CLASS, name="reply")
+        counters = (
+            select(self.MODEL_CLASS.id, func.count(reply.id).label("reply_count"))
+            .outerjoin(reply, reply.reply_to == self.MODEL_CLASS.id)
+            .group_by(self.MODEL_CLASS.id)
+            .subquery()
+        )
+        statement = (
+            update(self.MODEL_CLASS)
+            .where(
+                self.MODEL_CLASS.id == counters.c.id,
+                self.MODEL_CLASS.reply_count != counters.c.reply_count,
+            )
+            .values(reply_count=counters.c.reply_count)
+            .returning(self.MODEL_CLASS.id)
+        )
+        comment_ids = list(self.session.exec(statement).scalars().all())
+        if comment_ids:
+            self._invalidate_cache()
+        self.session.commit()
+        return comment_ids
+
+    def _update_reply_count(self, comment_id: int, reply_count_change: int) -> None:
+        """
+        Change the reply count of a comment, in the database so concurrent replies are all counted.
+        """
+        statement = (
+            update(self.MODEL_CLASS)
+            .where(self.MODEL_CLASS.id == comment_id)
+            .values(reply_count=self.MODEL_CLASS.reply_count + reply_count_change)
+        )
+        self.session.exec(statement)
+
+    def _update_comment_counters(
+        self, blog_post_id: int, comment_count_change: int = 0
+    ) -> None:
+        """
+        Change the comment count of a blog post and refresh the time of its last comment from its comments.
+        """
+        statement = (
+            update(BlogPost)
+            .where(BlogPost.id == blog_post_id)
+            .values(
+                comment_count=BlogPost.comment_count + comment_count_change,
+                last_comment_at=select(func.max(self.MODEL_CLASS.comment_date))
+                .where(self.MODEL_CLASS.blog_post_id == blog_post_id)
+                .scalar_subquery(),
+                updated_at=datetime.now(UTC),
+            )
+        )
+        self.session.exec(statement)
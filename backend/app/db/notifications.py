@@ -0,0 +1,102 @@
+import asyncio
+from collections import defaultdict
+from collections.abc import Callable
+import json
+import psycopg
+from psycopg import sql
+from sqlalchemy import URL
+from sqlalchemy.orm import Session
+from sqlmodel import func, select
+from typing import Any
+import uuid
+
+from app.core.cache import cache
+from app.logger import logger
+
+
+CACHE_INVALIDATION_CHANNEL = "cache_invalidation"
+RECONNECT_DELAY_SECONDS = 5
+# PostgreSQL rejects notification payloads from 8000 bytes on
+MAX_PAYLOAD_BYTES = 8000
+
+# Identifies the notifications published by this process
+PROCESS_ID = uuid.uuid4().hex
+
+_handlers: defaultdict[str, list[Callable[[dict[str, Any]], None]]] = defaultdict(list)
+
+
+def register_handler(channel: str, handler: Callable[[dict[str, Any]], None]) -> None:
+    """
+    Register a handler to be called with the payload of every notification on `channel`.
+    """
+    _handlers[channel].append(handler)
+
+
+def encode_payload(payload: dict[str, Any]) -> str:
+    """
+    Encode the payload of a notification as published, see `MAX_PAYLOAD_BYTES` for its size limit.
+    """
+    return json.dumps({"origin": PROCESS_ID, **payload}, ensure_ascii=False)
+
+
+def publish(session: Session, channel: str, payload: dict[str, Any]) -> None:
+    """
+    Publish a notification on `channel` within the current transaction of `session`.
+    PostgreSQL only delivers it once the transaction is committed.
+    """
+    session.execute(select(func.pg_notify(channel, encode_payload(payload))))
+
+
+def dispatch(channel: str, payload: str) -> None:
+    """
+    Call the handlers of `channel` with the decoded payload of a notification.
+    """
+    try:
+        data = json.loads(payload)
+    except json.JSONDecodeError:
+        logger.warning(f"Invalid notification payload on {channel}: {payload}")
+        return
+    for handler in _handlers[channel]:
+        try:
+            handler(data)
+        except Exception as e:
+            logger.error(
+                f"Error handling notification on {channel}: {e}", exc_info=True
+            )
+
+
+async def listen(url: URL, ready: asyncio.Event | None = None) -> None:
+    """
+    Listen to the channels with registered handlers and dispatch their notifications, until cancelled.
+    Uses a dedicated connection to the database of `url` and reconnects if it is lost.
+    If `ready` is provided, it is set once listening, the notifications published before are not received.
+    """
+    conninfo = url.set(drivername="postgresql").render_as_string(hide_password=False)
+    while True:
+        try:
+            async with await psycopg.AsyncConnection.connect(
+                conninfo, autocommit=True
+            ) as connection:
+                for channel in _handlers:
+                    await connection.execute(
+                        sql.SQL("LISTEN {}").format(sql.Identifier(channel))
+                    )
+                # Invalidations published while not listening are lost
+                cache.clear()
+                logger.info(f"Listening to notifications on {', '.join(_handlers)}")
+                if ready is not None:
+                    ready.set()
+                async for notification in connection.notifies():
+                    dispatch(notification.channel, notification.payload)
+        except psycopg.Error as e:
+            logger.error(f"Notification listener disconnected: {e}")
+            await asyncio.sleep(RECONNECT_DELAY_SECONDS)
+
+
+def _invalidate_cache(payload: dict[str, Any]) -> None:
+    # The publishing process has already invalidated its own cache after the commit
+    if payload.get("origin") != PROCESS_ID:
+        cache.invalidate(*payload.get("namespaces", []))
+
+
+register_handler(CACHE_INVALIDATION_CHANNEL, _invalidate_cache)
@@ -0,0 +1,141 @@
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+import binascii
+from datetime import datetime
+from fastapi import HTTPException, status
+import json
+from sqlalchemy import Select
+from sqlmodel import Session, select, func, text
+from typing import Any, Literal
+
+
+# How the total count of a paginated read is computed:
+# - exact: in the same statement as the page, with a window function
+# - estimated: from the planner statistics, without reading the rows
+# - none: not computed at all
+CountMode = Literal["exact", "estimated", "none"]
+
+
+def encode_cursor(*values: Any) -> str:
+    """
+    Encode the keyset values of the last row of a page into an opaque cursor.
+    Datetimes are serialized in ISO format.
+    """
+    payload = json.dumps(
+        [
+            value.isoformat() if isinstance(value, datetime) else value
+            for value in values
+        ],
+        separators=(",", ":"),
+    )
+    return urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, types: tuple[type, ...]) -> tuple[Any, ...]:
+    """
+    Decode an opaque cursor back into its keyset values, converting each of them to the expected type.
+    """
+    try:
+        padded_cursor = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(urlsafe_b64decode(padded_cursor.encode()))
+        if not isinstance(values, list) or len(values) != len(types):
+            raise ValueError("Cursor has an unexpected number of values")
+        return tuple(
+            datetime.fromisoformat(value) if type_ is datetime else type_(value)
+            for value, type_ in zip(values, types, strict=True)
+        )
+    except (ValueError, TypeError, binascii.Error):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+        )
+
+
+def get_next_cursor(objects: list[Any], limit: int, *attributes: str) -> str | None:
+    """
+    Build the cursor pointing after the last object of a full page.
+    Returns None if the page is not full, as there are no more objects to read.
+    """
+    if not objects or len(objects) < limit:
+        return None
+    last_object = objects[-1]
+    return encode_cursor(*(getattr(last_object, attr) for attr in attributes))
+
+
+def paginate(
+    session: Session,
+    statement: Select,
+    skip: int,
+    limit: int,
+    include_count: CountMode = "exact",
+    count_statement: Select | None = None,
+) -> tuple[int | None, list[Any]]:
+    """
+    Read one page of the objects selected by `statement` along with their total count, in a single round trip.
+    By default the rows of `statement` are counted; pass `count_statement` to count the rows of another query.
+    Statements selecting several columns return their rows instead of single objects.
+    """
+    if count_statement is None:
+        count_statement = statement
+    page_statement = statement.offset(skip).limit(limit)
+
+    if include_count == "none":
+        return None, list(session.exec(page_statement).all())
+
+    if include_count == "estimated":
+        count = _estimate_count(session, count_statement)
+        return count, list(session.exec(page_statement).all())
+
+    if count_statement is statement:
+        total_count = func.count().over()
+    else:
+        total_count = _count_query(count_statement).scalar_subquery()
+    # Executed without `exec`, as the rows have an extra column next to the objects
+    rows = session.execute(
+        page_statement.add_columns(total_count.label("total_count"))
+    ).all()
+    if rows:
+        if len(rows[0]) > 2:
+            return rows[0][-1], [row[:-1] for row in rows]
+        return rows[0][-1], [row[0] for row in rows]
+
+    # An empty page does not tell the count, unless the query matches nothing at all
+    if skip == 0 and count_statement is statement:
+        return 0, []
+    return session.exec(_count_query(count_statement)).one(), []
+
+
+def _count_query(statement: Select) -> Select:
+    """
+    Build the query counting the rows of `statement`.
+    """
+    return select(func.count()).select_from(statement.order_by(None).subquery())
+
+
+def _estimate_count(session: Session, statement: Select) -> int:
+    """
+    Estimate the number of rows of `statement` without executing it.
+    Unfiltered queries of a single table use the table statistics, other queries the planner's row estimate.
+    """
+    tables = statement.get_final_froms()
+    if (
+        statement.whereclause is None
+        and len(tables) == 1
+        and hasattr(tables[0], "name")
+    ):
+        reltuples = session.execute(
+            text("SELECT reltuples FROM pg_class WHERE oid = to_regclass(:table_name)"),
+            {"table_name": f'"{tables[0].name}"'},
+        ).scalar()
+        # The statistics of tables that have not been analyzed yet are unknown (-1)
+        if reltuples is not None and reltuples >= 0:
+            return int(reltuples)
+
+    compiled = statement.order_by(None).compile(
+        dialect=session.get_bind().dialect,
+        compile_kwargs={"render_postcompile": True},
+    )
+    plan = (
+        session.connection()
+        .exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params)
+        .scalar()
+    )
+    return int(plan[0]["Plan"]["Plan Rows"])
@@ -1,3 +1,6 @@
+import asyncio
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager, suppress
 from fastapi import FastAPI, Request, status
 from fastapi.encoders import jsonable_encoder
 from fastapi.exceptions import RequestValidationError
@@ -11,6 +14,8 @@ from slowapi.errors import RateLimitExceeded
 from app.api.main import api_router
 from app.core.config import settings
 from app.core.limiter import limiter
+from app.db.db import engine
+from app.db.notifications import listen
 from app.logger import logger
 
 
@@ -18,8 +23,22 @@ def custom_generate_unique_id(route: APIRoute) -> str:
     return f"{route.tags[0]}-{route.name}"
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
+    # Each worker listens to the cache invalidations and the comment events published by all the workers
+    listener = None
+    if not settings.TEST_MODE:
+        listener = asyncio.create_task(listen(engine.url))
+    yield
+    if listener:
+        listener.cancel()
+        with suppress(asyncio.CancelledError):
+            await listener
+
+
 app = FastAPI(
     title=settings.API_PROJECT_NAME,
+    lifespan=lifespan,
     openapi_url=f"{settings.API_VERSION_STR}/openapi.json",
     generate_unique_id_function=custom_generate_unique_id,
 )
@@ -1,10 +1,37 @@
 from datetime import datetime, UTC
 from pydantic import EmailStr
-from sqlmodel import SQLModel, Field, Relationship, Column, ForeignKey
+from sqlalchemy import DDL, Computed, Text, event, text
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, TSVECTOR
+from sqlmodel import SQLModel, Field, Relationship, Column, ForeignKey, Index
 import uuid
 
 
+# Text search configuration used for the full-text search of blog posts
+BLOG_POST_SEARCH_CONFIG = "english"
+
+# The trigram indexes below need the pg_trgm extension
+event.listen(
+    SQLModel.metadata, "before_create", DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+)
+
+
 class User(SQLModel, table=True):
+    __table_args__ = (
+        # Trigram indexes for substring and fuzzy searches
+        Index(
+            "ix_user_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_user_email_trgm",
+            "email",
+            postgresql_using="gin",
+            postgresql_ops={"email": "gin_trgm_ops"},
+        ),
+    )
+
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     name: str = Field(max_length=255, nullable=False)
     email: EmailStr = Field(max_length=255, index=True, unique=True)
@@ -18,19 +45,65 @@ class User(SQLModel, table=True):
 
 
 class BlogPostTagLink(SQLModel, table=True):
+    __table_args__ = (
+        # Blog posts of a tag, the primary key only serves the tags of a blog post
+        Index("ix_blogposttaglink_tag_id_blog_post_id", "tag_id", "blog_post_id"),
+    )
+
     blog_post_id: int = Field(foreign_key="blogpost.id", primary_key=True)
     tag_id: int = Field(foreign_key="tag.id", primary_key=True)
 
 
 class Tag(SQLModel, table=True):
+    __table_args__ = (
+        # Case-insensitive lookups of tags by name
+        Index("ix_tag_lower_name", text("lower(name)")),
+    )
+
     id: int = Field(default=None, primary_key=True)
     name: str = Field(max_length=50, unique=True, nullable=False)
+    # Version of the tag for HTTP caching, set on every change
+    updated_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
     blog_posts: list["BlogPost"] | None = Relationship(
         back_populates="tags", link_model=BlogPostTagLink
     )
 
 
 class BlogPost(SQLModel, table=True):
+    __table_args__ = (
+        # Backs the keyset pagination of the blog post listing
+        Index("ix_blogpost_publication_date_id", "publication_date", "id"),
+        # The same for the few featured blog posts
+        Index(
+            "ix_blogpost_featured_publication_date_id",
+            "publication_date",
+            "id",
+            postgresql_where=text("featured IS true"),
+        ),
+        # Full-text search document, kept up to date by PostgreSQL
+        Column(
+            "search_vector",
+            TSVECTOR,
+            Computed(
+                f"setweight(to_tsvector('{BLOG_POST_SEARCH_CONFIG}', coalesce(title, '')), 'A') || "
+                f"setweight(to_tsvector('{BLOG_POST_SEARCH_CONFIG}', coalesce(content, '')), 'B')",
+                persisted=True,
+            ),
+        ),
+        Index("ix_blogpost_search_vector", "search_vector", postgresql_using="gin"),
+        # Trigram index for substring and fuzzy title searches
+        Index(
+            "ix_blogpost_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ),
+        # Containment and overlap filters on the tag names
+        Index("ix_blogpost_tag_names", "tag_names", postgresql_using="gin"),
+    )
+    # The search vector is only used in queries, so it is not loaded with the blog posts
+    __mapper_args__ = {"exclude_properties": ["search_vector"]}
+
     id: int = Field(default=None, primary_key=True)
     title: str = Field(max_length=255, nullable=False, index=True)
     url: str = Field(max_length=255, nullable=False, unique=True)
@@ -38,6 +111,23 @@ class BlogPost(SQLModel, table=True):
     image_path: str | None = Field(nullable=True)
     publication_date: datetime = Field(default_factory=lambda: datetime.now(UTC))
     featured: bool = Field(default=False, nullable=False)
+    # Summary of the content for the listings, maintained when the content changes
+    excerpt: str = Field(default="", nullable=False)
+    word_count: int = Field(default=0, nullable=False)
+    reading_time: int = Field(default=0, nullable=False)
+    # Content rendered to HTML with its table of contents, maintained when the content changes
+    content_html: str = Field(default="", nullable=False)
+    toc: list[dict] = Field(default_factory=list, sa_type=JSONB, nullable=False)
+    content_hash: str = Field(default="", max_length=64, nullable=False)
+    # Version of the blog post for HTTP caching, set on every change including its tags
+    updated_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    # Counters of the comments including the replies, maintained when comments are created or deleted
+    comment_count: int = Field(default=0, nullable=False)
+    last_comment_at: datetime | None = Field(default=None, nullable=True)
+    # Lowercased names of the tags, maintained when the tags of the blog post or the tags themselves change
+    tag_names: list[str] = Field(
+        default_factory=list, sa_type=ARRAY(Text), nullable=False
+    )
     comments: list["Comment"] | None = Relationship(
         back_populates="blog_post", sa_relationship_kwargs={"passive_deletes": True}
     )
@@ -46,10 +136,33 @@ class BlogPost(SQLModel, table=True):
     )
 
 
+# Number of blog posts published per month, maintained when blog posts are created, deleted or moved to another date
+class BlogPostArchiveMonth(SQLModel, table=True):
+    year: int = Field(primary_key=True)
+    month: int = Field(primary_key=True)
+    blog_post_count: int = Field(default=0, nullable=False)
+
+
 class Comment(SQLModel, table=True):
+    __table_args__ = (
+        # Top-level comments of a blog post, newest first, and the count of all its comments
+        Index(
+            "ix_comment_blog_post_id_reply_to_comment_date",
+            "blog_post_id",
+            "reply_to",
+            text("comment_date DESC"),
+        ),
+        # Replies of comments in chronological order
+        Index("ix_comment_reply_to_comment_date", "reply_to", "comment_date"),
+        # Comments of a user, newest first
+        Index("ix_comment_user_id_comment_date", "user_id", text("comment_date DESC")),
+    )
+
     id: int = Field(default=None, primary_key=True)
     content: str = Field(max_length=1000, nullable=False)
     comment_date: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    # Number of direct replies, maintained along with the replies
+    reply_count: int = Field(default=0, nullable=False)
     # Foreign keys
     user_id: uuid.UUID | None = Field(
         default=None, sa_column=Column(ForeignKey("user.id", ondelete="SET NULL"))
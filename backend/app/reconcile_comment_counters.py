@@ -0,0 +1,39 @@
+import logging
+from sqlmodel import Session
+
+from app.db.crud import BlogPostCRUD, CommentCRUD
+from app.db.db import engine
+
+
+LOG_FORMAT = "%(levelname)s  [%(name)s] %(message)s"
+
+logging.basicConfig(level=logging.INFO, format=LOG_FORMAT)
+logger = logging.getLogger("reconcile_comment_counters")
+
+
+def main():
+    logger.info("Reconciling the comment counters of the blog posts...")
+    with Session(engine) as session:
+        blog_post_ids = BlogPostCRUD(session).reconcile_comment_counters()
+    if blog_post_ids:
+        logger.info(
+            f"Repaired the comment counters of {len(blog_post_ids)} blog post(s): "
+            f"{', '.join(map(str, blog_post_ids))}"
+        )
+    else:
+        logger.info("The comment counters are consistent.")
+
+    logger.info("Reconciling the reply counters of the comments...")
+    with Session(engine) as session:
+        comment_ids = CommentCRUD(session).reconcile_reply_counts()
+    if comment_ids:
+        logger.info(
+            f"Repaired the reply counters of {len(comment_ids)} comment(s): "
+            f"{', '.join(map(str, comment_ids))}"
+        )
+    else:
+        logger.info("The reply counters are consistent.")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,13 @@
 from datetime import datetime, UTC
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Discriminator, Field, Tag
+from typing import Annotated, Any, Literal
 
 from app.schemas.comment import CommentPublicWithUsername
-from app.schemas.tag import TagPublic
+from app.schemas.tag import TagName, TagPublic
+
+
+# Whether the blog posts filtered by tag names need all or any of the tags
+TagMatch = Literal["all", "any"]
 
 
 class BlogPostBase(BaseModel):
@@ -16,26 +21,97 @@ class BlogPostBase(BaseModel):
 
 class BlogPostCreate(BlogPostBase):
     tags: list[int] = Field(default_factory=list)
+    # Tags given by name, the ones that do not exist yet are created
+    tag_names: list[TagName] = Field(default_factory=list)
 
 
 class BlogPostPublic(BlogPostBase):
     id: int
+    comment_count: int = 0
+    last_comment_at: datetime | None = None
     tags: list["TagPublic"]
 
 
-class BlogPostsByTag(TagPublic):
-    blog_posts: list[BlogPostPublic]
+class TocEntry(BaseModel):
+    level: int
+    text: str
+    id: str
+
+
+class BlogPostPublicHtml(BaseModel):
+    id: int
+    title: str
+    url: str
+    image_path: str | None
+    publication_date: datetime
+    featured: bool
+    content_html: str
+    toc: list[TocEntry]
+    content_hash: str
+    comment_count: int
+    last_comment_at: datetime | None
+    tags: list["TagPublic"]
 
 
 class BlogPostPublicWithComments(BlogPostPublic):
     comments: list["CommentPublicWithUsername"]
 
 
-class BlogPostsPublic(BaseModel):
-    data: list[BlogPostPublic]
+class BlogPostSummary(BaseModel):
+    id: int
+    title: str
+    url: str
+    image_path: str | None
+    publication_date: datetime
+    featured: bool
+    excerpt: str
+    word_count: int
+    reading_time: int
+    comment_count: int
+    last_comment_at: datetime | None
+    tags: list["TagPublic"]
+
+
+class BlogPostSummaryWithHeadline(BlogPostSummary):
+    headline: str | None = None
+
+
+def _get_summary_type(value: Any) -> str:
+    # Only the full-text search results carry a headline, the others are left without the field
+    if isinstance(value, dict):
+        return "headline" if "headline" in value else "summary"
+    return "headline" if isinstance(value, BlogPostSummaryWithHeadline) else "summary"
+
+
+BlogPostListItem = Annotated[
+    Annotated[BlogPostSummaryWithHeadline, Tag("headline")]
+    | Annotated[BlogPostSummary, Tag("summary")],
+    Discriminator(_get_summary_type),
+]
+
+
+class TagFacet(BaseModel):
+    name: str
     count: int
 
 
+class YearFacet(BaseModel):
+    year: int
+    count: int
+
+
+class BlogPostFacets(BaseModel):
+    tags: list[TagFacet]
+    years: list[YearFacet]
+
+
+class BlogPostsPublic(BaseModel):
+    data: list[BlogPostListItem]
+    count: int | None
+    next_cursor: str | None = None
+    facets: BlogPostFacets | None = None
+
+
 class BlogPostUpdate(BaseModel):
     title: str | None = Field(default=None, min_length=1, max_length=255)
     url: str | None = Field(default=None, min_length=1, max_length=255)
@@ -44,3 +120,25 @@ class BlogPostUpdate(BaseModel):
     publication_date: datetime | None = Field(default=None)
     featured: bool | None = Field(default=None)
     tags: list[int] | None = Field(default=None)
+    tag_names: list[TagName] | None = Field(default=None)
+
+
+class BlogPostsByTag(TagPublic):
+    blog_posts: list[BlogPostSummary]
+    count: int | None
+    next_cursor: str | None = None
+
+
+class ArchiveMonth(BaseModel):
+    month: int
+    count: int
+
+
+class ArchiveYear(BaseModel):
+    year: int
+    count: int
+    months: list[ArchiveMonth]
+
+
+class BlogPostArchive(BaseModel):
+    data: list[ArchiveYear]
@@ -26,11 +26,24 @@ class CommentPublicWithUsername(CommentPublic):
 
 class CommentPublicWithReplies(CommentPublicWithUsername):
     replies: list[CommentPublicWithUsername] = Field(default_factory=list)
+    reply_count: int = 0
+    next_replies_cursor: str | None = None
+
+
+class CommentPublicWithBlogPost(CommentPublic):
+    blog_post_title: str
+    blog_post_url: str
 
 
 class CommentsPublic(BaseModel):
-    data: list[CommentPublicWithReplies | CommentPublicWithUsername | CommentPublic]
-    count: int
+    data: list[
+        CommentPublicWithReplies
+        | CommentPublicWithUsername
+        | CommentPublicWithBlogPost
+        | CommentPublic
+    ]
+    count: int | None
+    next_cursor: str | None = None
 
 
 class CommentPrivate(CommentBase):
@@ -39,9 +52,15 @@ class CommentPrivate(CommentBase):
     reply_to: int | None
 
 
+class CommentPrivateWithBlogPost(CommentPrivate):
+    blog_post_title: str
+    blog_post_url: str
+
+
 class CommentsPrivate(BaseModel):
-    data: list[CommentPrivate]
-    count: int
+    data: list[CommentPrivateWithBlogPost | CommentPrivate]
+    count: int | None
+    next_cursor: str | None = None
 
 
 class CommentUpdate(BaseModel):
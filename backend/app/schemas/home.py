@@ -0,0 +1,11 @@
+from pydantic import BaseModel
+
+from app.schemas.blog_post import BlogPostSummary
+from app.schemas.tag import TagPublicWithCount
+
+
+class HomePublic(BaseModel):
+    featured: list[BlogPostSummary]
+    recent: list[BlogPostSummary]
+    recent_count: int | None
+    tags: list[TagPublicWithCount]
@@ -1,4 +1,12 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, StringConstraints
+from typing import Annotated, Literal
+
+
+TagName = Annotated[
+    str, StringConstraints(strip_whitespace=True, min_length=1, max_length=50)
+]
+
+TagOrder = Literal["id", "popular"]
 
 
 class TagBase(BaseModel):
@@ -13,9 +21,13 @@ class TagPublic(TagBase):
     id: int
 
 
+class TagPublicWithCount(TagPublic):
+    blog_post_count: int
+
+
 class TagsPublic(BaseModel):
-    data: list[TagPublic]
-    count: int
+    data: list[TagPublicWithCount | TagPublic]
+    count: int | None
 
 
 class TagUpdate(TagBase):
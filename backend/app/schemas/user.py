@@ -21,7 +21,7 @@ class UserPublic(UserBase):
 
 class UsersPublic(BaseModel):
     data: list[UserPublic]
-    count: int
+    count: int | None
 
 
 class UserUpdate(BaseModel):
@@ -1,14 +1,24 @@
+from datetime import datetime, timedelta, UTC
 from fastapi.testclient import TestClient
 import pytest
-from sqlmodel import Session, delete
+from sqlmodel import Session, delete, update
 
+from app.core.cache import cache
 from app.core.config import settings
 from app.db.crud import TagCRUD, BlogPostCRUD, UserCRUD, CommentCRUD
-from app.models.models import Tag, BlogPost, BlogPostTagLink, Comment, User
-from app.schemas.blog_post import BlogPostCreate
+from app.models.models import (
+    Tag,
+    BlogPost,
+    BlogPostArchiveMonth,
+    BlogPostTagLink,
+    Comment,
+    User,
+)
+from app.schemas.blog_post import BlogPostCreate, BlogPostUpdate
 from app.schemas.comment import CommentCreate
-from app.schemas.tag import TagCreate
+from app.schemas.tag import TagCreate, TagUpdate
 from app.schemas.user import UserCreate
+from app.tests.utils.query_counter import count_queries
 
 
 @pytest.fixture(scope="function")
@@ -59,6 +69,7 @@ def delete_data(db: Session) -> None:
     db.exec(delete(Comment))
     db.exec(delete(BlogPostTagLink))
     db.exec(delete(BlogPost))
+    db.exec(delete(BlogPostArchiveMonth))
     db.exec(delete(Tag))
     db.exec(
         delete(User).where(
@@ -86,7 +97,10 @@ def test_02_read_blog_posts(client: TestClient, setup_blog_post: BlogPost) -> No
     assert data["data"][0]["id"] == setup_blog_post.id
     assert data["data"][0]["title"] == setup_blog_post.title
     assert data["data"][0]["url"] == setup_blog_post.url
-    assert data["data"][0]["content"] == setup_blog_post.content
+    assert data["data"][0]["excerpt"] == setup_blog_post.content
+    assert data["data"][0]["word_count"] == 5
+    assert data["data"][0]["reading_time"] == 1
+    assert "content" not in data["data"][0]
     assert data["data"][0]["image_path"] == setup_blog_post.image_path
     assert data["data"][0]["featured"] == setup_blog_post.featured
     assert data["data"][0]["tags"] == []
@@ -126,7 +140,7 @@ def test_03_read_blog_posts_with_skip_and_limit_and_search(
     assert data["data"][0]["id"] == blog_post_2.id
     assert data["data"][0]["title"] == blog_post_2.title
     assert data["data"][0]["url"] == blog_post_2.url
-    assert data["data"][0]["content"] == blog_post_2.content
+    assert data["data"][0]["excerpt"] == blog_post_2.content
     assert data["data"][0]["image_path"] == blog_post_2.image_path
     assert data["data"][0]["featured"] == blog_post_2.featured
     assert data["data"][0]["tags"] == []
@@ -150,7 +164,7 @@ def test_03_read_blog_posts_with_skip_and_limit_and_search(
     assert data["data"][0]["id"] == blog_post_2.id
     assert data["data"][0]["title"] == blog_post_2.title
     assert data["data"][0]["url"] == blog_post_2.url
-    assert data["data"][0]["content"] == blog_post_2.content
+    assert data["data"][0]["excerpt"] == blog_post_2.content
     assert data["data"][0]["image_path"] == blog_post_2.image_path
     assert data["data"][0]["featured"] == blog_post_2.featured
     assert data["data"][0]["tags"] == []
@@ -165,7 +179,7 @@ def test_03_read_blog_posts_with_skip_and_limit_and_search(
     assert data["data"][0]["id"] == blog_post_2.id
     assert data["data"][0]["title"] == blog_post_2.title
     assert data["data"][0]["url"] == blog_post_2.url
-    assert data["data"][0]["content"] == blog_post_2.content
+    assert data["data"][0]["excerpt"] == blog_post_2.content
     assert data["data"][0]["image_path"] == blog_post_2.image_path
     assert data["data"][0]["featured"] == blog_post_2.featured
     assert data["data"][0]["tags"] == []
@@ -197,7 +211,7 @@ def test_03_read_blog_posts_with_skip_and_limit_and_search(
     assert data["data"][0]["id"] == blog_post_2.id
     assert data["data"][0]["title"] == blog_post_2.title
     assert data["data"][0]["url"] == blog_post_2.url
-    assert data["data"][0]["content"] == blog_post_2.content
+    assert data["data"][0]["excerpt"] == blog_post_2.content
     assert data["data"][0]["image_path"] == blog_post_2.image_path
     assert data["data"][0]["featured"] == blog_post_2.featured
     assert data["data"][0]["tags"] == []
@@ -212,7 +226,7 @@ def test_03_read_blog_posts_with_skip_and_limit_and_search(
     assert data["data"][0]["id"] == blog_post_2.id
     assert data["data"][0]["title"] == blog_post_2.title
     assert data["data"][0]["url"] == blog_post_2.url
-    assert data["data"][0]["content"] == blog_post_2.content
+    assert data["data"][0]["excerpt"] == blog_post_2.content
     assert data["data"][0]["image_path"] == blog_post_2.image_path
     assert data["data"][0]["featured"] == blog_post_2.featured
     assert data["data"][0]["tags"] == []
@@ -244,7 +258,7 @@ def test_03_read_blog_posts_with_skip_and_limit_and_search(
     assert data["data"][0]["id"] == blog_post_1.id
     assert data["data"][0]["title"] == blog_post_1.title
     assert data["data"][0]["url"] == blog_post_1.url
-    assert data["data"][0]["content"] == blog_post_1.content
+    assert data["data"][0]["excerpt"] == blog_post_1.content
     assert data["data"][0]["image_path"] == blog_post_1.image_path
     assert (
         data["data"][0]["publication_date"] == blog_post_1.publication_date.isoformat()
@@ -264,7 +278,7 @@ def test_03_read_blog_posts_with_skip_and_limit_and_search(
     assert data["data"][0]["id"] == blog_post_1.id
     assert data["data"][0]["title"] == blog_post_1.title
     assert data["data"][0]["url"] == blog_post_1.url
-    assert data["data"][0]["content"] == blog_post_1.content
+    assert data["data"][0]["excerpt"] == blog_post_1.content
     assert data["data"][0]["image_path"] == blog_post_1.image_path
     assert (
         data["data"][0]["publication_date"] == blog_post_1.publication_date.isoformat()
@@ -729,3 +743,354 @@ def test_23_delete_blog_post_with_comments(
     assert response.status_code == 404
     data = response.json()
     assert data["detail"] == "Tag not found"
+
+
+def test_24_read_blog_posts_with_cursor(client: TestClient, db: Session) -> None:
+    for i in range(1, 4):
+        BlogPostCRUD(db).create_blog_post(
+            blog_post=BlogPostCreate(
+                title=f"Blog Post {i}",
+                url=f"blog-post-{i}",
+                content=f"Content of Blog Post {i}",
+                publication_date=datetime.now(UTC) + timedelta(days=i),
+            )
+        )
+
+    response = client.get(f"{settings.API_VERSION_STR}/blogposts/?limit=2")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["count"] == 3
+    assert [blog_post["title"] for blog_post in data["data"]] == [
+        "Blog Post 3",
+        "Blog Post 2",
+    ]
+    assert data["next_cursor"] is not None
+
+    response = client.get(
+        f"{settings.API_VERSION_STR}/blogposts/?limit=2&cursor={data['next_cursor']}"
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["count"] == 3
+    assert [blog_post["title"] for blog_post in data["data"]] == ["Blog Post 1"]
+    assert data["next_cursor"] is None
+
+    response = client.get(f"{settings.API_VERSION_STR}/blogposts/?cursor=invalid")
+    assert response.status_code == 400
+    data = response.json()
+    assert data["detail"] == "Invalid cursor"
+
+
+def test_25_read_blog_posts_fulltext_search(
+    client: TestClient, setup_blog_post: BlogPost
+) -> None:
+    response = client.get(
+        f"{settings.API_VERSION_STR}/blogposts/?search_by=fulltext&search_value=content"
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["count"] == 1
+    assert data["data"][0]["id"] == setup_blog_post.id
+    assert data["data"][0]["headline"].startswith("<mark>Content</mark> of Blog")
+    assert data["next_cursor"] is None
+
+    response = client.get(
+        f"{settings.API_VERSION_STR}/blogposts/?search_by=fulltext&search_value=nonexistent"
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["count"] == 0
+    assert data["data"] == []
+
+
+def test_26_read_blog_posts_include_count(
+    client: TestClient, setup_blog_post: BlogPost
+) -> None:
+    response = client.get(f"{settings.API_VERSION_STR}/blogposts/?include_count=none")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["count"] is None
+    assert data["data"][0]["id"] == setup_blog_post.id
+
+    response = client.get(
+        f"{settings.API_VERSION_STR}/blogposts/?include_count=estimated"
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert isinstance(data["count"], int)
+    assert data["data"][0]["id"] == setup_blog_post.id
+
+    response = client.get(f"{settings.API_VERSION_STR}/blogposts/?include_count=fast")
+    assert response.status_code == 422
+
+
+def test_27_read_blog_post_conditional(
+    client: TestClient, db: Session, setup_blog_post: BlogPost
+) -> None:
+    url = f"{settings.API_VERSION_STR}/blogposts/{setup_blog_post.url}"
+    response = client.get(url)
+    assert response.status_code == 200
+    # Changed within the current second, a later change within it could not be told apart
+    assert "last-modified" not in response.headers
+
+    db.exec(
+        update(BlogPost)
+        .where(BlogPost.id == setup_blog_post.id)
+        .values(updated_at=datetime.now(UTC) - timedelta(minutes=1))
+    )
+    db.commit()
+    cache.clear()
+    response = client.get(url)
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    last_modified = response.headers["last-modified"]
+
+    response = client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+    response = client.get(url, headers={"If-Modified-Since": last_modified})
+    assert response.status_code == 304
+
+    # A change of the blog post or of its tags makes a new version
+    tag = TagCRUD(db).create_tag(tag=TagCreate(name="conditional_tag"))
+    BlogPostCRUD(db).update_blog_post(
+        blog_post_db=setup_blog_post, blog_post_in=BlogPostUpdate(tags=[tag.id])
+    )
+    response = client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    etag = response.headers["etag"]
+
+    TagCRUD(db).update_tag(tag_db=tag, tag_in=TagUpdate(name="conditional_tag_new"))
+    response = client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["tags"][0]["name"] == "conditional_tag_new"
+
+    response = client.get(
+        f"{settings.API_VERSION_STR}/blogposts/nonexistent",
+        headers={"If-None-Match": etag},
+    )
+    assert response.status_code == 404
+
+
+def test_28_read_blog_posts_conditional(
+    client: TestClient, db: Session, setup_blog_post: BlogPost
+) -> None:
+    url = f"{settings.API_VERSION_STR}/blogposts/?limit=10"
+    response = client.get(url)
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    # The time of the latest change does not identify the listing, it does not change on deletes
+    assert "last-modified" not in response.headers
+
+    # The version is cached along with the listing
+    with count_queries() as statements:
+        response = client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert len(statements) == 0
+
+    # The query parameters are part of the version
+    response = client.get(
+        f"{settings.API_VERSION_STR}/blogposts/?limit=5",
+        headers={"If-None-Match": etag},
+    )
+    assert response.status_code == 200
+
+    BlogPostCRUD(db).delete_blog_post(blog_post_db=setup_blog_post)
+    response = client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["count"] == 0
+
+
+def test_29_read_blog_post_html(client: TestClient, db: Session) -> None:
+    BlogPostCRUD(db).create_blog_post(
+        blog_post=BlogPostCreate(
+            title="Blog Post 1",
+            url="blog-post-1",
+            content="# Title\n\nContent of **Blog Post 1**",
+        )
+    )
+
+    response = client.get(f"{settings.API_VERSION_STR}/blogposts/blog-post-1")
+    assert response.status_code == 200
+    markdown_etag = response.headers["etag"]
+    assert response.json()["content"] == "# Title\n\nContent of **Blog Post 1**"
+    assert "content_html" not in response.json()
+
+    response = client.get(
+        f"{settings.API_VERSION_STR}/blogposts/blog-post-1?format=html",
+        headers={"If-None-Match": markdown_etag},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert "content" not in data
+    assert data["content_html"] == (
+        '<h1 id="title">Title</h1>\n<p>Content of <strong>Blog Post 1</strong></p>\n'
+    )
+    assert data["toc"] == [{"level": 1, "text": "Title", "id": "title"}]
+    assert len(data["content_hash"]) == 64
+    assert data["title"] == "Blog Post 1"
+    assert data["tags"] == []
+
+    response = client.get(
+        f"{settings.API_VERSION_STR}/blogposts/blog-post-1?format=pdf"
+    )
+    assert response.status_code == 422
+
+
+def test_30_read_blog_posts_comment_counters(
+    client: TestClient, db: Session, setup_blog_post: BlogPost
+) -> None:
+    url = f"{settings.API_VERSION_STR}/blogposts/"
+    response = client.get(url)
+    assert response.status_code == 200
+    assert response.json()["data"][0]["comment_count"] == 0
+    assert response.json()["data"][0]["last_comment_at"] is None
+    etag = response.headers["etag"]
+
+    user = UserCRUD(db).create_user(
+        user=UserCreate(name="user1", email="user1@email.com", password="password")
+    )
+    comment = CommentCRUD(db).create_comment(
+        comment=CommentCreate(content="Comment 1"),
+        blog_post_id=setup_blog_post.id,
+        user_id=user.id,
+    )
+    CommentCRUD(db).create_comment(
+        comment=CommentCreate(content="Comment 1 reply", reply_to=comment.id),
+        blog_post_id=setup_blog_post.id,
+        user_id=user.id,
+    )
+
+    # A new comment makes a new version of the listing and of the blog post
+    response = client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["data"][0]["comment_count"] == 2
+    assert response.json()["data"][0]["last_comment_at"] is not None
+
+    response = client.get(f"{url}{setup_blog_post.url}")
+    assert response.status_code == 200
+    assert response.json()["comment_count"] == 2
+    response = client.get(f"{url}{setup_blog_post.url}?format=html")
+    assert response.status_code == 200
+    assert response.json()["comment_count"] == 2
+
+    response = client.get(f"{url}{setup_blog_post.url}/comments")
+    assert response.status_code == 200
+    assert response.json()["count"] == 2
+
+
+def test_31_read_blog_posts_by_tag_names(client: TestClient, db: Session) -> None:
+    for i, tag_names in enumerate([["python"], ["python", "fastapi"], ["sql"]]):
+        BlogPostCRUD(db).create_blog_post(
+            blog_post=BlogPostCreate(
+                title=f"Blog Post {i}",
+                url=f"blog-post-{i}",
+                content=f"Content of Blog Post {i}",
+                publication_date=datetime(2026, 1, i + 1, tzinfo=UTC),
+                tag_names=tag_names,
+            )
+        )
+
+    url = f"{settings.API_VERSION_STR}/blogposts/"
+    response = client.get(f"{url}?tags=python, fastapi")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["count"] == 1
+    assert [blog_post["title"] for blog_post in data["data"]] == ["Blog Post 1"]
+
+    response = client.get(f"{url}?tags=fastapi,sql&tag_match=any")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["count"] == 2
+    assert [blog_post["title"] for blog_post in data["data"]] == [
+        "Blog Post 2",
+        "Blog Post 1",
+    ]
+
+    response = client.get(f"{url}?tags=python&tag_match=some")
+    assert response.status_code == 422
+
+
+def test_32_read_blog_posts_with_facets(client: TestClient, db: Session) -> None:
+    for i, (year, tag_names) in enumerate(
+        [(2025, ["python"]), (2026, ["python", "sql"]), (2026, ["sql"])]
+    ):
+        BlogPostCRUD(db).create_blog_post(
+            blog_post=BlogPostCreate(
+                title=f"Blog Post {i}",
+                url=f"blog-post-{i}",
+                content=f"Content of Blog Post {i}",
+                publication_date=datetime(year, 6, 1, tzinfo=UTC),
+                tag_names=tag_names,
+            )
+        )
+
+    url = f"{settings.API_VERSION_STR}/blogposts/"
+    response = client.get(url)
+    assert response.status_code == 200
+    assert response.json()["facets"] is None
+
+    response = client.get(
+        f"{url}?tags=sql&published_from=2026-01-01T00:00:00Z&with_facets=true"
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["count"] == 2
+    assert data["facets"] == {
+        "tags": [{"name": "sql", "count": 2}, {"name": "python", "count": 1}],
+        "years": [{"year": 2026, "count": 2}],
+    }
+    # Only the full-text search results carry a headline
+    assert all("headline" not in blog_post for blog_post in data["data"])
+
+    response = client.get(f"{url}?search_by=fulltext&search_value=content&tags=sql")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["count"] == 2
+    assert all(blog_post["headline"] for blog_post in data["data"])
+
+
+def test_33_read_blog_post_archive(client: TestClient, db: Session) -> None:
+    response = client.get(f"{settings.API_VERSION_STR}/blogposts/archive")
+    assert response.status_code == 200
+    assert response.json() == {"data": []}
+
+    for i, publication_date in enumerate(
+        [
+            datetime(2025, 11, 1, tzinfo=UTC),
+            datetime(2026, 1, 1, tzinfo=UTC),
+            datetime(2026, 3, 1, tzinfo=UTC),
+            datetime(2026, 3, 2, tzinfo=UTC),
+        ]
+    ):
+        BlogPostCRUD(db).create_blog_post(
+            blog_post=BlogPostCreate(
+                title=f"Blog Post {i}",
+                url=f"blog-post-{i}",
+                content=f"Content of Blog Post {i}",
+                publication_date=publication_date,
+            )
+        )
+
+    response = client.get(f"{settings.API_VERSION_STR}/blogposts/archive")
+    assert response.status_code == 200
+    assert response.json() == {
+        "data": [
+            {
+                "year": 2026,
+                "count": 3,
+                "months": [{"month": 3, "count": 2}, {"month": 1, "count": 1}],
+            },
+            {"year": 2025, "count": 1, "months": [{"month": 11, "count": 1}]},
+        ]
+    }
+
+    response = client.get(
+        f"{settings.API_VERSION_STR}/blogposts/"
+        "?published_from=2026-03-01T00:00:00Z&published_to=2026-04-01T00:00:00Z"
+    )
+    assert response.status_code == 200
+    assert response.json()["count"] == 2
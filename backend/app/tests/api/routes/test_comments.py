@@ -10,6 +10,7 @@ from app.models.models import BlogPost, Comment, User
 from app.schemas.blog_post import BlogPostCreate
 from app.schemas.comment import CommentCreate
 from app.schemas.user import UserCreate
+from app.tests.utils.query_counter import count_queries
 
 
 @pytest.fixture(scope="function")
@@ -258,14 +259,17 @@ def test_09_read_comments_for_user(
     data = response.json()
     assert data["count"] == 2
     assert len(data["data"]) == 2
-    assert data["data"][0]["id"] == comment_1.id
-    assert data["data"][0]["content"] == comment_1.content
+    # Newest first
+    assert data["data"][0]["id"] == comment_2.id
+    assert data["data"][0]["content"] == comment_2.content
     assert data["data"][0]["comment_date"] is not None
-    assert data["data"][0]["blog_post_id"] == comment_1.blog_post_id
-    assert data["data"][1]["id"] == comment_2.id
-    assert data["data"][1]["content"] == comment_2.content
+    assert data["data"][0]["blog_post_id"] == comment_2.blog_post_id
+    assert data["data"][0]["blog_post_title"] == setup_blog_post.title
+    assert data["data"][0]["blog_post_url"] == setup_blog_post.url
+    assert data["data"][1]["id"] == comment_1.id
+    assert data["data"][1]["content"] == comment_1.content
     assert data["data"][1]["comment_date"] is not None
-    assert data["data"][1]["blog_post_id"] == comment_2.blog_post_id
+    assert data["data"][1]["blog_post_id"] == comment_1.blog_post_id
     assert "user_id" not in data["data"][0]
     assert "user_id" not in data["data"][1]
 
@@ -332,6 +336,8 @@ def test_13_read_my_comments(
     assert data["data"][0]["comment_date"] is not None
     assert data["data"][0]["blog_post_id"] == setup_comment.blog_post_id
     assert data["data"][0]["user_id"] == str(test_user.id)
+    assert data["data"][0]["blog_post_title"] == "Blog Post 1"
+    assert data["data"][0]["blog_post_url"] == "blog-post-1"
 
 
 def test_14_read_my_comments_unauthorized(client: TestClient) -> None:
@@ -748,3 +754,235 @@ def test_39_delete_comment_superuser(
     assert response.status_code == 200
     data = response.json()
     assert data["message"] == "Comment deleted successfully"
+
+
+def test_40_read_comments_for_blog_post_query_count(
+    client: TestClient, db: Session, setup_blog_post: BlogPost
+) -> None:
+    def create_comments(start: int, stop: int) -> None:
+        for i in range(start, stop):
+            user = UserCRUD(db).create_user(
+                user=UserCreate(
+                    name=f"user{i}", email=f"user{i}@email.com", password="password"
+                )
+            )
+            comment = CommentCRUD(db).create_comment(
+                comment=CommentCreate(content=f"Comment {i}"),
+                blog_post_id=setup_blog_post.id,
+                user_id=user.id,
+            )
+            for j in range(2):
+                CommentCRUD(db).create_comment(
+                    comment=CommentCreate(content=f"Reply {j}", reply_to=comment.id),
+                    blog_post_id=setup_blog_post.id,
+                    user_id=user.id,
+                )
+
+    url = f"{settings.API_VERSION_STR}/blogposts/{setup_blog_post.url}/comments"
+
+    def read_comments() -> int:
+        with count_queries() as statements:
+            response = client.get(url)
+        assert response.status_code == 200
+        assert all(
+            len(comment["replies"]) == 2 and comment["username"]
+            for comment in response.json()["data"]
+        )
+        return len(statements)
+
+    create_comments(0, 1)
+    query_count = read_comments()
+    # The blog post, the page of comments and their replies
+    assert query_count == 3
+
+    db.exec(delete(Comment))
+    db.commit()
+    create_comments(1, 11)
+    assert read_comments() == query_count
+
+
+def test_41_read_comments_for_blog_post_with_cursor(
+    client: TestClient, db: Session, test_user: User, setup_blog_post: BlogPost
+) -> None:
+    comments = [
+        CommentCRUD(db).create_comment(
+            comment=CommentCreate(
+                content=f"Test comment {i}",
+                comment_date=datetime.now(UTC) - timedelta(days=i),
+            ),
+            blog_post_id=setup_blog_post.id,
+            user_id=test_user.id,
+        )
+        for i in range(3)
+    ]
+    for i in range(4):
+        CommentCRUD(db).create_comment(
+            comment=CommentCreate(
+                content=f"Test reply {i}",
+                comment_date=datetime.now(UTC) + timedelta(minutes=i),
+                reply_to=comments[0].id,
+            ),
+            blog_post_id=setup_blog_post.id,
+            user_id=test_user.id,
+        )
+    url = f"{settings.API_VERSION_STR}/blogposts/{setup_blog_post.url}/comments"
+
+    response = client.get(f"{url}?limit=2&replies_limit=3")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["count"] == 7
+    assert [comment["id"] for comment in data["data"]] == [
+        comments[0].id,
+        comments[1].id,
+    ]
+    assert data["data"][0]["reply_count"] == 4
+    assert [reply["content"] for reply in data["data"][0]["replies"]] == [
+        "Test reply 0",
+        "Test reply 1",
+        "Test reply 2",
+    ]
+    assert data["data"][0]["next_replies_cursor"] is not None
+    assert data["data"][1]["reply_count"] == 0
+    assert data["data"][1]["next_replies_cursor"] is None
+    assert data["next_cursor"] is not None
+
+    response = client.get(f"{url}?limit=2&cursor={data['next_cursor']}")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["count"] == 7
+    assert [comment["id"] for comment in data["data"]] == [comments[2].id]
+    assert data["next_cursor"] is None
+
+    response = client.get(f"{url}?cursor=invalid")
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
+
+
+def test_42_read_comment_replies(
+    client: TestClient, db: Session, test_user: User, setup_comment: Comment
+) -> None:
+    for i in range(4):
+        CommentCRUD(db).create_comment(
+            comment=CommentCreate(
+                content=f"Test reply {i}",
+                comment_date=datetime.now(UTC) + timedelta(minutes=i),
+                reply_to=setup_comment.id,
+            ),
+            blog_post_id=setup_comment.blog_post_id,
+            user_id=test_user.id,
+        )
+    url = f"{settings.API_VERSION_STR}/blogposts/blog-post-1/comments"
+
+    response = client.get(f"{url}?replies_limit=1")
+    assert response.status_code == 200
+    comment = response.json()["data"][0]
+    assert comment["reply_count"] == 4
+    assert len(comment["replies"]) == 1
+
+    replies_url = f"{url}/{setup_comment.id}/replies"
+    response = client.get(
+        f"{replies_url}?limit=2&cursor={comment['next_replies_cursor']}"
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["count"] == 4
+    assert [reply["content"] for reply in data["data"]] == [
+        "Test reply 1",
+        "Test reply 2",
+    ]
+    assert data["data"][0]["username"] == test_user.name
+    assert "user_id" not in data["data"][0]
+
+    response = client.get(f"{replies_url}?limit=2&cursor={data['next_cursor']}")
+    assert response.status_code == 200
+    data = response.json()
+    assert [reply["content"] for reply in data["data"]] == ["Test reply 3"]
+    assert data["next_cursor"] is None
+
+
+def test_43_read_comment_replies_not_found(
+    client: TestClient, db: Session, setup_comment: Comment
+) -> None:
+    response = client.get(
+        f"{settings.API_VERSION_STR}/blogposts/blog-post-1/comments/9999/replies"
+    )
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Comment not found"
+
+    response = client.get(
+        f"{settings.API_VERSION_STR}/blogposts/not-found/comments/{setup_comment.id}/replies"
+    )
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Blog post not found"
+
+    BlogPostCRUD(db).create_blog_post(
+        blog_post=BlogPostCreate(
+            title="Blog Post 2",
+            url="blog-post-2",
+            content="Content of Blog Post 2",
+            image_path="image.png",
+            tags=[],
+        )
+    )
+    response = client.get(
+        f"{settings.API_VERSION_STR}/blogposts/blog-post-2/comments/{setup_comment.id}/replies"
+    )
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Comment does not belong to this blog post"
+
+
+def test_44_read_my_comments_with_cursor(
+    client: TestClient,
+    db: Session,
+    test_user: User,
+    setup_blog_post: BlogPost,
+    normal_user_token_headers: dict[str, str],
+) -> None:
+    other_user = UserCRUD(db).create_user(
+        user=UserCreate(name="user1", email="user1@email.com", password="password")
+    )
+    CommentCRUD(db).create_comment(
+        comment=CommentCreate(content="Other user's comment"),
+        blog_post_id=setup_blog_post.id,
+        user_id=other_user.id,
+    )
+    comments = [
+        CommentCRUD(db).create_comment(
+            comment=CommentCreate(
+                content=f"Test comment {i}",
+                comment_date=datetime.now(UTC) - timedelta(days=i),
+            ),
+            blog_post_id=setup_blog_post.id,
+            user_id=test_user.id,
+        )
+        for i in range(3)
+    ]
+    url = f"{settings.API_VERSION_STR}/me/comments"
+
+    response = client.get(f"{url}?limit=2", headers=normal_user_token_headers)
+    assert response.status_code == 200
+    data = response.json()
+    # Only the comments of the user are counted
+    assert data["count"] == 3
+    assert [comment["id"] for comment in data["data"]] == [
+        comments[0].id,
+        comments[1].id,
+    ]
+
+    response = client.get(
+        f"{url}?limit=2&cursor={data['next_cursor']}",
+        headers=normal_user_token_headers,
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["count"] == 3
+    assert [comment["id"] for comment in data["data"]] == [comments[2].id]
+    assert data["next_cursor"] is None
+
+
+def test_45_stream_comments_for_blog_post_not_found(client: TestClient) -> None:
+    response = client.get(
+        f"{settings.API_VERSION_STR}/blogposts/not-found/comments/stream"
+    )
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Blog post not found"
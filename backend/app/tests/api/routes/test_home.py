@@ -0,0 +1,69 @@
+from datetime import datetime, UTC
+from fastapi.testclient import TestClient
+import pytest
+from sqlmodel import Session, delete
+
+from app.core.config import settings
+from app.db.crud import BlogPostCRUD, TagCRUD
+from app.models.models import BlogPost, BlogPostArchiveMonth, BlogPostTagLink, Tag
+from app.schemas.blog_post import BlogPostCreate
+from app.schemas.tag import TagCreate
+from app.tests.utils.query_counter import count_queries
+
+
+@pytest.fixture(scope="function", autouse=True)
+def delete_data(db: Session) -> None:
+    db.exec(delete(BlogPostTagLink))
+    db.exec(delete(BlogPost))
+    db.exec(delete(BlogPostArchiveMonth))
+    db.exec(delete(Tag))
+    db.commit()
+
+
+def test_01_read_home_empty(client: TestClient) -> None:
+    response = client.get(f"{settings.API_VERSION_STR}/home/")
+    assert response.status_code == 200
+    assert response.json() == {
+        "featured": [],
+        "recent": [],
+        "recent_count": 0,
+        "tags": [],
+    }
+
+
+def test_02_read_home(client: TestClient, db: Session) -> None:
+    tag = TagCRUD(db).create_tag(tag=TagCreate(name="tag1"))
+    for i, featured in enumerate([True, False, False]):
+        BlogPostCRUD(db).create_blog_post(
+            blog_post=BlogPostCreate(
+                title=f"Blog Post {i}",
+                url=f"blog-post-{i}",
+                content=f"Content of Blog Post {i}",
+                featured=featured,
+                publication_date=datetime(2026, 1, i + 1, tzinfo=UTC),
+                tags=[tag.id],
+            )
+        )
+    response = client.get(
+        f"{settings.API_VERSION_STR}/home/?featured_limit=2&recent_limit=2"
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert [blog_post["url"] for blog_post in data["featured"]] == ["blog-post-0"]
+    assert [blog_post["url"] for blog_post in data["recent"]] == [
+        "blog-post-2",
+        "blog-post-1",
+    ]
+    assert "content" not in data["recent"][0]
+    assert data["recent"][0]["tags"] == [{"id": tag.id, "name": "tag1"}]
+    assert data["recent_count"] == 3
+    assert data["tags"] == [{"id": tag.id, "name": "tag1", "blog_post_count": 3}]
+
+    # Repeated requests are served from the cache
+    with count_queries() as statements:
+        response = client.get(
+            f"{settings.API_VERSION_STR}/home/?featured_limit=2&recent_limit=2"
+        )
+    assert response.status_code == 200
+    assert response.json() == data
+    assert len(statements) == 0
@@ -59,3 +59,44 @@ def test_02_get_sitemap_xml_no_blog_posts(client: TestClient) -> None:
     # No blog post URLs should be present
     assert f"<loc>{settings.FRONTEND_HOST}/articles/" not in xml_content
     assert "</urlset>" in xml_content
+
+
+def test_03_get_sitemap_xml_conditional(
+    client: TestClient, db: Session, setup_blog_post: BlogPost
+) -> None:
+    response = client.get(f"{settings.API_VERSION_STR}/sitemap.xml")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    assert "last-modified" not in response.headers
+
+    response = client.get(
+        f"{settings.API_VERSION_STR}/sitemap.xml", headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 304
+    assert response.content == b""
+
+    BlogPostCRUD(db).create_blog_post(
+        blog_post=BlogPostCreate(
+            title="Blog Post 2", url="blog-post-2", content="Content of Blog Post 2"
+        )
+    )
+    response = client.get(
+        f"{settings.API_VERSION_STR}/sitemap.xml", headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 200
+    assert "blog-post-2" in response.text
+
+    # Deleting a blog post is not hidden by an unchanged time of the latest change
+    response = client.get(f"{settings.API_VERSION_STR}/sitemap.xml")
+    etag = response.headers["etag"]
+    BlogPostCRUD(db).delete_blog_post(blog_post_db=setup_blog_post)
+    response = client.get(
+        f"{settings.API_VERSION_STR}/sitemap.xml",
+        headers={"If-Modified-Since": "Fri, 01 Jan 2100 00:00:00 GMT"},
+    )
+    assert response.status_code == 200
+    assert "blog-post-1" not in response.text
+    response = client.get(
+        f"{settings.API_VERSION_STR}/sitemap.xml", headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 200
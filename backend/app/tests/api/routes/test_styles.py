@@ -0,0 +1,17 @@
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+
+
+def test_01_get_highlight_stylesheet(client: TestClient) -> None:
+    response = client.get(f"{settings.API_VERSION_STR}/styles/highlight.css")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/css")
+    assert ".highlight .nb" in response.text
+    etag = response.headers["etag"]
+
+    response = client.get(
+        f"{settings.API_VERSION_STR}/styles/highlight.css",
+        headers={"If-None-Match": etag},
+    )
+    assert response.status_code == 304
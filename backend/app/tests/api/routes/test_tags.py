@@ -1,3 +1,4 @@
+from datetime import datetime, UTC
 from fastapi.testclient import TestClient
 import pytest
 from sqlmodel import Session, delete
@@ -6,7 +7,8 @@ from app.core.config import settings
 from app.db.crud import TagCRUD, BlogPostCRUD
 from app.models.models import Tag, BlogPost, BlogPostTagLink
 from app.schemas.blog_post import BlogPostCreate
-from app.schemas.tag import TagCreate
+from app.schemas.tag import TagCreate, TagUpdate
+from app.tests.utils.query_counter import count_queries
 
 
 @pytest.fixture(scope="function")
@@ -105,8 +107,13 @@ def test_06_read_tag_with_blog_posts(
     assert len(data["blog_posts"]) == 1
     assert data["blog_posts"][0]["title"] == blog_post.title
     assert data["blog_posts"][0]["url"] == blog_post.url
-    assert data["blog_posts"][0]["content"] == blog_post.content
+    assert "content" not in data["blog_posts"][0]
+    assert data["blog_posts"][0]["excerpt"] == blog_post.excerpt
     assert data["blog_posts"][0]["image_path"] == blog_post.image_path
+    assert data["blog_posts"][0]["tags"] == [
+        {"id": setup_tag.id, "name": setup_tag.name}
+    ]
+    assert data["count"] == 1
 
     # Two blog posts associated with the tag
     BlogPostCRUD(db).create_blog_post(
@@ -122,6 +129,7 @@ def test_06_read_tag_with_blog_posts(
     assert response.status_code == 200
     data = response.json()
     assert len(data["blog_posts"]) == 2
+    assert data["blog_posts"][0]["title"] == "Blog Post 2"
 
 
 def test_07_read_tag_with_blog_posts_not_found(client: TestClient) -> None:
@@ -312,3 +320,117 @@ def test_19_delete_tag_with_blog_posts(
     # Check if the blog post has no tag
     db.refresh(blog_post)
     assert blog_post.tags == []
+
+
+def test_20_read_tags_conditional(
+    client: TestClient, db: Session, setup_tag: Tag
+) -> None:
+    response = client.get(f"{settings.API_VERSION_STR}/tags/")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+
+    response = client.get(
+        f"{settings.API_VERSION_STR}/tags/", headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 304
+
+    TagCRUD(db).update_tag(tag_db=setup_tag, tag_in=TagUpdate(name="test_tag_new"))
+    response = client.get(
+        f"{settings.API_VERSION_STR}/tags/", headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 200
+    assert response.json()["data"][0]["name"] == "test_tag_new"
+
+
+def test_21_read_tag_with_blog_posts_paginated(
+    client: TestClient, db: Session, setup_tag: Tag
+) -> None:
+    other_tag = TagCRUD(db).create_tag(tag=TagCreate(name="other_tag"))
+    for i in range(5):
+        BlogPostCRUD(db).create_blog_post(
+            blog_post=BlogPostCreate(
+                title=f"Blog Post {i}",
+                url=f"blog-post-{i}",
+                content=f"Content of Blog Post {i}",
+                publication_date=datetime(2026, 1, i + 1, tzinfo=UTC),
+                tags=[setup_tag.id, other_tag.id] if i % 2 else [setup_tag.id],
+            )
+        )
+    BlogPostCRUD(db).create_blog_post(
+        blog_post=BlogPostCreate(
+            title="Blog Post 5",
+            url="blog-post-5",
+            content="Content of Blog Post 5",
+            tags=[other_tag.id],
+        )
+    )
+
+    url = f"{settings.API_VERSION_STR}/tags/{setup_tag.id}/blogposts?limit=2"
+    with count_queries() as statements:
+        response = client.get(url)
+    assert response.status_code == 200
+    # The tag, the page of blog posts with their count and the tags of the blog posts
+    assert len(statements) == 3
+    data = response.json()
+    assert data["count"] == 5
+    assert [blog_post["title"] for blog_post in data["blog_posts"]] == [
+        "Blog Post 4",
+        "Blog Post 3",
+    ]
+    assert [tag["name"] for tag in data["blog_posts"][1]["tags"]] == [
+        "test_tag",
+        "other_tag",
+    ]
+
+    titles = []
+    cursor = data["next_cursor"]
+    while cursor:
+        response = client.get(f"{url}&cursor={cursor}&include_count=none")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["count"] is None
+        titles.extend(blog_post["title"] for blog_post in data["blog_posts"])
+        cursor = data["next_cursor"]
+    assert titles == ["Blog Post 2", "Blog Post 1", "Blog Post 0"]
+
+
+def test_22_read_tags_with_counts(
+    client: TestClient, db: Session, setup_tag: Tag
+) -> None:
+    other_tag = TagCRUD(db).create_tag(tag=TagCreate(name="other_tag"))
+    BlogPostCRUD(db).create_blog_post(
+        blog_post=BlogPostCreate(
+            title="Blog Post 1",
+            url="blog-post-1",
+            content="Content of Blog Post 1",
+            tags=[other_tag.id],
+        )
+    )
+
+    url = f"{settings.API_VERSION_STR}/tags/?with_counts=true&order=popular"
+    response = client.get(url)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["count"] == 2
+    assert data["data"] == [
+        {"id": other_tag.id, "name": "other_tag", "blog_post_count": 1},
+        {"id": setup_tag.id, "name": "test_tag", "blog_post_count": 0},
+    ]
+    etag = response.headers["etag"]
+
+    response = client.get(f"{settings.API_VERSION_STR}/tags/?order=popular")
+    assert response.status_code == 200
+    assert response.json()["data"][0] == {"id": other_tag.id, "name": "other_tag"}
+
+    # The counts change with the blog posts, even if the tags do not
+    BlogPostCRUD(db).create_blog_post(
+        blog_post=BlogPostCreate(
+            title="Blog Post 2",
+            url="blog-post-2",
+            content="Content of Blog Post 2",
+            tags=[setup_tag.id, other_tag.id],
+        )
+    )
+    response = client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert [tag["blog_post_count"] for tag in response.json()["data"]] == [2, 1]
@@ -6,6 +6,7 @@ import sqlalchemy
 from sqlalchemy import text
 from sqlmodel import SQLModel, Session, delete, create_engine
 
+from app.core.cache import cache
 from app.core.config import settings
 from app.db.db import init_db, get_session
 from app.main import app
@@ -111,3 +112,9 @@ def normal_user_token_headers(client: TestClient) -> dict[str, str]:
     with Session(test_engine) as session:
         ret = get_user_token_headers(client, session)
     return ret
+
+
+@pytest.fixture(scope="function", autouse=True)
+def clear_cache() -> None:
+    # Tests also change the data directly, bypassing the cache invalidation of the CRUD classes
+    cache.clear()
@@ -0,0 +1,67 @@
+from sqlmodel import Session
+
+from app.core.cache import Cache, cache, invalidate_on_commit
+
+
+def test_01_get_and_set():
+    test_cache = Cache(max_size=10, ttl_seconds=60)
+    assert test_cache.get(("blog_posts", 1)) is None
+    assert test_cache.get(("blog_posts", 1), default="default") == "default"
+
+    test_cache.set(("blog_posts", 1), "value")
+    assert test_cache.get(("blog_posts", 1)) == "value"
+    assert test_cache.stats() == {"hits": 1, "misses": 2, "size": 1}
+
+
+def test_02_lru_eviction():
+    test_cache = Cache(max_size=2, ttl_seconds=60)
+    test_cache.set(("blog_posts", 1), 1)
+    test_cache.set(("blog_posts", 2), 2)
+    # Reading the first entry makes the second one the least recently used
+    assert test_cache.get(("blog_posts", 1)) == 1
+    test_cache.set(("blog_posts", 3), 3)
+
+    assert test_cache.get(("blog_posts", 1)) == 1
+    assert test_cache.get(("blog_posts", 2)) is None
+    assert test_cache.get(("blog_posts", 3)) == 3
+
+
+def test_03_ttl_expiration():
+    test_cache = Cache(max_size=10, ttl_seconds=-1)
+    test_cache.set(("blog_posts", 1), 1)
+    assert test_cache.get(("blog_posts", 1)) is None
+    assert test_cache.stats()["size"] == 0
+
+
+def test_04_invalidate():
+    test_cache = Cache(max_size=10, ttl_seconds=60)
+    test_cache.set(("blog_posts", 1), 1)
+    test_cache.set(("tags", 1), 1)
+
+    test_cache.invalidate("blog_posts")
+    assert test_cache.get(("blog_posts", 1)) is None
+    assert test_cache.get(("tags", 1)) == 1
+
+    # Values read before an invalidation are not cached after it
+    generation = test_cache.generation("tags")
+    test_cache.invalidate("tags")
+    test_cache.set(("tags", 1), 2, generation)
+    assert test_cache.get(("tags", 1)) is None
+    test_cache.set(("tags", 1), 2, test_cache.generation("tags"))
+    assert test_cache.get(("tags", 1)) == 2
+
+    test_cache.clear()
+    assert test_cache.stats() == {"hits": 0, "misses": 0, "size": 0}
+
+
+def test_05_invalidate_on_commit(db: Session):
+    cache.set(("blog_posts", 1), 1)
+
+    invalidate_on_commit(db, "blog_posts")
+    db.rollback()
+    assert cache.get(("blog_posts", 1)) == 1
+
+    invalidate_on_commit(db, "blog_posts")
+    assert cache.get(("blog_posts", 1)) == 1
+    db.commit()
+    assert cache.get(("blog_posts", 1)) is None
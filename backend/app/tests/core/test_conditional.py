@@ -0,0 +1,107 @@
+from datetime import datetime, timedelta, UTC
+from fastapi import Request, Response
+
+from app.core.conditional import check_not_modified, get_etag
+
+
+def get_request(headers: dict[str, str]) -> Request:
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/",
+            "headers": [
+                (name.lower().encode(), value.encode())
+                for name, value in headers.items()
+            ],
+        }
+    )
+
+
+def test_01_get_etag():
+    etag = get_etag("blog_post", "url", datetime(2025, 1, 1))
+    assert etag.startswith('"') and etag.endswith('"')
+    assert etag == get_etag("blog_post", "url", datetime(2025, 1, 1))
+    assert etag != get_etag("blog_post", "url", datetime(2025, 1, 2))
+
+
+def test_02_check_not_modified_sets_headers():
+    response = Response()
+    last_modified = datetime(2025, 1, 1, 12, 30, 15, 123456)
+
+    assert (
+        check_not_modified(get_request({}), response, '"etag"', last_modified) is None
+    )
+    assert response.headers["etag"] == '"etag"'
+    # Rounded up, so changes later within the same second are not hidden
+    assert response.headers["last-modified"] == "Wed, 01 Jan 2025 12:30:16 GMT"
+    assert response.headers["cache-control"] == "no-cache"
+
+
+def test_03_check_not_modified_if_none_match():
+    last_modified = datetime(2025, 1, 1, tzinfo=UTC)
+    for if_none_match in ('"etag"', 'W/"etag"', '"other", "etag"', "*"):
+        not_modified = check_not_modified(
+            get_request({"If-None-Match": if_none_match}),
+            Response(),
+            '"etag"',
+            last_modified,
+        )
+        assert not_modified is not None
+        assert not_modified.status_code == 304
+        assert not_modified.headers["etag"] == '"etag"'
+        assert not_modified.body == b""
+
+    # If-Modified-Since is ignored when If-None-Match is present
+    request = get_request(
+        {
+            "If-None-Match": '"other"',
+            "If-Modified-Since": "Thu, 02 Jan 2025 00:00:00 GMT",
+        }
+    )
+    assert check_not_modified(request, Response(), '"etag"', last_modified) is None
+
+
+def test_04_check_not_modified_if_modified_since():
+    last_modified = datetime(2025, 1, 1, 12, 0, 0, 500000)
+    for if_modified_since, modified in (
+        ("Wed, 01 Jan 2025 12:00:01 GMT", False),
+        ("Thu, 02 Jan 2025 00:00:00 GMT", False),
+        ("Wed, 01 Jan 2025 12:00:00 GMT", True),
+        ("invalid", True),
+    ):
+        not_modified = check_not_modified(
+            get_request({"If-Modified-Since": if_modified_since}),
+            Response(),
+            '"etag"',
+            last_modified,
+        )
+        assert (not_modified is None) is modified
+
+    not_modified = check_not_modified(
+        get_request({"If-Modified-Since": "Thu, 02 Jan 2025 00:00:00 GMT"}),
+        Response(),
+        '"etag"',
+        last_modified + timedelta(days=2),
+    )
+    assert not_modified is None
+
+
+def test_05_check_not_modified_change_within_the_same_second():
+    # Changed within the current second, a later change within it would get the same Last-Modified
+    updated_at = datetime.now(UTC).replace(microsecond=999999)
+    response = Response()
+    assert check_not_modified(get_request({}), response, '"etag"', updated_at) is None
+    assert "last-modified" not in response.headers
+
+    # Once the second is over, Last-Modified is sent, rounded up
+    updated_at = datetime(2025, 1, 1, 12, 0, 0, 100000, tzinfo=UTC)
+    response = Response()
+    check_not_modified(get_request({}), response, '"etag"', updated_at)
+    last_modified = response.headers["last-modified"]
+    assert last_modified == "Wed, 01 Jan 2025 12:00:01 GMT"
+    request = get_request({"If-Modified-Since": last_modified})
+    assert check_not_modified(request, Response(), '"etag"', updated_at) is not None
+    # A change in the next second is detected
+    updated_at = datetime(2025, 1, 1, 12, 0, 1, 200000, tzinfo=UTC)
+    assert check_not_modified(request, Response(), '"etag"', updated_at) is None
@@ -0,0 +1,37 @@
+from app.core.content import (
+    EXCERPT_MAX_LENGTH,
+    get_excerpt,
+    get_word_count,
+    get_reading_time,
+    get_content_summary,
+)
+
+
+def test_01_get_excerpt():
+    assert get_excerpt("") == ""
+    assert get_excerpt("# Title\n\n## Subtitle") == ""
+    assert get_excerpt("First paragraph.\n\nSecond paragraph.") == "First paragraph."
+    assert (
+        get_excerpt("# Title\n\n\n\n  First paragraph.  \n\nSecond paragraph.")
+        == "First paragraph."
+    )
+
+    excerpt = get_excerpt("word " * 200)
+    assert len(excerpt) <= EXCERPT_MAX_LENGTH + 1
+    assert excerpt.endswith("word…")
+
+
+def test_02_get_word_count_and_reading_time():
+    assert get_word_count("") == 0
+    assert get_word_count("# Title\n\nSome  words\nhere.") == 5
+    assert get_reading_time(0) == 1
+    assert get_reading_time(200) == 1
+    assert get_reading_time(201) == 2
+
+
+def test_03_get_content_summary():
+    assert get_content_summary("# Title\n\nContent of the post") == {
+        "excerpt": "Content of the post",
+        "word_count": 6,
+        "reading_time": 1,
+    }
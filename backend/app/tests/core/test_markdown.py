@@ -0,0 +1,88 @@
+from app.core.markdown import (
+    HIGHLIGHT_CSS_CLASS,
+    get_content_hash,
+    get_highlight_css,
+    get_heading_id,
+    get_rendered_content,
+    highlight_cache,
+    highlight_code,
+    render_markdown,
+)
+
+
+def test_01_get_content_hash():
+    assert get_content_hash("content") == get_content_hash("content")
+    assert get_content_hash("content") != get_content_hash("other content")
+    assert len(get_content_hash("content")) == 64
+
+
+def test_02_get_heading_id():
+    used_ids = set()
+    assert get_heading_id("Hello World", used_ids) == "hello-world"
+    assert get_heading_id("Hello World", used_ids) == "hello-world-1"
+    assert get_heading_id("What's new?", used_ids) == "whats-new"
+    assert get_heading_id("!!!", used_ids) == "section"
+
+
+def test_03_render_markdown():
+    content_html, toc = render_markdown(
+        "# Title\n\nSome **bold** text.\n\n## The `code` part\n\n"
+        "| a | b |\n|---|---|\n| 1 | 2 |\n\n~~old~~ <script>alert(1)</script>"
+    )
+    assert '<h1 id="title">Title</h1>' in content_html
+    assert "<strong>bold</strong>" in content_html
+    assert '<h2 id="the-code-part">The <code>code</code> part</h2>' in content_html
+    assert "<table>" in content_html
+    assert "<s>old</s>" in content_html
+    # Raw HTML is escaped
+    assert "<script>" not in content_html
+    assert toc == [
+        {"level": 1, "text": "Title", "id": "title"},
+        {"level": 2, "text": "The code part", "id": "the-code-part"},
+    ]
+
+
+def test_04_get_rendered_content():
+    rendered_content = get_rendered_content("# Title\n\nText.")
+    assert rendered_content["content_html"] == (
+        '<h1 id="title">Title</h1>\n<p>Text.</p>\n'
+    )
+    assert rendered_content["toc"] == [{"level": 1, "text": "Title", "id": "title"}]
+    assert rendered_content["content_hash"] == get_content_hash("# Title\n\nText.")
+
+
+def test_05_highlight_code():
+    highlight_cache.clear()
+    highlighted_code = highlight_code('print("<b>")\n', "python")
+    assert highlighted_code.startswith(
+        f'<pre class="{HIGHLIGHT_CSS_CLASS}"><code class="language-python">'
+    )
+    assert '<span class="nb">print</span>' in highlighted_code
+    assert "&lt;b&gt;" in highlighted_code
+    assert highlight_cache.stats()["misses"] == 1
+
+    # Unchanged code blocks are not highlighted again
+    assert highlight_code('print("<b>")\n', "python") == highlighted_code
+    assert highlight_cache.stats()["hits"] == 1
+
+    # Code blocks without a known language are left to the renderer
+    assert highlight_code("code", "") == ""
+    assert highlight_code("code", "unknown-language") == ""
+
+
+def test_06_render_markdown_code_blocks():
+    content_html, _ = render_markdown(
+        "```python\nx = 1\n```\n\n```unknown-language\na < b\n```"
+    )
+    assert '<pre class="highlight"><code class="language-python">' in content_html
+    assert '<span class="n">x</span>' in content_html
+    assert (
+        '<pre><code class="language-unknown-language">a &lt; b\n</code></pre>'
+        in content_html
+    )
+
+
+def test_07_get_highlight_css():
+    css = get_highlight_css("github-dark")
+    assert f".{HIGHLIGHT_CSS_CLASS} .nb" in css
+    assert get_highlight_css("default") != css
@@ -2,14 +2,25 @@ from datetime import datetime, timedelta, UTC
 from fastapi import HTTPException
 import pytest
 from sqlmodel import Session, select, func, delete
+from typing import Any
 from uuid import UUID
 
+from app.core.cache import cache
 from app.db.crud import TagCRUD, BlogPostCRUD, CommentCRUD, UserCRUD
-from app.models.models import Comment, BlogPost, User, Tag, BlogPostTagLink
+from app.db.pagination import encode_cursor
+from app.models.models import (
+    Comment,
+    BlogPost,
+    BlogPostArchiveMonth,
+    User,
+    Tag,
+    BlogPostTagLink,
+)
 from app.schemas.blog_post import BlogPostCreate, BlogPostUpdate
 from app.schemas.comment import CommentCreate
-from app.schemas.tag import TagCreate
+from app.schemas.tag import TagCreate, TagUpdate
 from app.schemas.user import UserCreate
+from app.tests.utils.query_counter import count_queries, explain
 
 
 @pytest.fixture(scope="function")
@@ -28,11 +39,38 @@ def setup_user(db: Session) -> UUID:
     return user.id
 
 
+def explain_filters(db: Session, **filters: Any) -> str:
+    """
+    Get the query plan of counting the blog posts that match the filters of `read_blog_posts`.
+    The pages are ordered by publication date, which the planner may prefer over the indexes of the filters.
+    """
+    filters = {
+        "search_by": None,
+        "search_value": None,
+        "featured_only": False,
+        "tag_id": None,
+        "tags": None,
+        "tag_match": "all",
+        "published_from": None,
+        "published_to": None,
+        **filters,
+    }
+    statement = (
+        select(func.count())
+        .select_from(BlogPost)
+        .where(*BlogPostCRUD(db)._get_blog_post_filters(**filters))
+    )
+    with count_queries() as statements:
+        db.exec(statement).one()
+    return explain(db, *statements[0])
+
+
 @pytest.fixture(scope="function", autouse=True)
 def delete_data(db: Session) -> None:
     db.exec(delete(Comment))
     db.exec(delete(BlogPostTagLink))
     db.exec(delete(BlogPost))
+    db.exec(delete(BlogPostArchiveMonth))
     db.exec(delete(Tag))
     db.exec(delete(User))
     db.commit()
@@ -501,6 +539,8 @@ def test_11_delete_orphaned_tags_on_update(db: Session) -> None:
 
     count = db.exec(select(func.count()).select_from(Tag)).one()
     assert count == 2
+    # A tag just created and not attached yet is not affected by the blog posts
+    tag3 = tag_crud.create_tag(TagCreate(name="tag3"))
 
     blog_post_update = BlogPostUpdate(tags=[tag1.id])
     blog_post_crud.update_blog_post(
@@ -508,18 +548,18 @@ def test_11_delete_orphaned_tags_on_update(db: Session) -> None:
     )
 
     count = db.exec(select(func.count()).select_from(Tag)).one()
-    assert count == 1
+    assert count == 2
 
-    remaining_tags = db.exec(select(Tag)).all()
+    remaining_tags = db.exec(select(Tag).order_by(Tag.id)).all()
     remaining_tag_ids = [tag.id for tag in remaining_tags]
-    assert remaining_tag_ids == [tag1.id]
+    assert remaining_tag_ids == [tag1.id, tag3.id]
 
 
 def test_12_delete_orphaned_tags_on_delete(db: Session) -> None:
     tag_crud = TagCRUD(db)
     tag1 = tag_crud.create_tag(TagCreate(name="tag1"))
     tag2 = tag_crud.create_tag(TagCreate(name="tag2"))
-    _ = tag_crud.create_tag(TagCreate(name="tag3"))
+    tag3 = tag_crud.create_tag(TagCreate(name="tag3"))
     tag4 = tag_crud.create_tag(TagCreate(name="tag4"))
     blog_post_crud = BlogPostCRUD(db)
     blog_post = blog_post_crud.create_blog_post(
@@ -547,9 +587,774 @@ def test_12_delete_orphaned_tags_on_delete(db: Session) -> None:
 
     blog_post_crud.delete_blog_post(blog_post_db=blog_post)
 
-    count = db.exec(select(func.count()).select_from(Tag)).one()
-    assert count == 1  # only tag4 should remain
+    # Only the tags of the deleted blog post are cleaned up
+    remaining_tags = db.exec(select(Tag).order_by(Tag.id)).all()
+    assert [tag.id for tag in remaining_tags] == [tag3.id, tag4.id]
 
-    remaining_tags = db.exec(select(Tag)).all()
-    remaining_tag_ids = [tag.id for tag in remaining_tags]
-    assert remaining_tag_ids == [tag4.id]
+
+def test_13_read_blog_posts_with_cursor(db: Session) -> None:
+    blog_post_crud = BlogPostCRUD(db)
+    publication_date = datetime.now(UTC)
+    for i in range(1, 6):
+        blog_post_crud.create_blog_post(
+            blog_post=BlogPostCreate(
+                title=f"Blog Post {i}",
+                url=f"blog-post-{i}",
+                content=f"Content of Blog Post {i}",
+                # Blog posts 3 and 4 share the same publication date
+                publication_date=publication_date + timedelta(days=min(i, 3)),
+            )
+        )
+
+    count, first_page = blog_post_crud.read_blog_posts(skip=0, limit=2)
+    assert count == 5
+    assert [blog_post.title for blog_post in first_page] == [
+        "Blog Post 5",
+        "Blog Post 4",
+    ]
+
+    cursor = encode_cursor(first_page[-1].publication_date, first_page[-1].id)
+    count, second_page = blog_post_crud.read_blog_posts(skip=0, limit=2, cursor=cursor)
+    assert count == 5
+    assert [blog_post.title for blog_post in second_page] == [
+        "Blog Post 3",
+        "Blog Post 2",
+    ]
+
+    # Skip is ignored when a cursor is given
+    count, cursor_page = blog_post_crud.read_blog_posts(
+        skip=100, limit=2, cursor=cursor
+    )
+    assert [blog_post.id for blog_post in cursor_page] == [
+        blog_post.id for blog_post in second_page
+    ]
+
+    cursor = encode_cursor(second_page[-1].publication_date, second_page[-1].id)
+    count, last_page = blog_post_crud.read_blog_posts(skip=0, limit=2, cursor=cursor)
+    assert [blog_post.title for blog_post in last_page] == ["Blog Post 1"]
+
+
+def test_14_read_blog_posts_with_invalid_cursor(db: Session) -> None:
+    with pytest.raises(HTTPException) as ex:
+        BlogPostCRUD(db).read_blog_posts(skip=0, limit=10, cursor="invalid")
+    assert ex.value.status_code == 400
+    assert ex.value.detail == "Invalid cursor"
+
+
+def test_15_read_blog_posts_fulltext_search(db: Session) -> None:
+    blog_post_crud = BlogPostCRUD(db)
+    blog_post_1 = blog_post_crud.create_blog_post(
+        blog_post=BlogPostCreate(
+            title="Running databases",
+            url="blog-post-1",
+            content="How to run PostgreSQL in Docker containers.",
+        )
+    )
+    blog_post_2 = blog_post_crud.create_blog_post(
+        blog_post=BlogPostCreate(
+            title="Python tips",
+            url="blog-post-2",
+            content="Some tips about Python, and a word about databases.",
+        )
+    )
+
+    count, blog_posts = blog_post_crud.read_blog_posts(
+        skip=0, limit=10, search_by="fulltext", search_value="nonexistent"
+    )
+    assert count == 0
+    assert len(blog_posts) == 0
+
+    # Stemming matches "containers" with "container"
+    count, blog_posts = blog_post_crud.read_blog_posts(
+        skip=0, limit=10, search_by="fulltext", search_value="container"
+    )
+    assert count == 1
+    assert blog_posts[0].id == blog_post_1.id
+
+    # Matches in the title rank higher than matches in the content
+    count, blog_posts = blog_post_crud.read_blog_posts(
+        skip=0, limit=10, search_by="fulltext", search_value="database"
+    )
+    assert count == 2
+    assert [blog_post.id for blog_post in blog_posts] == [
+        blog_post_1.id,
+        blog_post_2.id,
+    ]
+
+    count, blog_posts = blog_post_crud.read_blog_posts(
+        skip=0, limit=10, search_by="fulltext", search_value="python -docker"
+    )
+    assert count == 1
+    assert blog_posts[0].id == blog_post_2.id
+
+    # The search vector is kept up to date when the blog post changes
+    blog_post_crud.update_blog_post(
+        blog_post_db=blog_post_2, blog_post_in=BlogPostUpdate(content="Docker only")
+    )
+    count, blog_posts = blog_post_crud.read_blog_posts(
+        skip=0, limit=10, search_by="fulltext", search_value="python -docker"
+    )
+    assert count == 0
+
+    headlines = blog_post_crud.read_blog_post_headlines(
+        blog_post_ids=[blog_post_1.id], search_value="docker"
+    )
+    assert list(headlines) == [blog_post_1.id]
+    assert "<mark>Docker</mark>" in headlines[blog_post_1.id]
+    assert blog_post_crud.read_blog_post_headlines([], search_value="docker") == {}
+
+    with pytest.raises(HTTPException) as ex:
+        blog_post_crud.read_blog_posts(
+            skip=0,
+            limit=10,
+            search_by="fulltext",
+            search_value="docker",
+            cursor=encode_cursor(datetime.now(UTC), 1),
+        )
+    assert ex.value.status_code == 400
+
+
+def test_16_read_blog_posts_fuzzy_search(db: Session) -> None:
+    blog_post_crud = BlogPostCRUD(db)
+    blog_post_1 = blog_post_crud.create_blog_post(
+        blog_post=BlogPostCreate(
+            title="Kubernetes for beginners",
+            url="blog-post-1",
+            content="Content of Blog Post 1",
+        )
+    )
+    blog_post_crud.create_blog_post(
+        blog_post=BlogPostCreate(
+            title="Python tips", url="blog-post-2", content="Content of Blog Post 2"
+        )
+    )
+
+    count, blog_posts = blog_post_crud.read_blog_posts(
+        skip=0, limit=10, search_by="fuzzy", search_value="kubernetis"
+    )
+    assert count == 1
+    assert blog_posts[0].id == blog_post_1.id
+
+    count, blog_posts = blog_post_crud.read_blog_posts(
+        skip=0, limit=10, search_by="fuzzy", search_value="golang"
+    )
+    assert count == 0
+    assert len(blog_posts) == 0
+
+
+def test_17_content_summary(db: Session) -> None:
+    blog_post_crud = BlogPostCRUD(db)
+    blog_post = blog_post_crud.create_blog_post(
+        blog_post=BlogPostCreate(
+            title="Blog Post 1",
+            url="blog-post-1",
+            content="# Title\n\nFirst paragraph.\n\nSecond paragraph.",
+        )
+    )
+    assert blog_post.excerpt == "First paragraph."
+    assert blog_post.word_count == 6
+    assert blog_post.reading_time == 1
+
+    # Only a content change updates the summary
+    blog_post = blog_post_crud.update_blog_post(
+        blog_post_db=blog_post, blog_post_in=BlogPostUpdate(title="Blog Post 1 Updated")
+    )
+    assert blog_post.excerpt == "First paragraph."
+
+    blog_post = blog_post_crud.update_blog_post(
+        blog_post_db=blog_post,
+        blog_post_in=BlogPostUpdate(content="New paragraph. " + "word " * 400),
+    )
+    assert blog_post.excerpt.startswith("New paragraph.")
+    assert blog_post.word_count == 402
+    assert blog_post.reading_time == 3
+
+    # The listing does not load the content
+    db.expire_all()
+    _, blog_posts = blog_post_crud.read_blog_posts(skip=0, limit=10)
+    assert "content" not in blog_posts[0].__dict__
+    assert blog_posts[0].excerpt.startswith("New paragraph.")
+
+
+def test_18_read_blog_posts_count_modes(db: Session, setup_tags) -> None:
+    blog_post_crud = BlogPostCRUD(db)
+    for i in range(1, 4):
+        blog_post_crud.create_blog_post(
+            blog_post=BlogPostCreate(
+                title=f"Blog Post {i}",
+                url=f"blog-post-{i}",
+                content=f"Content of Blog Post {i}",
+                tags=[setup_tags[0]] if i < 3 else [],
+            )
+        )
+
+    # The exact count is computed along with the page
+    count, blog_posts = blog_post_crud.read_blog_posts(skip=1, limit=1)
+    assert count == 3
+    assert len(blog_posts) == 1
+    count, blog_posts = blog_post_crud.read_blog_posts(skip=5, limit=1)
+    assert count == 3
+    assert len(blog_posts) == 0
+    count, blog_posts = blog_post_crud.read_blog_posts(
+        skip=0, limit=1, search_by="tag", search_value="tag1"
+    )
+    assert count == 2
+    assert len(blog_posts) == 1
+
+    # With a cursor the count still covers all the matching blog posts
+    _, blog_posts = blog_post_crud.read_blog_posts(skip=0, limit=2)
+    cursor = encode_cursor(blog_posts[-1].publication_date, blog_posts[-1].id)
+    count, blog_posts = blog_post_crud.read_blog_posts(skip=0, limit=2, cursor=cursor)
+    assert count == 3
+    assert len(blog_posts) == 1
+    count, blog_posts = blog_post_crud.read_blog_posts(
+        skip=0, limit=2, cursor=encode_cursor(datetime(2000, 1, 1, tzinfo=UTC), 0)
+    )
+    assert count == 3
+    assert len(blog_posts) == 0
+
+    # The estimated count is a non-negative number, the page is unaffected
+    count, blog_posts = blog_post_crud.read_blog_posts(
+        skip=0, limit=10, include_count="estimated"
+    )
+    assert isinstance(count, int) and count >= 0
+    assert len(blog_posts) == 3
+    count, blog_posts = blog_post_crud.read_blog_posts(
+        skip=0,
+        limit=10,
+        search_by="title",
+        search_value="Post 1",
+        include_count="estimated",
+    )
+    assert isinstance(count, int) and count >= 0
+    assert len(blog_posts) == 1
+
+    count, blog_posts = blog_post_crud.read_blog_posts(
+        skip=0, limit=10, include_count="none"
+    )
+    assert count is None
+    assert len(blog_posts) == 3
+
+
+def test_19_read_blog_posts_from_cache(db: Session, setup_tags) -> None:
+    blog_post_crud = BlogPostCRUD(db)
+    blog_post = blog_post_crud.create_blog_post(
+        blog_post=BlogPostCreate(
+            title="Blog Post 1",
+            url="blog-post-1",
+            content="Content of Blog Post 1",
+            tags=[setup_tags[0]],
+        )
+    )
+
+    _, blog_posts = blog_post_crud.read_blog_posts(skip=0, limit=10)
+    assert cache.stats()["misses"] == 1
+
+    # A new session gets the cached blog posts without querying them
+    with Session(db.get_bind()) as session:
+        count, blog_posts = BlogPostCRUD(session).read_blog_posts(skip=0, limit=10)
+        assert cache.stats()["hits"] == 1
+        assert count == 1
+        assert blog_posts[0] in session
+        assert blog_posts[0].title == "Blog Post 1"
+        assert [tag.name for tag in blog_posts[0].tags] == ["tag1"]
+
+        blog_post_with_tags = BlogPostCRUD(session).read_blog_post_with_tags(
+            blog_post_url="blog-post-1"
+        )
+        blog_post_with_tags = BlogPostCRUD(session).read_blog_post_with_tags(
+            blog_post_url="blog-post-1"
+        )
+        assert cache.stats()["hits"] == 2
+        assert blog_post_with_tags.content == "Content of Blog Post 1"
+
+    # Writes invalidate the cached reads
+    blog_post_crud.update_blog_post(
+        blog_post_db=blog_post, blog_post_in=BlogPostUpdate(title="Blog Post 1 New")
+    )
+    _, blog_posts = blog_post_crud.read_blog_posts(skip=0, limit=10)
+    assert blog_posts[0].title == "Blog Post 1 New"
+
+    TagCRUD(db).update_tag(
+        tag_db=db.get(Tag, setup_tags[0]), tag_in=TagUpdate(name="tag1 new")
+    )
+    blog_post = blog_post_crud.read_blog_post_with_tags(blog_post_url="blog-post-1")
+    assert [tag.name for tag in blog_post.tags] == ["tag1 new"]
+
+    blog_post_crud.delete_blog_post(blog_post_db=blog_post)
+    count, blog_posts = blog_post_crud.read_blog_posts(skip=0, limit=10)
+    assert count == 0
+    assert blog_post_crud.read_blog_post_with_tags(blog_post_url="blog-post-1") is None
+
+
+def test_20_rendered_content(db: Session) -> None:
+    blog_post_crud = BlogPostCRUD(db)
+    blog_post = blog_post_crud.create_blog_post(
+        blog_post=BlogPostCreate(
+            title="Blog Post 1",
+            url="blog-post-1",
+            content="# Title\n\nFirst paragraph.",
+        )
+    )
+    assert (
+        blog_post.content_html == '<h1 id="title">Title</h1>\n<p>First paragraph.</p>\n'
+    )
+    assert blog_post.toc == [{"level": 1, "text": "Title", "id": "title"}]
+    content_hash = blog_post.content_hash
+
+    blog_post = blog_post_crud.update_blog_post(
+        blog_post_db=blog_post,
+        blog_post_in=BlogPostUpdate(content="# Title\n\n## Subtitle"),
+    )
+    assert blog_post.content_html == (
+        '<h1 id="title">Title</h1>\n<h2 id="subtitle">Subtitle</h2>\n'
+    )
+    assert blog_post.toc[1] == {"level": 2, "text": "Subtitle", "id": "subtitle"}
+    assert blog_post.content_hash != content_hash
+
+
+def test_21_reconcile_comment_counters(db: Session, setup_user) -> None:
+    blog_post_crud = BlogPostCRUD(db)
+    blog_post_1 = blog_post_crud.create_blog_post(
+        blog_post=BlogPostCreate(
+            title="Blog Post 1", url="blog-post-1", content="Content of Blog Post 1"
+        )
+    )
+    blog_post_2 = blog_post_crud.create_blog_post(
+        blog_post=BlogPostCreate(
+            title="Blog Post 2", url="blog-post-2", content="Content of Blog Post 2"
+        )
+    )
+    CommentCRUD(db).create_comment(
+        comment=CommentCreate(
+            content="Comment 1", comment_date=datetime.now(UTC) - timedelta(days=1)
+        ),
+        user_id=setup_user,
+        blog_post_id=blog_post_1.id,
+    )
+    assert blog_post_crud.reconcile_comment_counters() == []
+
+    # Drift the counters behind the back of the CRUD classes
+    db.exec(delete(Comment))
+    db.add(Comment(content="Comment 2", blog_post_id=blog_post_2.id))
+    db.commit()
+
+    assert sorted(blog_post_crud.reconcile_comment_counters()) == sorted(
+        [blog_post_1.id, blog_post_2.id]
+    )
+    db.refresh(blog_post_1)
+    db.refresh(blog_post_2)
+    assert blog_post_1.comment_count == 0
+    assert blog_post_1.last_comment_at is None
+    assert blog_post_2.comment_count == 1
+    assert blog_post_2.last_comment_at is not None
+    assert blog_post_crud.reconcile_comment_counters() == []
+
+
+def test_22_delete_orphaned_tags_only_if_tags_changed(db: Session) -> None:
+    tag_crud = TagCRUD(db)
+    tag1 = tag_crud.create_tag(TagCreate(name="tag1"))
+    tag2 = tag_crud.create_tag(TagCreate(name="tag2"))
+    blog_post_crud = BlogPostCRUD(db)
+    blog_post = blog_post_crud.create_blog_post(
+        blog_post=BlogPostCreate(
+            title="Blog Post 1",
+            url="blog-post-1",
+            content="Content of Blog Post 1",
+            tags=[tag1.id],
+        )
+    )
+
+    # The same tags are no change, so the unused tag is kept
+    with count_queries() as statements:
+        blog_post_crud.update_blog_post(
+            blog_post_db=blog_post,
+            blog_post_in=BlogPostUpdate(title="Blog Post 1 updated", tags=[tag1.id]),
+        )
+    assert not any(statement.startswith("DELETE") for statement, _ in statements)
+    assert db.get(Tag, tag2.id) is not None
+
+    blog_post_crud.update_blog_post(
+        blog_post_db=blog_post, blog_post_in=BlogPostUpdate(tags=[tag2.id])
+    )
+    assert [tag.id for tag in db.exec(select(Tag)).all()] == [tag2.id]
+
+    # The orphaned tags are deleted with a single statement
+    with count_queries() as statements:
+        blog_post_crud.delete_blog_post(blog_post_db=blog_post)
+    tag_deletes = [
+        statement
+        for statement, _ in statements
+        if statement.startswith("DELETE FROM tag ")
+    ]
+    assert len(tag_deletes) == 1
+    assert db.exec(select(func.count()).select_from(Tag)).one() == 0
+
+
+def test_23_blog_post_with_tag_names(db: Session, setup_tags) -> None:
+    tag1_id, tag2_id = setup_tags
+    blog_post_crud = BlogPostCRUD(db)
+    blog_post = blog_post_crud.create_blog_post(
+        blog_post=BlogPostCreate(
+            title="Blog Post 1",
+            url="blog-post-1",
+            content="Content of Blog Post 1",
+            tags=[tag1_id],
+            tag_names=["TAG1", "tag2", "tag3"],
+        )
+    )
+    assert sorted(tag.name for tag in blog_post.tags) == ["tag1", "tag2", "tag3"]
+    assert db.exec(select(func.count()).select_from(Tag)).one() == 3
+
+    # Ten new tags are resolved and created with two statements
+    tag_names = [f"new_tag{i}" for i in range(10)]
+    with count_queries() as statements:
+        blog_post = blog_post_crud.update_blog_post(
+            blog_post_db=blog_post,
+            blog_post_in=BlogPostUpdate(tag_names=tag_names),
+        )
+    tag_statements = [
+        statement
+        for statement, _ in statements
+        if statement.startswith(("SELECT tag.", "INSERT INTO tag "))
+    ]
+    assert len(tag_statements) == 2
+    assert sorted(tag.name for tag in blog_post.tags) == tag_names
+    # The tags removed from the blog post are cleaned up
+    assert db.get(Tag, tag2_id) is None
+
+    # Missing tag IDs are reported before any tag is created
+    with pytest.raises(HTTPException) as ex:
+        blog_post_crud.update_blog_post(
+            blog_post_db=blog_post,
+            blog_post_in=BlogPostUpdate(tags=[9998, 9999], tag_names=["tag4"]),
+        )
+    assert ex.value.status_code == 404
+    assert ex.value.detail == "Tags with IDs 9998, 9999 not found"
+    db.rollback()
+    assert db.exec(select(Tag).where(Tag.name == "tag4")).first() is None
+
+    with pytest.raises(ValueError):
+        BlogPostUpdate(tag_names=[" "])
+
+
+def test_24_tag_filters_use_indexes(db: Session, setup_tags) -> None:
+    tag1_id, _ = setup_tags
+    blog_post_crud = BlogPostCRUD(db)
+    blog_post_crud.create_blog_post(
+        blog_post=BlogPostCreate(
+            title="Blog Post 1",
+            url="blog-post-1",
+            content="Content of Blog Post 1",
+            tags=[tag1_id],
+        )
+    )
+
+    with count_queries() as statements:
+        count, blog_posts = blog_post_crud.read_blog_posts(
+            skip=0, limit=10, search_by="tag", search_value="TAG1"
+        )
+    assert count == 1
+    assert "DISTINCT" not in statements[0][0]
+    # Tag names are looked up ignoring case through the index on lower(name)
+    with count_queries() as statements:
+        TagCRUD(db).upsert_tags_by_names(["TAG1"])
+    plan = explain(db, *statements[0])
+    assert "ix_tag_lower_name" in plan
+
+    count, blog_posts = blog_post_crud.read_blog_posts(skip=0, limit=10, tag_id=tag1_id)
+    assert count == 1
+    plan = explain_filters(db, tag_id=tag1_id)
+    assert "ix_blogposttaglink_tag_id_blog_post_id" in plan
+
+    # Underscores are not wildcards in exact matches
+    count, _ = blog_post_crud.read_blog_posts(
+        skip=0, limit=10, search_by="tag", search_value="tag_"
+    )
+    assert count == 0
+
+
+def test_25_tag_names(db: Session, setup_tags) -> None:
+    tag1_id, tag2_id = setup_tags
+    tag_crud = TagCRUD(db)
+    blog_post_crud = BlogPostCRUD(db)
+    for i, tag_ids in enumerate([[tag1_id], [tag2_id, tag1_id], [tag2_id]]):
+        blog_post_crud.create_blog_post(
+            blog_post=BlogPostCreate(
+                title=f"Blog Post {i}",
+                url=f"blog-post-{i}",
+                content=f"Content of Blog Post {i}",
+                publication_date=datetime(2026, 1, i + 1, tzinfo=UTC),
+                tags=tag_ids,
+            )
+        )
+    blog_post = blog_post_crud.get_blog_post_by_url("blog-post-1")
+    assert blog_post.tag_names == ["tag1", "tag2"]
+
+    def read_titles(tags: list[str], tag_match: str = "all") -> list[str]:
+        with count_queries() as statements:
+            _, blog_posts = blog_post_crud.read_blog_posts(
+                skip=0, limit=10, tags=tags, tag_match=tag_match
+            )
+        assert "JOIN" not in statements[0][0] and "EXISTS" not in statements[0][0]
+        return [blog_post.title for blog_post in blog_posts]
+
+    assert read_titles(["tag1"]) == ["Blog Post 1", "Blog Post 0"]
+    assert read_titles(["tag1", "tag2"]) == ["Blog Post 1"]
+    assert read_titles(["tag1", "tag2"], "any") == [
+        "Blog Post 2",
+        "Blog Post 1",
+        "Blog Post 0",
+    ]
+    assert read_titles(["tag3"], "any") == []
+
+    # The tag names follow the changes of the tags of the blog post
+    blog_post = blog_post_crud.update_blog_post(
+        blog_post_db=blog_post, blog_post_in=BlogPostUpdate(tag_names=["tag3"])
+    )
+    assert blog_post.tag_names == ["tag3"]
+
+    # And of the tags themselves
+    tag1 = db.get(Tag, tag1_id)
+    tag_crud.update_tag(tag_db=tag1, tag_in=TagUpdate(name="tag1_renamed"))
+    assert read_titles(["tag1_renamed"]) == ["Blog Post 0"]
+    assert read_titles(["tag1"], "any") == []
+    tag_crud.delete_tag(tag_db=db.get(Tag, tag2_id))
+    names = db.exec(select(BlogPost.tag_names).order_by(BlogPost.title)).all()
+    assert names == [["tag1_renamed"], ["tag3"], []]
+
+    plan = explain_filters(db, tags=["tag3"])
+    assert "ix_blogpost_tag_names" in plan
+
+
+def test_26_read_blog_posts_combined_filters_and_facets(db: Session) -> None:
+    blog_post_crud = BlogPostCRUD(db)
+    for i, (year, tag_names, featured) in enumerate(
+        [
+            (2024, ["python"], False),
+            (2025, ["python", "fastapi"], True),
+            (2025, ["python", "sql"], False),
+            (2026, [], True),
+        ]
+    ):
+        blog_post_crud.create_blog_post(
+            blog_post=BlogPostCreate(
+                title=f"Blog Post {i}",
+                url=f"blog-post-{i}",
+                content=f"Content of Blog Post {i}",
+                publication_date=datetime(year, 6, 1, tzinfo=UTC),
+                featured=featured,
+                tag_names=tag_names,
+            )
+        )
+
+    count, blog_posts = blog_post_crud.read_blog_posts(
+        skip=0,
+        limit=10,
+        search_by="title",
+        search_value="Blog Post",
+        tags=["python"],
+        published_from=datetime(2025, 1, 1, tzinfo=UTC),
+        published_to=datetime(2026, 1, 1, tzinfo=UTC),
+        featured_only=True,
+    )
+    assert count == 1
+    assert [blog_post.title for blog_post in blog_posts] == ["Blog Post 1"]
+
+    # Both facets come from a single statement
+    with count_queries() as statements:
+        facets = blog_post_crud.read_blog_post_facets()
+    assert len(statements) == 1
+    assert facets == {
+        "tags": [("python", 3), ("fastapi", 1), ("sql", 1)],
+        "years": [(2026, 1), (2025, 2), (2024, 1)],
+    }
+
+    facets = blog_post_crud.read_blog_post_facets(
+        tags=["python"], published_from=datetime(2025, 1, 1, tzinfo=UTC)
+    )
+    assert facets == {
+        "tags": [("python", 2), ("fastapi", 1), ("sql", 1)],
+        "years": [(2025, 2)],
+    }
+    facets = blog_post_crud.read_blog_post_facets(search_by="title", search_value="x")
+    assert facets == {"tags": [], "years": []}
+
+
+def test_27_archive(db: Session) -> None:
+    blog_post_crud = BlogPostCRUD(db)
+    blog_posts = [
+        blog_post_crud.create_blog_post(
+            blog_post=BlogPostCreate(
+                title=f"Blog Post {i}",
+                url=f"blog-post-{i}",
+                content=f"Content of Blog Post {i}",
+                publication_date=publication_date,
+            )
+        )
+        for i, publication_date in enumerate(
+            [
+                datetime(2025, 12, 31, 23, 0, tzinfo=UTC),
+                datetime(2026, 1, 15, tzinfo=UTC),
+                datetime(2026, 1, 20, tzinfo=UTC),
+            ]
+        )
+    ]
+    assert blog_post_crud.read_archive() == [(2026, 1, 2), (2025, 12, 1)]
+
+    # Served from the cache until the blog posts change
+    with count_queries() as statements:
+        blog_post_crud.read_archive()
+    assert len(statements) == 0
+
+    blog_post_crud.update_blog_post(
+        blog_post_db=blog_posts[1],
+        blog_post_in=BlogPostUpdate(publication_date=datetime(2026, 2, 1, tzinfo=UTC)),
+    )
+    # Updates keeping the publication date do not change the archive
+    blog_post_crud.update_blog_post(
+        blog_post_db=blog_posts[2],
+        blog_post_in=BlogPostUpdate(
+            title="Blog Post 2 updated",
+            publication_date=blog_posts[2].publication_date,
+        ),
+    )
+    assert blog_post_crud.read_archive() == [(2026, 2, 1), (2026, 1, 1), (2025, 12, 1)]
+
+    blog_post_crud.delete_blog_post(blog_post_db=blog_posts[0])
+    assert blog_post_crud.read_archive() == [(2026, 2, 1), (2026, 1, 1)]
+
+    # The archive matches the blog posts
+    year = func.extract("year", BlogPost.publication_date)
+    month = func.extract("month", BlogPost.publication_date)
+    statement = (
+        select(year, month, func.count())
+        .group_by(year, month)
+        .order_by(year.desc(), month.desc())
+    )
+    assert [tuple(map(int, row)) for row in db.exec(statement).all()] == (
+        blog_post_crud.read_archive()
+    )
+
+    # The date range filter of the listing is served by the publication date index
+    with count_queries() as statements:
+        count, _ = blog_post_crud.read_blog_posts(
+            skip=0,
+            limit=10,
+            published_from=datetime(2026, 1, 1, tzinfo=UTC),
+            published_to=datetime(2026, 2, 1, tzinfo=UTC),
+        )
+    assert count == 1
+    plan = explain(db, *statements[0])
+    assert "ix_blogpost_publication_date_id" in plan
+
+
+def test_28_read_home(db: Session, setup_tags) -> None:
+    tag1_id, tag2_id = setup_tags
+    blog_post_crud = BlogPostCRUD(db)
+    blog_posts = [
+        blog_post_crud.create_blog_post(
+            blog_post=BlogPostCreate(
+                title=f"Blog Post {i}",
+                url=f"blog-post-{i}",
+                content=f"Content of Blog Post {i}",
+                featured=featured,
+                publication_date=datetime(2026, 1, i + 1, tzinfo=UTC),
+                tags=tags,
+            )
+        )
+        for i, (featured, tags) in enumerate(
+            [
+                (True, [tag1_id]),
+                (False, [tag1_id, tag2_id]),
+                (True, [tag2_id]),
+                (False, []),
+            ]
+        )
+    ]
+    with count_queries() as statements:
+        home = blog_post_crud.read_home(featured_limit=1, recent_limit=2, tags_limit=10)
+    # Each page of blog posts with its tags and the count, and the tags with their counts
+    assert len(statements) == 5
+    assert [blog_post.id for blog_post in home["featured"]] == [blog_posts[2].id]
+    assert [blog_post.id for blog_post in home["recent"]] == [
+        blog_posts[3].id,
+        blog_posts[2].id,
+    ]
+    assert home["recent_count"] == 4
+    assert [(tag.name, count) for tag, count in home["tags"]] == [
+        ("tag1", 2),
+        ("tag2", 2),
+    ]
+
+    # Served from the cache as a whole until the blog posts change
+    with count_queries() as statements:
+        blog_post_crud.read_home(featured_limit=1, recent_limit=2, tags_limit=10)
+    assert len(statements) == 0
+
+    blog_post_crud.update_blog_post(
+        blog_post_db=blog_posts[3], blog_post_in=BlogPostUpdate(featured=True)
+    )
+    home = blog_post_crud.read_home(featured_limit=1, recent_limit=2, tags_limit=10)
+    assert [blog_post.id for blog_post in home["featured"]] == [blog_posts[3].id]
+
+    # The featured blog posts are read from the partial index
+    plan = explain_filters(db, featured_only=True)
+    assert "ix_blogpost_featured_publication_date_id" in plan
+
+
+def test_29_read_blog_post_headlines_escaped(db: Session) -> None:
+    blog_post_crud = BlogPostCRUD(db)
+    blog_post = blog_post_crud.create_blog_post(
+        blog_post=BlogPostCreate(
+            title="Python tips",
+            url="python-tips",
+            content=(
+                "Python tip: <img src=x onerror=alert(1)> inline html in python posts "
+                "<script>alert(2)</script>"
+            ),
+        )
+    )
+    headline = blog_post_crud.read_blog_post_headlines(
+        blog_post_ids=[blog_post.id], search_value="python"
+    )[blog_post.id]
+    # Only the matches are marked up, the HTML of the content is escaped
+    assert "<mark>Python</mark>" in headline
+    assert "&lt;img src=x onerror=alert(1)&gt;" in headline
+    assert "<img" not in headline
+    assert "<script>" not in headline
+    assert headline.replace("<mark>", "").replace("</mark>", "").count("<") == 0
+
+
+def test_30_tag_names_case_insensitive(db: Session) -> None:
+    tag_crud = TagCRUD(db)
+    blog_post_crud = BlogPostCRUD(db)
+    blog_post = blog_post_crud.create_blog_post(
+        blog_post=BlogPostCreate(
+            title="Blog Post 1",
+            url="blog-post-1",
+            content="Content of Blog Post 1",
+            tag_names=["Python", "FastAPI"],
+        )
+    )
+    assert blog_post.tag_names == ["fastapi", "python"]
+
+    # The tag name filter matches like the search by tag
+    for tags in (["python"], ["PYTHON"], ["Python", "fastapi"]):
+        count, _ = blog_post_crud.read_blog_posts(skip=0, limit=10, tags=tags)
+        assert count == 1
+    count, _ = blog_post_crud.read_blog_posts(
+        skip=0, limit=10, search_by="tag", search_value="python"
+    )
+    assert count == 1
+
+    # The facets show the names of the tags
+    facets = blog_post_crud.read_blog_post_facets(tags=["python"])
+    assert facets["tags"] == [("FastAPI", 1), ("Python", 1)]
+
+    tag = tag_crud.get_tag_by_name("Python")
+    tag_crud.update_tag(tag_db=tag, tag_in=TagUpdate(name="Python3"))
+    count, _ = blog_post_crud.read_blog_posts(skip=0, limit=10, tags=["python3"])
+    assert count == 1
+    tag_crud.delete_tag(tag_db=tag)
+    assert db.exec(select(BlogPost.tag_names)).one() == ["fastapi"]
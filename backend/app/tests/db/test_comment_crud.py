@@ -1,13 +1,15 @@
 from datetime import datetime, timedelta, UTC
 import pytest
-from sqlmodel import Session, select, func, delete
+from sqlmodel import Session, select, func, delete, update
 from uuid import UUID
 
 from app.db.crud import CommentCRUD, BlogPostCRUD, UserCRUD
+from app.db.pagination import get_next_cursor
 from app.models.models import Comment, BlogPost, User
 from app.schemas.blog_post import BlogPostCreate
 from app.schemas.comment import CommentCreate, CommentUpdate
 from app.schemas.user import UserCreate
+from app.tests.utils.query_counter import count_queries, explain
 
 
 @pytest.fixture(scope="function")
@@ -85,8 +87,10 @@ def test_03_read_comments_with_username(db: Session, setup_user_and_blog_post) -
         blog_post_id=blog_post_id,
     )
 
-    count, comments = comment_crud.read_comments_with_username(skip=0, limit=10)
+    with count_queries() as statements:
+        count, comments = comment_crud.read_comments_with_username(skip=0, limit=10)
     print(comments)
+    assert len(statements) == 1
     assert count == 1
     assert len(comments) == 1
     assert comments[0].user.name == "user1"
@@ -265,3 +269,305 @@ def test_09_delete_comment(db: Session, setup_user_and_blog_post) -> None:
     comment_crud.delete_comment(comment=comment)
     count = db.exec(select(func.count()).select_from(Comment)).one()
     assert count == 0
+
+
+def test_10_read_replies_for_comments(db: Session, setup_user_and_blog_post) -> None:
+    user_id, blog_post_id = setup_user_and_blog_post
+    comment_crud = CommentCRUD(db)
+    comment_1 = comment_crud.create_comment(
+        comment=CommentCreate(content="Comment 1"),
+        user_id=user_id,
+        blog_post_id=blog_post_id,
+    )
+    comment_2 = comment_crud.create_comment(
+        comment=CommentCreate(content="Comment 2"),
+        user_id=user_id,
+        blog_post_id=blog_post_id,
+    )
+    for i in range(2):
+        comment_crud.create_comment(
+            comment=CommentCreate(
+                content=f"Comment 1 reply {i}",
+                comment_date=datetime.now(UTC) + timedelta(minutes=i),
+                reply_to=comment_1.id,
+            ),
+            user_id=user_id,
+            blog_post_id=blog_post_id,
+        )
+
+    replies = comment_crud.read_replies_for_comments(
+        comment_ids=[comment_1.id, comment_2.id]
+    )
+    reply_count, comment_1_replies = replies[comment_1.id]
+    assert reply_count == 2
+    assert [reply.content for reply in comment_1_replies] == [
+        "Comment 1 reply 0",
+        "Comment 1 reply 1",
+    ]
+    assert comment_1_replies[0].user.name == "user1"
+    assert replies[comment_2.id] == (0, [])
+    assert comment_crud.read_replies_for_comments(comment_ids=[]) == {}
+
+    replies = comment_crud.read_replies_for_comments(
+        comment_ids=[comment_1.id, comment_2.id], limit=1
+    )
+    reply_count, comment_1_replies = replies[comment_1.id]
+    assert reply_count == 2
+    assert [reply.content for reply in comment_1_replies] == ["Comment 1 reply 0"]
+
+    replies = comment_crud.read_replies_for_comments(
+        comment_ids=[comment_1.id], limit=0
+    )
+    assert replies[comment_1.id] == (2, [])
+
+
+def test_11_comment_queries_use_indexes(db: Session, setup_user_and_blog_post) -> None:
+    user_id, blog_post_id = setup_user_and_blog_post
+    comment_crud = CommentCRUD(db)
+    comment = comment_crud.create_comment(
+        comment=CommentCreate(content="Comment 1"),
+        user_id=user_id,
+        blog_post_id=blog_post_id,
+    )
+
+    with count_queries() as statements:
+        comment_crud.read_comments_for_blog_post(
+            blog_post_id=blog_post_id, skip=0, limit=10
+        )
+    plan = explain(db, *statements[-1])
+    assert "ix_comment_blog_post_id_reply_to_comment_date" in plan
+
+    with count_queries() as statements:
+        comment_crud.read_replies_for_comments(comment_ids=[comment.id])
+    plan = explain(db, *statements[-1])
+    assert "ix_comment_reply_to_comment_date" in plan
+
+    with count_queries() as statements:
+        comment_crud.read_comments_for_user(user_id=user_id, skip=0, limit=10)
+    plan = explain(db, *statements[-1])
+    assert "ix_comment_user_id_comment_date" in plan
+
+
+def test_12_read_comments_for_blog_post_with_cursor(
+    db: Session, setup_user_and_blog_post
+) -> None:
+    user_id, blog_post_id = setup_user_and_blog_post
+    comment_crud = CommentCRUD(db)
+    comment_date = datetime.now(UTC)
+    for i in range(3):
+        comment_crud.create_comment(
+            # The same date for all the comments, so they are ordered by ID
+            comment=CommentCreate(content=f"Comment {i}", comment_date=comment_date),
+            user_id=user_id,
+            blog_post_id=blog_post_id,
+        )
+
+    count, comments = comment_crud.read_comments_for_blog_post(
+        blog_post_id=blog_post_id, skip=0, limit=2
+    )
+    assert count == 3
+    assert [comment.content for comment in comments] == ["Comment 2", "Comment 1"]
+
+    cursor = get_next_cursor(comments, 2, "comment_date", "id")
+    count, comments = comment_crud.read_comments_for_blog_post(
+        blog_post_id=blog_post_id, skip=10, limit=2, cursor=cursor
+    )
+    assert count == 3
+    assert [comment.content for comment in comments] == ["Comment 0"]
+
+
+def test_13_read_comment_replies_with_cursor(
+    db: Session, setup_user_and_blog_post
+) -> None:
+    user_id, blog_post_id = setup_user_and_blog_post
+    comment_crud = CommentCRUD(db)
+    comment = comment_crud.create_comment(
+        comment=CommentCreate(content="Comment 1"),
+        user_id=user_id,
+        blog_post_id=blog_post_id,
+    )
+    for i in range(3):
+        comment_crud.create_comment(
+            comment=CommentCreate(
+                content=f"Reply {i}",
+                comment_date=datetime.now(UTC) + timedelta(minutes=i),
+                reply_to=comment.id,
+            ),
+            user_id=user_id,
+            blog_post_id=blog_post_id,
+        )
+
+    count, replies = comment_crud.read_comment_replies(comment_id=comment.id, limit=2)
+    assert count == 3
+    assert [reply.content for reply in replies] == ["Reply 0", "Reply 1"]
+    assert replies[0].user.name == "user1"
+
+    cursor = get_next_cursor(replies, 2, "comment_date", "id")
+    count, replies = comment_crud.read_comment_replies(
+        comment_id=comment.id, limit=2, cursor=cursor
+    )
+    assert count == 3
+    assert [reply.content for reply in replies] == ["Reply 2"]
+
+
+def test_14_comment_counters(db: Session, setup_user_and_blog_post) -> None:
+    user_id, blog_post_id = setup_user_and_blog_post
+    comment_crud = CommentCRUD(db)
+    comment_date = datetime.now(UTC) - timedelta(days=1)
+    comment_1 = comment_crud.create_comment(
+        comment=CommentCreate(content="Comment 1", comment_date=comment_date),
+        user_id=user_id,
+        blog_post_id=blog_post_id,
+    )
+    comment_2 = comment_crud.create_comment(
+        comment=CommentCreate(
+            content="Comment 2", comment_date=comment_date - timedelta(days=1)
+        ),
+        user_id=user_id,
+        blog_post_id=blog_post_id,
+    )
+    reply = comment_crud.create_comment(
+        comment=CommentCreate(content="Comment 1 reply", reply_to=comment_1.id),
+        user_id=user_id,
+        blog_post_id=blog_post_id,
+    )
+    comment_crud.create_comment(
+        comment=CommentCreate(content="Comment 1 reply 2", reply_to=comment_1.id),
+        user_id=user_id,
+        blog_post_id=blog_post_id,
+    )
+
+    blog_post = db.get(BlogPost, blog_post_id)
+    assert blog_post.comment_count == 4
+    assert blog_post.last_comment_at > comment_date.replace(tzinfo=None)
+
+    # Deleting a comment deletes its replies too
+    reply_id = reply.id
+    comment_crud.delete_comment(comment=comment_1)
+    db.refresh(blog_post)
+    assert blog_post.comment_count == 1
+    assert blog_post.last_comment_at == comment_2.comment_date
+    assert db.get(Comment, reply_id) is None
+
+    comment_crud.update_comment(
+        comment_db=comment_2, comment_in=CommentUpdate(comment_date=comment_date)
+    )
+    db.refresh(blog_post)
+    assert blog_post.comment_count == 1
+    assert blog_post.last_comment_at == comment_date.replace(tzinfo=None)
+
+    comment_crud.delete_comment(comment=comment_2)
+    db.refresh(blog_post)
+    assert blog_post.comment_count == 0
+    assert blog_post.last_comment_at is None
+
+
+def test_15_read_comments_for_user_with_cursor(
+    db: Session, setup_user_and_blog_post
+) -> None:
+    user_id, blog_post_id = setup_user_and_blog_post
+    other_user = UserCRUD(db).create_user(
+        user=UserCreate(name="user2", email="user2@email.com", password="password")
+    )
+    comment_crud = CommentCRUD(db)
+    comment_crud.create_comment(
+        comment=CommentCreate(content="Other user's comment"),
+        user_id=other_user.id,
+        blog_post_id=blog_post_id,
+    )
+    comment_date = datetime.now(UTC)
+    for i in range(3):
+        comment_crud.create_comment(
+            # The same date for all the comments, so they are ordered by ID
+            comment=CommentCreate(content=f"Comment {i}", comment_date=comment_date),
+            user_id=user_id,
+            blog_post_id=blog_post_id,
+        )
+
+    count, comments = comment_crud.read_comments_for_user(
+        user_id=user_id, skip=0, limit=2
+    )
+    assert count == 3
+    assert [comment.content for comment in comments] == ["Comment 2", "Comment 1"]
+    assert comments[0].blog_post.title == "Blog Post 1"
+    assert comments[0].blog_post.url == "blog-post-1"
+
+    cursor = get_next_cursor(comments, 2, "comment_date", "id")
+    count, comments = comment_crud.read_comments_for_user(
+        user_id=user_id, skip=10, limit=2, cursor=cursor
+    )
+    assert count == 3
+    assert [comment.content for comment in comments] == ["Comment 0"]
+
+
+def test_16_reply_counters(db: Session, setup_user_and_blog_post) -> None:
+    user_id, blog_post_id = setup_user_and_blog_post
+    comment_crud = CommentCRUD(db)
+    comment = comment_crud.create_comment(
+        comment=CommentCreate(content="Comment 1"),
+        user_id=user_id,
+        blog_post_id=blog_post_id,
+    )
+    replies = [
+        comment_crud.create_comment(
+            comment=CommentCreate(
+                content=f"Comment 1 reply {i}",
+                comment_date=datetime.now(UTC) + timedelta(minutes=i),
+                reply_to=comment.id,
+            ),
+            user_id=user_id,
+            blog_post_id=blog_post_id,
+        )
+        for i in range(5)
+    ]
+    db.refresh(comment)
+    assert comment.reply_count == 5
+
+    comment_crud.delete_comment(comment=replies[0])
+    db.refresh(comment)
+    assert comment.reply_count == 4
+
+    # The count comes from the counter, only the first replies are read
+    with count_queries() as statements:
+        reply_count, first_replies = comment_crud.read_replies_for_comments(
+            comment_ids=[comment.id], limit=2
+        )[comment.id]
+    assert reply_count == 4
+    assert [reply.id for reply in first_replies] == [replies[1].id, replies[2].id]
+    assert "count(" not in statements[0][0].lower()
+    assert "LATERAL" in statements[0][0]
+
+    # Drift the counter behind the back of the CRUD class
+    db.exec(delete(Comment).where(Comment.id == replies[1].id))
+    db.commit()
+    assert comment_crud.reconcile_reply_counts() == [comment.id]
+    db.refresh(comment)
+    assert comment.reply_count == 3
+    assert comment_crud.reconcile_reply_counts() == []
+
+
+def test_17_read_comments_for_user_without_blog_post(
+    db: Session, setup_user_and_blog_post
+) -> None:
+    user_id, blog_post_id = setup_user_and_blog_post
+    comment_crud = CommentCRUD(db)
+    comment_1 = comment_crud.create_comment(
+        comment=CommentCreate(content="Comment 1"),
+        user_id=user_id,
+        blog_post_id=blog_post_id,
+    )
+    comment_2 = comment_crud.create_comment(
+        comment=CommentCreate(content="Comment 2"),
+        user_id=user_id,
+        blog_post_id=blog_post_id,
+    )
+    db.exec(update(Comment).where(Comment.id == comment_1.id).values(blog_post_id=None))
+    db.commit()
+    db.expire_all()
+
+    count, comments = comment_crud.read_comments_for_user(
+        user_id=user_id, skip=0, limit=10
+    )
+    assert count == 1
+    assert [comment.id for comment in comments] == [comment_2.id]
+    assert comments[0].blog_post.title == "Blog Post 1"
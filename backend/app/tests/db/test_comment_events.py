@@ -0,0 +1,195 @@
+import asyncio
+import json
+import psycopg
+import pytest
+from sqlalchemy import make_url
+from sqlmodel import Session, delete
+
+from app.core.config import settings
+from app.db.comment_events import (
+    COMMENT_EVENTS_CHANNEL,
+    CommentEventBroker,
+    comment_events,
+    format_comment_event,
+    stream_comment_events,
+)
+from app.db.crud import BlogPostCRUD, CommentCRUD, UserCRUD
+from app.db.notifications import listen
+from app.models.models import BlogPost, Comment, User
+from app.schemas.blog_post import BlogPostCreate
+from app.schemas.comment import CommentCreate, CommentUpdate
+from app.schemas.user import UserCreate
+
+
+test_db_url = make_url(str(settings.TEST_DATABASE_URL))
+test_db_conninfo = test_db_url.set(drivername="postgresql").render_as_string(
+    hide_password=False
+)
+
+
+@pytest.fixture(scope="function")
+def setup_user_and_blog_post(db: Session) -> tuple[User, BlogPost]:
+    user = UserCRUD(db).create_user(
+        user=UserCreate(name="user1", email="user1@email.com", password="password")
+    )
+    blog_post = BlogPostCRUD(db).create_blog_post(
+        blog_post=BlogPostCreate(
+            title="Blog Post 1",
+            url="blog-post-1",
+            content="Content of Blog Post 1",
+            tags=[],
+        )
+    )
+    return user, blog_post
+
+
+@pytest.fixture(scope="function", autouse=True)
+def delete_data(db: Session) -> None:
+    db.exec(delete(Comment))
+    db.exec(delete(BlogPost))
+    db.exec(delete(User))
+    db.commit()
+
+
+def test_01_broker() -> None:
+    async def run_broker() -> None:
+        broker = CommentEventBroker(queue_size=2)
+        queue_1 = broker.subscribe(1)
+        queue_2 = broker.subscribe(2)
+        assert broker.subscriber_count(1) == 1
+
+        # The events only reach the subscribers to their blog post
+        broker.broadcast({"type": "created", "blog_post_id": 1, "comment": {}})
+        assert queue_1.qsize() == 1
+        assert queue_2.qsize() == 0
+
+        # A subscriber that falls behind is dropped and told to close its stream
+        broker.broadcast({"type": "created", "blog_post_id": 1, "comment": {}})
+        broker.broadcast({"type": "created", "blog_post_id": 1, "comment": {}})
+        assert broker.subscriber_count(1) == 0
+        assert [queue_1.get_nowait() for _ in range(3)][-1] is None
+
+        broker.unsubscribe(2, queue_2)
+        broker.unsubscribe(2, queue_2)
+        assert broker.subscriber_count(2) == 0
+
+    asyncio.run(run_broker())
+
+
+def test_02_publish_on_write(db: Session, setup_user_and_blog_post) -> None:
+    user, blog_post = setup_user_and_blog_post
+    comment_crud = CommentCRUD(db)
+    with psycopg.connect(test_db_conninfo, autocommit=True) as connection:
+        connection.execute(f"LISTEN {COMMENT_EVENTS_CHANNEL}")
+
+        comment = comment_crud.create_comment(
+            comment=CommentCreate(content="Comment 1"),
+            user_id=user.id,
+            blog_post_id=blog_post.id,
+        )
+        comment_crud.update_comment(
+            comment_db=comment, comment_in=CommentUpdate(content="Comment 1 updated")
+        )
+        comment_id = comment.id
+        comment_crud.delete_comment(comment=comment)
+
+        events = [
+            json.loads(notification.payload)
+            for notification in connection.notifies(timeout=5, stop_after=3)
+        ]
+        assert [event["type"] for event in events] == ["created", "updated", "deleted"]
+        assert all(event["blog_post_id"] == blog_post.id for event in events)
+        assert events[0]["comment"]["id"] == comment_id
+        assert events[0]["comment"]["content"] == "Comment 1"
+        assert events[0]["comment"]["username"] == "user1"
+        assert "user_id" not in events[0]["comment"]
+        assert events[1]["comment"]["content"] == "Comment 1 updated"
+        assert events[2]["comment"] == {"id": comment_id, "reply_to": None}
+
+
+def test_03_stream_comment_events(db: Session, setup_user_and_blog_post) -> None:
+    user, blog_post = setup_user_and_blog_post
+
+    def create_comment() -> None:
+        CommentCRUD(db).create_comment(
+            comment=CommentCreate(content="Comment 1"),
+            user_id=user.id,
+            blog_post_id=blog_post.id,
+        )
+
+    async def read_stream() -> list[str]:
+        ready = asyncio.Event()
+        listener = asyncio.create_task(listen(test_db_url, ready))
+        stream = stream_comment_events(blog_post.id)
+        try:
+            messages = [await anext(stream)]
+            assert comment_events.subscriber_count(blog_post.id) == 1
+            # The events published before the listener is ready are lost
+            await asyncio.wait_for(ready.wait(), timeout=5)
+            await asyncio.to_thread(create_comment)
+            messages.append(await asyncio.wait_for(anext(stream), timeout=5))
+            return messages
+        finally:
+            await stream.aclose()
+            listener.cancel()
+
+    messages = asyncio.run(read_stream())
+    assert messages[0].startswith("retry: ")
+    assert messages[1].startswith("event: created\ndata: ")
+    assert json.loads(messages[1].split("data: ")[1])["content"] == "Comment 1"
+    assert comment_events.subscriber_count(blog_post.id) == 0
+
+
+def test_04_format_comment_event() -> None:
+    event = {"type": "deleted", "blog_post_id": 1, "comment": {"id": 2}}
+    assert format_comment_event(event) == 'event: deleted\ndata: {"id": 2}\n\n'
+
+
+def test_05_publish_long_multibyte_comment(
+    db: Session, setup_user_and_blog_post
+) -> None:
+    user, blog_post = setup_user_and_blog_post
+    comment_crud = CommentCRUD(db)
+    # Escaped as ASCII, the content alone would exceed the 8000 bytes of a notification payload
+    content = "\U0001f600" * 1000
+    with psycopg.connect(test_db_conninfo, autocommit=True) as connection:
+        connection.execute(f"LISTEN {COMMENT_EVENTS_CHANNEL}")
+
+        comment = comment_crud.create_comment(
+            comment=CommentCreate(content=content),
+            user_id=user.id,
+            blog_post_id=blog_post.id,
+        )
+        comment_crud.update_comment(
+            comment_db=comment, comment_in=CommentUpdate(content=content[:-1])
+        )
+
+        events = [
+            json.loads(notification.payload)
+            for notification in connection.notifies(timeout=5, stop_after=2)
+        ]
+        assert [event["type"] for event in events] == ["created", "updated"]
+        assert events[0]["comment"]["content"] == content
+        assert events[1]["comment"]["content"] == content[:-1]
+
+
+def test_06_publish_comment_too_long_for_notification(
+    db: Session, setup_user_and_blog_post, monkeypatch
+) -> None:
+    user, blog_post = setup_user_and_blog_post
+    monkeypatch.setattr("app.db.comment_events.MAX_PAYLOAD_BYTES", 200)
+    with psycopg.connect(test_db_conninfo, autocommit=True) as connection:
+        connection.execute(f"LISTEN {COMMENT_EVENTS_CHANNEL}")
+
+        comment = CommentCRUD(db).create_comment(
+            comment=CommentCreate(content="Comment 1" * 20),
+            user_id=user.id,
+            blog_post_id=blog_post.id,
+        )
+
+        events = [
+            json.loads(notification.payload)
+            for notification in connection.notifies(timeout=5, stop_after=1)
+        ]
+        # Only identified, the clients read the comment by its ID
+        assert events[0]["comment"] == {"id": comment.id, "reply_to": None}
@@ -0,0 +1,96 @@
+import asyncio
+import json
+import psycopg
+from sqlalchemy import make_url
+from sqlmodel import Session, delete
+
+from app.core.cache import cache
+from app.core.config import settings
+from app.db.crud import TagCRUD
+from app.db.notifications import (
+    CACHE_INVALIDATION_CHANNEL,
+    PROCESS_ID,
+    dispatch,
+    listen,
+)
+from app.models.models import Tag
+from app.schemas.tag import TagCreate
+
+
+test_db_url = make_url(str(settings.TEST_DATABASE_URL))
+test_db_conninfo = test_db_url.set(drivername="postgresql").render_as_string(
+    hide_password=False
+)
+
+
+def test_01_dispatch_cache_invalidation() -> None:
+    cache.set(("blog_posts", 1), 1)
+    cache.set(("tags", 1), 1)
+
+    # Invalid payloads and the notifications of this process are ignored
+    dispatch(CACHE_INVALIDATION_CHANNEL, "invalid")
+    dispatch(
+        CACHE_INVALIDATION_CHANNEL,
+        json.dumps({"origin": PROCESS_ID, "namespaces": ["blog_posts"]}),
+    )
+    assert cache.get(("blog_posts", 1)) == 1
+
+    dispatch(
+        CACHE_INVALIDATION_CHANNEL,
+        json.dumps({"origin": "other", "namespaces": ["blog_posts"]}),
+    )
+    assert cache.get(("blog_posts", 1)) is None
+    assert cache.get(("tags", 1)) == 1
+
+
+def test_02_publish_on_write(db: Session) -> None:
+    with psycopg.connect(test_db_conninfo, autocommit=True) as connection:
+        connection.execute(f"LISTEN {CACHE_INVALIDATION_CHANNEL}")
+
+        TagCRUD(db).create_tag(tag=TagCreate(name="tag1"))
+
+        notifications = list(connection.notifies(timeout=5, stop_after=1))
+        assert len(notifications) == 1
+        payload = json.loads(notifications[0].payload)
+        assert payload["origin"] == PROCESS_ID
+        assert sorted(payload["namespaces"]) == ["blog_posts", "tags"]
+
+        # Nothing is published for rolled back writes
+        TagCRUD(db)._invalidate_cache()
+        db.rollback()
+        assert list(connection.notifies(timeout=0.5, stop_after=1)) == []
+
+    db.exec(delete(Tag))
+    db.commit()
+
+
+def test_03_listen() -> None:
+    async def wait_for_eviction(key: tuple[str, int], notify: bool) -> bool:
+        for _ in range(50):
+            if cache.get(key) is None:
+                return True
+            if notify:
+                with psycopg.connect(test_db_conninfo, autocommit=True) as connection:
+                    connection.execute(
+                        "SELECT pg_notify(%s, %s)",
+                        (
+                            CACHE_INVALIDATION_CHANNEL,
+                            json.dumps({"origin": "other", "namespaces": ["tags"]}),
+                        ),
+                    )
+            await asyncio.sleep(0.1)
+        return False
+
+    async def run_listener() -> None:
+        listener = asyncio.create_task(listen(test_db_url))
+        try:
+            # The cache is cleared once listening
+            cache.set(("blog_posts", 1), 1)
+            assert await wait_for_eviction(("blog_posts", 1), notify=False)
+
+            cache.set(("tags", 1), 1)
+            assert await wait_for_eviction(("tags", 1), notify=True)
+        finally:
+            listener.cancel()
+
+    asyncio.run(run_listener())
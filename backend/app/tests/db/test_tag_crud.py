@@ -1,3 +1,4 @@
+from fastapi import HTTPException
 import pytest
 from sqlmodel import Session, select, func, delete
 
@@ -5,6 +6,7 @@ from app.db.crud import TagCRUD, BlogPostCRUD
 from app.models.models import Tag, BlogPost, BlogPostTagLink
 from app.schemas.blog_post import BlogPostCreate
 from app.schemas.tag import TagCreate, TagUpdate
+from app.tests.utils.query_counter import count_queries
 
 
 @pytest.fixture(scope="function", autouse=True)
@@ -50,12 +52,16 @@ def test_02_read_tags(db: Session) -> None:
     assert len(tags) == 1
 
 
-def test_03_read_tag_with_blog_posts(db: Session) -> None:
+def test_03_read_blog_posts_of_tag(db: Session) -> None:
     tag_crud = TagCRUD(db)
     tag_1 = tag_crud.create_tag(TagCreate(name="tag1"))
+    blog_post_crud = BlogPostCRUD(db)
 
-    tag = tag_crud.read_tag_with_blog_posts(tag_id=tag_1.id)
-    assert len(tag.blog_posts) == 0
+    count, blog_posts = blog_post_crud.read_blog_posts(
+        skip=0, limit=10, tag_id=tag_1.id
+    )
+    assert count == 0
+    assert len(blog_posts) == 0
 
     BlogPostCRUD(db).create_blog_post(
         blog_post=BlogPostCreate(
@@ -75,8 +81,11 @@ def test_03_read_tag_with_blog_posts(db: Session) -> None:
             tags=[],
         )
     )
-    tag = tag_crud.read_tag_with_blog_posts(tag_id=tag_1.id)
-    assert len(tag.blog_posts) == 1
+    count, blog_posts = blog_post_crud.read_blog_posts(
+        skip=0, limit=10, tag_id=tag_1.id
+    )
+    assert count == 1
+    assert [blog_post.title for blog_post in blog_posts] == ["Blog Post 1"]
 
 
 def test_04_get_tag_by_name(db: Session) -> None:
@@ -117,7 +126,8 @@ def test_06_delete_tag(db: Session) -> None:
 def test_07_delete_orphaned_tags(db: Session) -> None:
     tag_crud = TagCRUD(db)
     tag1 = tag_crud.create_tag(TagCreate(name="tag1"))
-    _ = tag_crud.create_tag(TagCreate(name="tag2"))
+    tag2 = tag_crud.create_tag(TagCreate(name="tag2"))
+    tag3 = tag_crud.create_tag(TagCreate(name="tag3"))
     BlogPostCRUD(db).create_blog_post(
         blog_post=BlogPostCreate(
             title="Blog Post 1",
@@ -129,14 +139,144 @@ def test_07_delete_orphaned_tags(db: Session) -> None:
     )
 
     count = db.exec(select(func.count()).select_from(Tag)).one()
-    assert count == 2
+    assert count == 3
 
-    deleted_count = tag_crud.delete_orphaned_tags()
-    assert deleted_count == 1  # tag2 should be deleted
+    deleted_count = tag_crud.delete_orphaned_tags([tag1.id, tag2.id])
+    assert deleted_count == 1  # tag2 should be deleted, tag3 was not given
 
     count = db.exec(select(func.count()).select_from(Tag)).one()
-    assert count == 1
+    assert count == 2
 
-    remaining_tags = db.exec(select(Tag)).all()
+    remaining_tags = db.exec(select(Tag).order_by(Tag.id)).all()
     remaining_tag_ids = [tag.id for tag in remaining_tags]
-    assert remaining_tag_ids == [tag1.id]
+    assert remaining_tag_ids == [tag1.id, tag3.id]
+    assert tag_crud.delete_orphaned_tags([]) == 0
+
+
+def test_08_tag_changes_update_blog_posts(db: Session) -> None:
+    tag_crud = TagCRUD(db)
+    blog_post_crud = BlogPostCRUD(db)
+    tag = tag_crud.create_tag(TagCreate(name="tag1"))
+    blog_post = blog_post_crud.create_blog_post(
+        blog_post=BlogPostCreate(
+            title="Blog Post 1",
+            url="blog-post-1",
+            content="Content of Blog Post 1",
+            tags=[tag.id],
+        )
+    )
+    count, updated_at = tag_crud.read_tags_version()
+    assert count == 1
+    assert updated_at == tag.updated_at
+    blog_post_updated_at = blog_post_crud.read_blog_post_version("blog-post-1")
+    assert blog_post_updated_at == blog_post.updated_at
+
+    tag = tag_crud.update_tag(tag_db=tag, tag_in=TagUpdate(name="tag1_updated"))
+    assert tag_crud.read_tags_version() == (1, tag.updated_at)
+    assert tag.updated_at > updated_at
+    assert blog_post_crud.read_blog_post_version("blog-post-1") > blog_post_updated_at
+
+    blog_post_updated_at = blog_post_crud.read_blog_post_version("blog-post-1")
+    tag_crud.delete_tag(tag_db=tag)
+    assert blog_post_crud.read_blog_post_version("blog-post-1") > blog_post_updated_at
+    assert tag_crud.read_tags_version() == (0, None)
+
+
+def test_09_get_tags_by_ids(db: Session) -> None:
+    tag_crud = TagCRUD(db)
+    tag1 = tag_crud.create_tag(TagCreate(name="tag1"))
+    tag2 = tag_crud.create_tag(TagCreate(name="tag2"))
+
+    tags = tag_crud.get_tags_by_ids([tag2.id, tag1.id, tag2.id])
+    assert [tag.id for tag in tags] == [tag2.id, tag1.id]
+    assert tag_crud.get_tags_by_ids([]) == []
+
+    with pytest.raises(HTTPException) as ex:
+        tag_crud.get_tags_by_ids([tag1.id, 9999])
+    assert ex.value.status_code == 404
+    assert ex.value.detail == "Tag with ID 9999 not found"
+
+    with pytest.raises(HTTPException) as ex:
+        tag_crud.get_tags_by_ids([9998, tag1.id, 9999])
+    assert ex.value.status_code == 404
+    assert ex.value.detail == "Tags with IDs 9998, 9999 not found"
+
+
+def test_10_upsert_tags_by_names(db: Session) -> None:
+    tag_crud = TagCRUD(db)
+    tag1 = tag_crud.create_tag(TagCreate(name="Python"))
+
+    # Existing tags are matched case-insensitively, the new ones are created in bulk
+    with count_queries() as statements:
+        tags = tag_crud.upsert_tags_by_names(["python", "SQL", "FastAPI", "sql"])
+    tag_statements = [statement for statement, _ in statements if "tag." in statement]
+    assert len(tag_statements) == 2
+    assert tag_statements[1].startswith("INSERT INTO tag ")
+    assert [tag.name for tag in tags] == ["Python", "SQL", "FastAPI"]
+    assert tags[0].id == tag1.id
+    db.commit()
+    assert db.exec(select(func.count()).select_from(Tag)).one() == 3
+
+    # Only existing tags do not need an insert
+    with count_queries() as statements:
+        tags = tag_crud.upsert_tags_by_names(["fastapi", "SQL"])
+    assert len(statements) == 1
+    assert statements[0][0].startswith("SELECT tag.")
+    assert [tag.name for tag in tags] == ["FastAPI", "SQL"]
+    assert tag_crud.upsert_tags_by_names([]) == []
+
+
+def test_11_read_tags_with_counts(db: Session) -> None:
+    tag_crud = TagCRUD(db)
+    tag1 = tag_crud.create_tag(TagCreate(name="tag1"))
+    tag2 = tag_crud.create_tag(TagCreate(name="tag2"))
+    tag3 = tag_crud.create_tag(TagCreate(name="tag3"))
+    for i, tag_ids in enumerate([[tag2.id, tag3.id], [tag3.id]]):
+        BlogPostCRUD(db).create_blog_post(
+            blog_post=BlogPostCreate(
+                title=f"Blog Post {i}",
+                url=f"blog-post-{i}",
+                content=f"Content of Blog Post {i}",
+                tags=tag_ids,
+            )
+        )
+
+    with count_queries() as statements:
+        count, tags = tag_crud.read_tags_with_counts(skip=0, limit=10)
+    assert len(statements) == 1
+    assert count == 3
+    assert [(tag.name, blog_post_count) for tag, blog_post_count in tags] == [
+        ("tag1", 0),
+        ("tag2", 1),
+        ("tag3", 2),
+    ]
+
+    count, tags = tag_crud.read_tags_with_counts(skip=0, limit=2, order="popular")
+    assert count == 3
+    assert [(tag.id, blog_post_count) for tag, blog_post_count in tags] == [
+        (tag3.id, 2),
+        (tag2.id, 1),
+    ]
+    count, tags = tag_crud.read_tags_with_counts(
+        skip=2, limit=2, order="popular", include_count="none"
+    )
+    assert count is None
+    assert [(tag.id, blog_post_count) for tag, blog_post_count in tags] == [
+        (tag1.id, 0)
+    ]
+
+    # Cached until the blog posts change
+    with count_queries() as statements:
+        tag_crud.read_tags_with_counts(skip=0, limit=2, order="popular")
+    assert len(statements) == 0
+    BlogPostCRUD(db).create_blog_post(
+        blog_post=BlogPostCreate(
+            title="Blog Post 2",
+            url="blog-post-2",
+            content="Content of Blog Post 2",
+            tags=[tag1.id],
+        )
+    )
+    _, tags = tag_crud.read_tags_with_counts(skip=0, limit=10, order="popular")
+    assert [blog_post_count for _, blog_post_count in tags] == [2, 1, 1]
+    assert [tag.name for tag, _ in tags] == ["tag3", "tag1", "tag2"]
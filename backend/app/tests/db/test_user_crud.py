@@ -270,3 +270,43 @@ def test_09_delete_user(db: Session) -> None:
     user_crud.delete_user(user_db=user)
     count = db.exec(select(func.count()).select_from(User)).one()
     assert count == 0
+
+
+def test_10_read_users_fuzzy(db: Session) -> None:
+    user_crud = UserCRUD(db)
+    user_crud.create_user(
+        user=UserCreate(
+            name="jonathan smith", email="smith@email.com", password="password"
+        )
+    )
+    user_crud.create_user(
+        user=UserCreate(
+            name="jonathan", email="jonathan@email.com", password="password"
+        )
+    )
+    user_crud.create_user(
+        user=UserCreate(name="mary", email="mary@email.com", password="password")
+    )
+
+    # A substring search does not tolerate typos
+    count, users = user_crud.read_users(skip=0, limit=100, search_by_name="jonathon")
+    assert count == 0
+    assert len(users) == 0
+
+    count, users = user_crud.read_users(
+        skip=0, limit=100, search_by_name="jonathon", fuzzy=True
+    )
+    assert count == 2
+    assert [user.name for user in users] == ["jonathan", "jonathan smith"]
+
+    count, users = user_crud.read_users(
+        skip=0, limit=100, search_by_email="mary@emial", fuzzy=True
+    )
+    assert count == 1
+    assert users[0].name == "mary"
+
+    count, users = user_crud.read_users(
+        skip=0, limit=100, search_by_name="peter", fuzzy=True
+    )
+    assert count == 0
+    assert len(users) == 0
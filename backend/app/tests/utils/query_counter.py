@@ -0,0 +1,35 @@
+from collections.abc import Generator
+from contextlib import contextmanager
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlmodel import Session
+from typing import Any
+
+
+@contextmanager
+def count_queries() -> Generator[list[tuple[str, Any]]]:
+    """
+    Collect the SQL statements executed on any engine within the context, with their parameters.
+    """
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, *args) -> None:
+        statements.append((statement, parameters))
+
+    event.listen(Engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(Engine, "before_cursor_execute", before_cursor_execute)
+
+
+def explain(session: Session, statement: str, parameters: Any) -> str:
+    """
+    Get the query plan of a statement collected by `count_queries`, with sequential scans disabled.
+    Small test tables would be scanned sequentially otherwise, hiding whether the indexes can be used.
+    """
+    connection = session.connection()
+    connection.exec_driver_sql("SET LOCAL enable_seqscan = off")
+    plan = connection.exec_driver_sql(f"EXPLAIN {statement}", parameters).scalars()
+    session.rollback()
+    return "\n".join(plan)
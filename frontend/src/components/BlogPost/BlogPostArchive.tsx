@@ -0,0 +1,63 @@
+import type { ArchiveYear } from "../../types/blogpost.ts";
+
+interface BlogPostArchiveProps {
+  years: ArchiveYear[];
+  selectedYear: number | null;
+  selectedMonth: number | null;
+  onSelect: (year: number | null, month: number | null) => void;
+}
+
+const formatMonth = (year: number, month: number): string =>
+  new Date(Date.UTC(year, month - 1, 1)).toLocaleDateString("en-US", {
+    month: "short",
+    timeZone: "UTC"
+  });
+
+function BlogPostArchive({
+  years,
+  selectedYear,
+  selectedMonth,
+  onSelect
+}: BlogPostArchiveProps) {
+  if (years.length === 0) return null;
+
+  return (
+    <div
+      className="mb-6 flex flex-wrap gap-x-4 gap-y-2 justify-center text-sm"
+      data-testid="blogpost-archive"
+    >
+      {years.map((archiveYear) => (
+        <div
+          key={archiveYear.year}
+          className="flex flex-wrap items-center gap-1"
+        >
+          <span className="font-semibold text-gray-700">{archiveYear.year}</span>
+          {archiveYear.months.map((archiveMonth) => {
+            const isSelected =
+              selectedYear === archiveYear.year &&
+              selectedMonth === archiveMonth.month;
+            return (
+              <button
+                key={archiveMonth.month}
+                onClick={() =>
+                  isSelected
+                    ? onSelect(null, null)
+                    : onSelect(archiveYear.year, archiveMonth.month)
+                }
+                className={`px-2 py-0.5 rounded transition-colors ${
+                  isSelected
+                    ? "bg-blue-600 text-white"
+                    : "text-blue-700 hover:bg-blue-100"
+                }`}
+              >
+                {`${formatMonth(archiveYear.year, archiveMonth.month)} (${archiveMonth.count})`}
+              </button>
+            );
+          })}
+        </div>
+      ))}
+    </div>
+  );
+}
+
+export default BlogPostArchive;
@@ -13,7 +13,7 @@ interface BlogPostBoxProps {
   imagePath: string;
   publicationDate: string;
   tags: string[];
-  content: string;
+  excerpt: string;
   featured: boolean;
 }
 
@@ -24,7 +24,7 @@ function BlogPostBox({
   imagePath,
   publicationDate,
   tags,
-  content,
+  excerpt,
   featured
 }: BlogPostBoxProps) {
   const navigate = useNavigate();
@@ -98,13 +98,7 @@ function BlogPostBox({
           className="prose prose-blue max-w-none mt-4 mb-2 line-clamp-3"
           style={{ fontSize: "1rem", lineHeight: "1.5em" }}
         >
-          <MarkdownContentProps
-            content={
-              (content + "\n\n")
-                .split("\n\n")
-                .filter((s) => s.trim().length > 0 && !s.startsWith("#"))[0] // first non-empty paragraph that is not a title
-            }
-          />
+          <MarkdownContentProps content={excerpt} />
         </div>
         {tags
           .sort((a, b) => a.toLowerCase().localeCompare(b.toLowerCase()))
@@ -87,6 +87,7 @@ function BlogPostSearch({
           <option value="title">Title</option>
           <option value="tag">Tag</option>
           <option value="content">Content</option>
+          <option value="fulltext">Full text</option>
         </select>
       </div>
 
@@ -17,6 +17,9 @@ interface CommentProps {
   currentUsername?: string;
   isCurrentUserSuperUser?: boolean;
   replies: ReplyData[];
+  replyCount: number;
+  hasMoreReplies: boolean;
+  onLoadMoreReplies: (parentId: number) => void;
   onEdit: (id: number, newContent: string) => void;
   onDelete: (id: number) => void;
   onReply: (parentId: number, content: string) => void;
@@ -32,6 +35,9 @@ function Comment({
   currentUsername,
   isCurrentUserSuperUser = false,
   replies = [],
+  replyCount,
+  hasMoreReplies,
+  onLoadMoreReplies,
   onEdit,
   onDelete,
   onReply,
@@ -372,6 +378,16 @@ function Comment({
               )}
             </div>
           ))}
+
+          {/* Load more replies button */}
+          {hasMoreReplies && (
+            <button
+              onClick={() => onLoadMoreReplies(id)}
+              className="text-blue-600 hover:text-blue-800 text-sm font-medium transition-colors"
+            >
+              Show more replies ({replyCount - replies.length})
+            </button>
+          )}
         </div>
       )}
 
@@ -5,7 +5,7 @@ import Comment from "./Comment";
 import LoadingSpinner from "../Common/LoadingSpinner";
 import ErrorMessageWithDismissProps from "../Common/ErrorMessageWithDismiss";
 import { COMMENTS_PER_LOAD } from "../../types/blogpost";
-import type { CommentWithReplies } from "../../types";
+import type { Comment as CommentData, CommentWithReplies } from "../../types";
 
 interface CommentsSectionProps {
   blogPostUrl: string;
@@ -28,22 +28,108 @@ function CommentsSection({
     useState<string>("");
   const [loadingMoreComments, setLoadingMoreComments] =
     useState<boolean>(false);
-  const [currentCommentPage, setCurrentCommentPage] = useState<number>(1);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
   const [hasMoreComments, setHasMoreComments] = useState<boolean>(true);
   const loadMoreRef = useRef<HTMLDivElement>(null);
+  const commentsRef = useRef<CommentWithReplies[]>([]);
+  // Created and deleted comments already applied, by own actions or by the comments stream
+  const appliedChanges = useRef<Set<string>>(new Set());
+
+  useEffect(() => {
+    commentsRef.current = comments;
+  }, [comments]);
+
+  // Apply a change only once, whether it comes from an own action or from the comments stream
+  const markApplied = useCallback((change: string): boolean => {
+    if (appliedChanges.current.has(change)) return false;
+    appliedChanges.current.add(change);
+    return true;
+  }, []);
+
+  const applyCreatedComment = useCallback((created: CommentData) => {
+    if (!markApplied(`created:${created.id}`)) return;
+    setTotalCommentsCount((prevCount) => prevCount + 1);
+    if (created.reply_to === null) {
+      setComments((prevComments) => [
+        { ...created, replies: [], reply_count: 0, next_replies_cursor: null },
+        ...prevComments
+      ]);
+      return;
+    }
+    setComments((prevComments) =>
+      prevComments.map((comment) =>
+        comment.id === created.reply_to
+          ? {
+              ...comment,
+              // Replies after the loaded ones come with the next page of replies
+              replies: comment.next_replies_cursor
+                ? comment.replies
+                : [...comment.replies, created],
+              reply_count: comment.reply_count + 1
+            }
+          : comment
+      )
+    );
+  }, [markApplied]);
+
+  const applyDeletedComment = useCallback(
+    (id: number, replyTo: number | null) => {
+      if (!markApplied(`deleted:${id}`)) return;
+      if (replyTo === null) {
+        // The replies are deleted along with the comment
+        const numberOfReplies =
+          commentsRef.current.find((comment) => comment.id === id)
+            ?.reply_count || 0;
+        setTotalCommentsCount((prevCount) => prevCount - 1 - numberOfReplies);
+        setComments((prevComments) =>
+          prevComments.filter((comment) => comment.id !== id)
+        );
+        return;
+      }
+      setTotalCommentsCount((prevCount) => prevCount - 1);
+      setComments((prevComments) =>
+        prevComments.map((comment) =>
+          comment.id === replyTo
+            ? {
+                ...comment,
+                replies: comment.replies.filter((reply) => reply.id !== id),
+                reply_count: comment.reply_count - 1
+              }
+            : comment
+        )
+      );
+    },
+    [markApplied]
+  );
+
+  const applyUpdatedComment = useCallback((updated: CommentData) => {
+    setComments((prevComments) =>
+      prevComments.map((comment) =>
+        comment.id === updated.id
+          ? { ...comment, content: updated.content }
+          : {
+              ...comment,
+              replies: comment.replies.map((reply) =>
+                reply.id === updated.id
+                  ? { ...reply, content: updated.content }
+                  : reply
+              )
+            }
+      )
+    );
+  }, []);
 
   // Fetch comments on component mount
   useEffect(() => {
     const fetchComments = async () => {
       try {
         setLoading(true);
-        const response = await blogpostService.getCommentsForBlogPost(
-          blogPostUrl,
-          1
-        );
+        const response =
+          await blogpostService.getCommentsForBlogPost(blogPostUrl);
         setComments(response.data);
         setTotalCommentsCount(response.count);
-        setHasMoreComments(response.data.length === COMMENTS_PER_LOAD);
+        setNextCursor(response.next_cursor);
+        setHasMoreComments(response.next_cursor !== null);
       } catch (err) {
         setError("Failed to load comments");
         console.error("Error fetching comments:", err);
@@ -55,32 +141,67 @@ function CommentsSection({
     fetchComments();
   }, [blogPostUrl]);
 
+  // Apply the comment changes of other readers as they happen
+  useEffect(() => {
+    const stream = blogpostService.getCommentsStream(blogPostUrl);
+    // The comments come with the events, unless they were too long to be sent along
+    const readComment = async (event: MessageEvent) => {
+      const changed: CommentData = JSON.parse(event.data);
+      if (changed.content !== undefined) return changed;
+      try {
+        return await blogpostService.getComment(changed.id);
+      } catch (err) {
+        // The comment may have been deleted since, its deleted event follows
+        console.error("Error fetching comment:", err);
+        return null;
+      }
+    };
+    stream.addEventListener("created", async (event: MessageEvent) => {
+      const { id } = JSON.parse(event.data);
+      if (appliedChanges.current.has(`created:${id}`)) return;
+      const created = await readComment(event);
+      if (created) applyCreatedComment(created);
+    });
+    stream.addEventListener("updated", async (event: MessageEvent) => {
+      const updated = await readComment(event);
+      if (updated) applyUpdatedComment(updated);
+    });
+    stream.addEventListener("deleted", (event: MessageEvent) => {
+      const deleted: Pick<CommentData, "id" | "reply_to"> = JSON.parse(
+        event.data
+      );
+      applyDeletedComment(deleted.id, deleted.reply_to);
+    });
+
+    return () => stream.close();
+  }, [
+    blogPostUrl,
+    applyCreatedComment,
+    applyUpdatedComment,
+    applyDeletedComment
+  ]);
+
   // Load more comments
   const loadMoreComments = useCallback(async () => {
     if (!hasMoreComments || loadingMoreComments) return;
 
     try {
       setLoadingMoreComments(true);
-      const nextPage = currentCommentPage + 1;
       const response = await blogpostService.getCommentsForBlogPost(
         blogPostUrl,
-        nextPage
+        nextCursor
       );
 
-      if (response.data.length > 0) {
-        setComments((prevComments) => [...prevComments, ...response.data]);
-        setCurrentCommentPage(nextPage);
-        setHasMoreComments(response.data.length === COMMENTS_PER_LOAD);
-      } else {
-        setHasMoreComments(false);
-      }
+      setComments((prevComments) => [...prevComments, ...response.data]);
+      setNextCursor(response.next_cursor);
+      setHasMoreComments(response.next_cursor !== null);
     } catch (err) {
       setLoadingMoreCommentsError("Failed to load more comments");
       console.error("Error loading more comments:", err);
     } finally {
       setLoadingMoreComments(false);
     }
-  }, [blogPostUrl, currentCommentPage, hasMoreComments, loadingMoreComments]);
+  }, [blogPostUrl, nextCursor, hasMoreComments, loadingMoreComments]);
 
   // Intersection Observer for infinite scroll
   useEffect(() => {
@@ -126,19 +247,7 @@ function CommentsSection({
       });
 
       // Add new comment to local state
-      setComments((prevComments) => [
-        {
-          id: new_comment.id,
-          content: new_comment.content,
-          comment_date: new_comment.comment_date,
-          blog_post_id: new_comment.blog_post_id,
-          reply_to: new_comment.reply_to,
-          username: new_comment.username,
-          replies: []
-        },
-        ...prevComments
-      ]);
-      setTotalCommentsCount((prevCount) => prevCount + 1);
+      applyCreatedComment(new_comment);
       setNewComment("");
     } catch (err) {
       console.error("Error creating comment:", err);
@@ -159,13 +268,7 @@ function CommentsSection({
       );
 
       // Update local state
-      setComments(
-        comments.map((comment) =>
-          comment.id === id
-            ? { ...comment, content: updated_comment.content }
-            : comment
-        )
-      );
+      applyUpdatedComment(updated_comment);
     } catch (err) {
       console.error("Error updating comment:", err);
       setError("Failed to update comment");
@@ -177,12 +280,7 @@ function CommentsSection({
       await blogpostService.deleteComment(blogPostUrl, id);
 
       // Remove from local state
-      const numberOfReplies = comments.find((comment) => comment.id === id)
-        ?.replies.length;
-      setComments(comments.filter((comment) => comment.id !== id));
-      setTotalCommentsCount(
-        (prevCount) => prevCount - 1 - (numberOfReplies || 0)
-      );
+      applyDeletedComment(id, null);
     } catch (err) {
       console.error("Error deleting comment:", err);
       setError("Failed to delete comment");
@@ -197,14 +295,7 @@ function CommentsSection({
       });
 
       // Add new reply to local state
-      setComments(
-        comments.map((comment) =>
-          comment.id === parentId
-            ? { ...comment, replies: [...comment.replies, new_comment] }
-            : comment
-        )
-      );
-      setTotalCommentsCount((prevCount) => prevCount + 1);
+      applyCreatedComment(new_comment);
     } catch (err) {
       console.error("Error creating reply:", err);
       setError("Failed to post reply");
@@ -212,7 +303,7 @@ function CommentsSection({
   };
 
   const handleEditReply = async (
-    parentId: number,
+    _parentId: number,
     replyId: number,
     newContent: string
   ) => {
@@ -226,20 +317,7 @@ function CommentsSection({
       );
 
       // Update local state
-      setComments(
-        comments.map((comment) =>
-          comment.id === parentId
-            ? {
-                ...comment,
-                replies: comment.replies.map((reply) =>
-                  reply.id === replyId
-                    ? { ...reply, content: updated_comment.content }
-                    : reply
-                )
-              }
-            : comment
-        )
-      );
+      applyUpdatedComment(updated_comment);
     } catch (err) {
       console.error("Error updating reply:", err);
       setError("Failed to update reply");
@@ -251,23 +329,47 @@ function CommentsSection({
       await blogpostService.deleteComment(blogPostUrl, replyId);
 
       // Remove from local state
-      setComments(
-        comments.map((comment) =>
-          comment.id === parentId
-            ? {
-                ...comment,
-                replies: comment.replies.filter((reply) => reply.id !== replyId)
-              }
-            : comment
-        )
-      );
-      setTotalCommentsCount((prevCount) => prevCount - 1);
+      applyDeletedComment(replyId, parentId);
     } catch (err) {
       console.error("Error deleting reply:", err);
       setError("Failed to delete reply");
     }
   };
 
+  const handleLoadMoreReplies = async (parentId: number) => {
+    const parentComment = comments.find((comment) => comment.id === parentId);
+    if (!parentComment?.next_replies_cursor) return;
+
+    try {
+      const response = await blogpostService.getCommentReplies(
+        blogPostUrl,
+        parentId,
+        parentComment.next_replies_cursor
+      );
+
+      // Add the next replies to local state, skipping the ones posted since the page was loaded
+      setComments((prevComments) =>
+        prevComments.map((comment) => {
+          if (comment.id !== parentId) return comment;
+          const loadedReplyIds = new Set(
+            comment.replies.map((reply) => reply.id)
+          );
+          return {
+            ...comment,
+            replies: [
+              ...comment.replies,
+              ...response.data.filter((reply) => !loadedReplyIds.has(reply.id))
+            ],
+            next_replies_cursor: response.next_cursor
+          };
+        })
+      );
+    } catch (err) {
+      console.error("Error loading more replies:", err);
+      setError("Failed to load more replies");
+    }
+  };
+
   return (
     <div className="max-w-3xl mx-auto mt-12 px-4">
       {/* Comments header */}
@@ -378,6 +480,9 @@ function CommentsSection({
                   content: reply.content,
                   commentDate: reply.comment_date
                 }))}
+                replyCount={comment.reply_count}
+                hasMoreReplies={comment.next_replies_cursor !== null}
+                onLoadMoreReplies={handleLoadMoreReplies}
                 onEdit={handleEditComment}
                 onDelete={handleDeleteComment}
                 onReply={handleReply}
@@ -4,7 +4,6 @@ import { useAuth } from "../hooks/useAuth";
 import { BACKEND_URL, API_DOCS_URL } from "../services/api.ts";
 import { blogpostService } from "../services/blogpost.service";
 import { imageService } from "../services/image.service";
-import { tagService } from "../services/tag.service";
 import { userService } from "../services/user.service";
 import { formatDate } from "../utils/format.ts";
 import { USERS_PER_LOAD } from "../types";
@@ -100,30 +99,12 @@ function Admin() {
     try {
       setCreatingBlogPost(true);
 
-      // Get list of tags from the form
+      // Get list of tags from the form, the new ones are created with the blog post
       const tagNames = blogPostTags
         .split(",")
         .map((tag) => tag.trim())
         .filter((tag) => tag.length > 0);
 
-      // Get existing tags
-      const existingTags = await tagService.getTags();
-      const tagIds: number[] = [];
-
-      // Check if tags already exist, if not we create them
-      for (const tagName of tagNames) {
-        const existingTag = existingTags.data.find(
-          (tag) => tag.name.toLowerCase() === tagName.toLowerCase()
-        );
-
-        if (existingTag) {
-          tagIds.push(existingTag.id);
-        } else {
-          const newTag = await tagService.createTag({ name: tagName });
-          tagIds.push(newTag.id);
-        }
-      }
-
       // Create blog post
       const blogPostData = {
         title: blogPostTitle,
@@ -131,7 +112,8 @@ function Admin() {
         content: blogPostContent,
         image_path: blogPostImage.filename,
         featured: blogPostFeatured,
-        tags: tagIds
+        tags: [],
+        tag_names: tagNames
       };
 
       await blogpostService.createBlogPost(blogPostData);
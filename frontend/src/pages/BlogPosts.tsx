@@ -2,34 +2,62 @@ import { useState, useEffect } from "react";
 import { useSearchParams } from "react-router-dom";
 import { blogpostService } from "../services/blogpost.service.ts";
 import { formatDate } from "../utils/format.ts";
+import BlogPostArchive from "../components/BlogPost/BlogPostArchive.tsx";
 import BlogPostBox from "../components/BlogPost/BlogPostBox";
 import BlogPostSearch from "../components/BlogPost/BlogPostSearch.tsx";
 import Pagination from "../components/BlogPost/Pagination";
 import LoadingSpinner from "../components/Common/LoadingSpinner";
 import PageLoadingError from "../components/Common/PageLoadingError";
 import { BLOGPOSTS_PER_PAGE } from "../types/blogpost.ts";
-import type { BlogPost } from "../types/blogpost.ts";
+import type { ArchiveYear, BlogPostSummary } from "../types/blogpost.ts";
 
 function BlogPosts() {
   const [searchParams, setSearchParams] = useSearchParams();
-  const [blogPosts, setBlogPosts] = useState<BlogPost[]>([]);
+  const [blogPosts, setBlogPosts] = useState<BlogPostSummary[]>([]);
   const [totalCount, setTotalCount] = useState<number>(0);
   const [loading, setLoading] = useState<boolean>(true);
   const [error, setError] = useState<string>("");
+  const [archiveYears, setArchiveYears] = useState<ArchiveYear[]>([]);
 
   const currentPage = parseInt(searchParams.get("page") || "1");
   const searchBy = searchParams.get("search_by") || "";
   const searchValue = searchParams.get("search_value") || "";
+  const year = parseInt(searchParams.get("year") || "") || null;
+  const month = parseInt(searchParams.get("month") || "") || null;
+
+  useEffect(() => {
+    const fetchArchive = async () => {
+      try {
+        const response = await blogpostService.getArchive();
+        setArchiveYears(response.data);
+      } catch (err) {
+        console.error("Error fetching archive:", err);
+      }
+    };
+
+    fetchArchive();
+  }, []);
 
   useEffect(() => {
     const fetchBlogPosts = async () => {
       try {
         setLoading(true);
         setError("");
+        // The blog posts of the selected month of the archive
+        const publishedFrom =
+          year && month
+            ? new Date(Date.UTC(year, month - 1, 1)).toISOString()
+            : undefined;
+        const publishedTo =
+          year && month
+            ? new Date(Date.UTC(year, month, 1)).toISOString()
+            : undefined;
         const response = await blogpostService.getBlogPosts(
           currentPage,
           searchBy || undefined,
-          searchBy === "tag" ? `%${searchValue}%` : searchValue || undefined
+          searchBy === "tag" ? `%${searchValue}%` : searchValue || undefined,
+          publishedFrom,
+          publishedTo
         );
         setBlogPosts(response.data);
         setTotalCount(response.count);
@@ -43,12 +71,30 @@ function BlogPosts() {
     };
 
     fetchBlogPosts();
-  }, [currentPage, searchBy, searchValue]);
+  }, [currentPage, searchBy, searchValue, year, month]);
 
   const handlePageChange = (page: number) => {
     const newParams: Record<string, string> = { page: page.toString() };
     if (searchBy) newParams.search_by = searchBy;
     if (searchValue) newParams.search_value = searchValue;
+    if (year && month) {
+      newParams.year = year.toString();
+      newParams.month = month.toString();
+    }
+    setSearchParams(newParams);
+  };
+
+  const handleArchiveSelect = (
+    newYear: number | null,
+    newMonth: number | null
+  ) => {
+    const newParams: Record<string, string> = {};
+    if (searchBy) newParams.search_by = searchBy;
+    if (searchValue) newParams.search_value = searchValue;
+    if (newYear && newMonth) {
+      newParams.year = newYear.toString();
+      newParams.month = newMonth.toString();
+    }
     setSearchParams(newParams);
   };
 
@@ -81,6 +127,12 @@ function BlogPosts() {
         currentSearchBy={searchBy}
         currentSearchValue={searchValue}
       />
+      <BlogPostArchive
+        years={archiveYears}
+        selectedYear={year}
+        selectedMonth={month}
+        onSelect={handleArchiveSelect}
+      />
       <div
         className="grid md:grid-cols-2 lg:grid-cols-3 gap-6 mb-8"
         data-testid="blogpost-list"
@@ -94,7 +146,7 @@ function BlogPosts() {
             imagePath={post.image_path}
             publicationDate={formatDate(post.publication_date)}
             tags={post.tags.map((tag) => tag.name)}
-            content={post.content}
+            excerpt={post.excerpt}
             featured={post.featured}
           />
         ))}
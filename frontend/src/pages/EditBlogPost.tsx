@@ -4,7 +4,6 @@ import { useAuth } from "../hooks/useAuth";
 import { BACKEND_URL } from "../services/api.ts";
 import { blogpostService } from "../services/blogpost.service";
 import { imageService } from "../services/image.service";
-import { tagService } from "../services/tag.service";
 import type { BlogPost, Image } from "../types";
 import LoadingSpinner from "../components/Common/LoadingSpinner.tsx";
 import PageLoadingError from "../components/Common/PageLoadingError.tsx";
@@ -113,30 +112,12 @@ function EditBlogPost() {
     try {
       setIsUpdating(true);
 
-      // Get list of tags from the form
+      // Get list of tags from the form, the new ones are created with the blog post
       const tagNames = blogPostTags
         .split(",")
         .map((tag) => tag.trim())
         .filter((tag) => tag.length > 0);
 
-      // Get existing tags
-      const existingTags = await tagService.getTags();
-      const tagIds: number[] = [];
-
-      // Check if tags already exist, if not we create them
-      for (const tagName of tagNames) {
-        const existingTag = existingTags.data.find(
-          (tag) => tag.name.toLowerCase() === tagName.toLowerCase()
-        );
-
-        if (existingTag) {
-          tagIds.push(existingTag.id);
-        } else {
-          const newTag = await tagService.createTag({ name: tagName });
-          tagIds.push(newTag.id);
-        }
-      }
-
       // Update blog post
       const blogPostData = {
         title: blogPostTitle,
@@ -144,7 +125,8 @@ function EditBlogPost() {
         content: blogPostContent,
         image_path: blogPostImage.filename,
         featured: blogPostFeatured,
-        tags: tagIds,
+        tags: [],
+        tag_names: tagNames,
         publication_date: blogPostPublicationDate
       };
 
@@ -1,20 +1,30 @@
 import { useState, useEffect } from "react";
 import { useNavigate } from "react-router-dom";
 import { blogpostService } from "../services/blogpost.service";
-import { tagService } from "../services/tag.service";
 import { formatDate } from "../utils/format";
 import BlogPostBox from "../components/BlogPost/BlogPostBox";
 import LoadingSpinner from "../components/Common/LoadingSpinner";
 import PageLoadingError from "../components/Common/PageLoadingError";
-import type { BlogPost, Tag } from "../types";
+import type { BlogPostSummary, TagWithCount } from "../types";
 
 const VISIBLE_TAGS_LIMIT: number = 11; // All + first 10
 
+// Tag cloud font sizes, from the least to the most used tags
+const TAG_SIZE_CLASSES: string[] = ["text-xs", "text-sm", "text-base"];
+
+const getTagSizeClass = (blogPostCount: number, maxBlogPostCount: number) => {
+  if (maxBlogPostCount <= 0) return TAG_SIZE_CLASSES[0];
+  const index = Math.round(
+    (blogPostCount / maxBlogPostCount) * (TAG_SIZE_CLASSES.length - 1)
+  );
+  return TAG_SIZE_CLASSES[index];
+};
+
 function Home() {
-  const [tags, setTags] = useState<Tag[]>([]);
+  const [tags, setTags] = useState<TagWithCount[]>([]);
   const [selectedTag, setSelectedTag] = useState<string>("All");
-  const [recentPosts, setRecentPosts] = useState<BlogPost[]>([]);
-  const [featuredPosts, setFeaturedPosts] = useState<BlogPost[]>([]);
+  const [recentPosts, setRecentPosts] = useState<BlogPostSummary[]>([]);
+  const [featuredPosts, setFeaturedPosts] = useState<BlogPostSummary[]>([]);
   const [recentPostsCount, setRecentPostsCount] = useState<number>(0);
   const [isLoading, setIsLoading] = useState<boolean>(true);
   const [error, setError] = useState<string>("");
@@ -28,17 +38,12 @@ function Home() {
         setIsLoading(true);
         setError("");
 
-        const [tagsResponse, featuredResponse] = await Promise.all([
-          tagService.getTags(),
-          blogpostService.getFeaturedBlogPosts()
-        ]);
-        setTags(tagsResponse.data);
-        setFeaturedPosts(featuredResponse.data);
-
-        // initial recent posts for "All" tag
-        const recentResponse = await blogpostService.getRecentBlogPosts();
-        setRecentPosts(recentResponse.data);
-        setRecentPostsCount(recentResponse.count);
+        // The tags, the featured and the recent posts for "All" in one request
+        const homeResponse = await blogpostService.getHome();
+        setTags(homeResponse.tags);
+        setFeaturedPosts(homeResponse.featured);
+        setRecentPosts(homeResponse.recent);
+        setRecentPostsCount(homeResponse.recent_count);
         // eslint-disable-next-line @typescript-eslint/no-explicit-any
       } catch (err: any) {
         setError("Failed to load Home page");
@@ -51,25 +56,18 @@ function Home() {
     fetchInitialData();
   }, []);
 
-  useEffect(() => {
-    const fetchRecentPostsData = async (tagName: string) => {
-      try {
-        const recentResponse = await blogpostService.getRecentBlogPosts(
-          tagName === "All" ? undefined : tagName
-        );
-        setRecentPosts(recentResponse.data);
-        setRecentPostsCount(recentResponse.count);
-        // eslint-disable-next-line @typescript-eslint/no-explicit-any
-      } catch (err: any) {
-        console.error("Error fetching data:", err);
-      }
-    };
-
-    fetchRecentPostsData(selectedTag);
-  }, [selectedTag]);
-
-  const handleTagClick = (tagName: string) => {
+  const handleTagClick = async (tagName: string) => {
     setSelectedTag(tagName);
+    try {
+      const recentResponse = await blogpostService.getRecentBlogPosts(
+        tagName === "All" ? undefined : tagName
+      );
+      setRecentPosts(recentResponse.data);
+      setRecentPostsCount(recentResponse.count);
+      // eslint-disable-next-line @typescript-eslint/no-explicit-any
+    } catch (err: any) {
+      console.error("Error fetching data:", err);
+    }
   };
 
   const handleMorePostsByTag = () => {
@@ -103,9 +101,11 @@ function Home() {
           data-testid="tags-list"
         >
           {(() => {
+            // The tags come ordered by popularity, the most used one sets the scale
+            const maxBlogPostCount = tags.length ? tags[0].blog_post_count : 0;
             const allTags = [
-              { id: 0, name: "All" },
-              ...tags.sort((a, b) =>
+              { id: 0, name: "All", blog_post_count: maxBlogPostCount },
+              ...[...tags].sort((a, b) =>
                 a.name.toLowerCase().localeCompare(b.name.toLowerCase())
               )
             ];
@@ -133,7 +133,15 @@ function Home() {
                   <button
                     key={tag.id}
                     onClick={() => handleTagClick(tag.name)}
-                    className={`px-3 py-1 rounded uppercase text-xs font-medium transition-colors ${
+                    title={
+                      tag.id === 0
+                        ? undefined
+                        : `${tag.blog_post_count} post${tag.blog_post_count === 1 ? "" : "s"}`
+                    }
+                    className={`px-3 py-1 rounded uppercase font-medium transition-colors ${getTagSizeClass(
+                      tag.blog_post_count,
+                      maxBlogPostCount
+                    )} ${
                       selectedTag === tag.name
                         ? "bg-blue-600 text-white"
                         : "bg-blue-100 text-blue-700 hover:bg-blue-200"
@@ -183,7 +191,7 @@ function Home() {
               imagePath={post.image_path}
               publicationDate={formatDate(post.publication_date)}
               tags={post.tags.map((tag) => tag.name)}
-              content={post.content}
+              excerpt={post.excerpt}
               featured={post.featured}
             />
           ))}
@@ -222,7 +230,7 @@ function Home() {
               imagePath={post.image_path}
               publicationDate={formatDate(post.publication_date)}
               tags={post.tags.map((tag) => tag.name)}
-              content={post.content}
+              excerpt={post.excerpt}
               featured={post.featured}
             />
           ))}
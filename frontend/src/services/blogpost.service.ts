@@ -1,18 +1,22 @@
-import api from "./api";
+import api, { API_VERSION_STR, BACKEND_URL } from "./api";
 import {
   BLOGPOSTS_PER_PAGE,
   COMMENTS_PER_LOAD,
   FEATURED_BLOGPOSTS,
-  RECENT_BLOGPOSTS
+  RECENT_BLOGPOSTS,
+  REPLIES_PER_LOAD
 } from "../types/blogpost";
 import type {
+  BlogPostArchive,
   BlogPosts,
   BlogPost,
   CreateBlogPostRequest,
+  Home,
   UpdateBlogPostRequest,
   UpdateFeaturedRequest,
   Comments,
   Comment,
+  Replies,
   CreateCommentRequest,
   UpdateCommentRequest
 } from "../types";
@@ -21,7 +25,9 @@ export const blogpostService = {
   getBlogPosts: async (
     page: number,
     searchBy?: string,
-    searchValue?: string
+    searchValue?: string,
+    publishedFrom?: string,
+    publishedTo?: string
   ): Promise<BlogPosts> => {
     const limit: number = BLOGPOSTS_PER_PAGE;
     const skip: number = (page - 1) * limit;
@@ -31,11 +37,20 @@ export const blogpostService = {
       url += `&search_by=${encodeURIComponent(searchBy)}`;
       url += `&search_value=${encodeURIComponent(searchValue)}`;
     }
+    if (publishedFrom && publishedTo) {
+      url += `&published_from=${encodeURIComponent(publishedFrom)}`;
+      url += `&published_to=${encodeURIComponent(publishedTo)}`;
+    }
 
     const response = await api.get<BlogPosts>(url);
     return response.data;
   },
 
+  getArchive: async (): Promise<BlogPostArchive> => {
+    const response = await api.get<BlogPostArchive>("/blogposts/archive");
+    return response.data;
+  },
+
   getRecentBlogPosts: async (tag?: string): Promise<BlogPosts> => {
     let url = `/blogposts?limit=${RECENT_BLOGPOSTS}&skip=0`;
     if (tag) url += `&search_by=tag&search_value=${encodeURIComponent(tag)}`;
@@ -44,9 +59,9 @@ export const blogpostService = {
     return response.data;
   },
 
-  getFeaturedBlogPosts: async (): Promise<BlogPosts> => {
-    const url = `/blogposts?limit=${FEATURED_BLOGPOSTS}&skip=0&featured_only=true`;
-    const response = await api.get<BlogPosts>(url);
+  getHome: async (): Promise<Home> => {
+    const url = `/home?featured_limit=${FEATURED_BLOGPOSTS}&recent_limit=${RECENT_BLOGPOSTS}`;
+    const response = await api.get<Home>(url);
     return response.data;
   },
 
@@ -82,13 +97,48 @@ export const blogpostService = {
 
   getCommentsForBlogPost: async (
     url: string,
-    page: number
+    cursor: string | null = null
   ): Promise<Comments> => {
-    const limit: number = COMMENTS_PER_LOAD;
-    const skip: number = (page - 1) * limit;
+    const params = new URLSearchParams({
+      limit: COMMENTS_PER_LOAD.toString(),
+      replies_limit: REPLIES_PER_LOAD.toString()
+    });
+    if (cursor) {
+      params.append("cursor", cursor);
+    }
     const response = await api.get<Comments>(
-      `/blogposts/${url}/comments?limit=${limit}&skip=${skip}`
+      `/blogposts/${url}/comments?${params.toString()}`
+    );
+    return response.data;
+  },
+
+  getCommentReplies: async (
+    url: string,
+    commentId: number,
+    cursor: string | null
+  ): Promise<Replies> => {
+    const params = new URLSearchParams({
+      limit: REPLIES_PER_LOAD.toString(),
+      include_count: "none"
+    });
+    if (cursor) {
+      params.append("cursor", cursor);
+    }
+    const response = await api.get<Replies>(
+      `/blogposts/${url}/comments/${commentId}/replies?${params.toString()}`
+    );
+    return response.data;
+  },
+
+  // Server-Sent Events stream of the created, updated and deleted comments
+  getCommentsStream: (url: string): EventSource => {
+    return new EventSource(
+      `${BACKEND_URL}${API_VERSION_STR}/blogposts/${url}/comments/stream`
     );
+  },
+
+  getComment: async (commentId: number): Promise<Comment> => {
+    const response = await api.get<Comment>(`/comments/${commentId}`);
     return response.data;
   },
 
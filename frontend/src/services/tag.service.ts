@@ -1,5 +1,5 @@
 import api from "./api";
-import type { Tags, Tag, CreateTagRequest } from "../types";
+import type { Tags, TagsWithCounts, Tag, CreateTagRequest } from "../types";
 
 export const tagService = {
   getTags: async (): Promise<Tags> => {
@@ -9,6 +9,13 @@ export const tagService = {
     return response.data;
   },
 
+  getPopularTags: async (): Promise<TagsWithCounts> => {
+    const url = `/tags?with_counts=true&order=popular`;
+
+    const response = await api.get<TagsWithCounts>(url);
+    return response.data;
+  },
+
   createTag: async (data: CreateTagRequest): Promise<Tag> => {
     const response = await api.post<Tag>("/tags", data);
     return response.data;
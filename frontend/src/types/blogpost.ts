@@ -1,4 +1,4 @@
-import type { Tag } from "./tag";
+import type { Tag, TagWithCount } from "./tag";
 
 export const BLOGPOSTS_PER_PAGE = 6;
 export const MAX_BLOGPOST_PAGES = 5;
@@ -6,6 +6,7 @@ export const FEATURED_BLOGPOSTS = 3;
 export const RECENT_BLOGPOSTS = 3;
 export const BLOGPOSTS_IMAGE_PATH = "/uploads/images/blogposts";
 export const COMMENTS_PER_LOAD = 50;
+export const REPLIES_PER_LOAD = 3;
 
 export interface BlogPost {
   id: number;
@@ -15,12 +16,53 @@ export interface BlogPost {
   image_path: string;
   publication_date: string;
   featured: boolean;
+  comment_count: number;
+  last_comment_at: string | null;
   tags: Tag[];
 }
 
+export interface BlogPostSummary {
+  id: number;
+  title: string;
+  url: string;
+  image_path: string;
+  publication_date: string;
+  featured: boolean;
+  excerpt: string;
+  word_count: number;
+  reading_time: number;
+  comment_count: number;
+  last_comment_at: string | null;
+  tags: Tag[];
+  headline?: string | null;
+}
+
 export interface BlogPosts {
-  data: BlogPost[];
+  data: BlogPostSummary[];
   count: number;
+  next_cursor?: string | null;
+}
+
+export interface ArchiveMonth {
+  month: number;
+  count: number;
+}
+
+export interface ArchiveYear {
+  year: number;
+  count: number;
+  months: ArchiveMonth[];
+}
+
+export interface BlogPostArchive {
+  data: ArchiveYear[];
+}
+
+export interface Home {
+  featured: BlogPostSummary[];
+  recent: BlogPostSummary[];
+  recent_count: number;
+  tags: TagWithCount[];
 }
 
 export interface CreateBlogPostRequest {
@@ -30,6 +72,8 @@ export interface CreateBlogPostRequest {
   image_path: string;
   featured: boolean;
   tags: number[];
+  // Tags given by name, the ones that do not exist yet are created
+  tag_names: string[];
 }
 
 export interface UpdateBlogPostRequest extends CreateBlogPostRequest {
@@ -51,11 +95,20 @@ export interface Comment {
 
 export interface CommentWithReplies extends Comment {
   replies: Comment[];
+  reply_count: number;
+  next_replies_cursor: string | null;
 }
 
 export interface Comments {
   data: CommentWithReplies[];
   count: number;
+  next_cursor: string | null;
+}
+
+export interface Replies {
+  data: Comment[];
+  count: number | null;
+  next_cursor: string | null;
 }
 
 export interface CreateCommentRequest {
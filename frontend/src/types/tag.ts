@@ -8,6 +8,15 @@ export interface Tags {
   count: number;
 }
 
+export interface TagWithCount extends Tag {
+  blog_post_count: number;
+}
+
+export interface TagsWithCounts {
+  data: TagWithCount[];
+  count: number;
+}
+
 export interface CreateTagRequest {
   name: string;
 }